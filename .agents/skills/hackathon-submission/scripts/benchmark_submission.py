@@ -0,0 +1,735 @@
+#!/usr/bin/env python3
+"""Benchmark create_submission_pr.py render, validation and GitHub paths against JSON baselines."""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.parse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+SCRIPT_DIR = Path(__file__).resolve().parent
+SUBMISSION_SCRIPT = SCRIPT_DIR / "create_submission_pr.py"
+sys.path.insert(0, str(SCRIPT_DIR))
+
+import create_submission_pr as submission  # noqa: E402
+
+DEFAULT_SIZES = (1, 10, 100, 1000, 10000)
+DEFAULT_TOLERANCE = 0.25
+# Cumulative ``-X importtime`` of create_submission_pr before the lazy-import work was about 60 ms
+# on the reference machine; the render path must stay under it.
+DEFAULT_IMPORT_BUDGET_MS = 60.0
+FAKE_LOGIN = "bench-user"
+# Modules the render/validate path must not import; only GitHub and batch paths need them.
+# dataclasses (and the inspect module it pulls in) is not used at all.
+LAZY_MODULES = ("argparse", "csv", "dataclasses", "inspect", "secrets", "shutil", "subprocess", "tempfile")
+STARTUP_PROBE = """
+import json, sys
+import create_submission_pr as submission
+spec = submission.SubmissionSpec.from_mapping(json.loads(sys.argv[1]))
+submission.validate(spec)
+submission.render(spec)
+print(json.dumps(sorted(name for name in json.loads(sys.argv[2]) if name in sys.modules)))
+"""
+KOREAN_PARAGRAPH = (
+    "바이브 코딩 해카톤 제출 문서는 팀이 해결하려는 문제와 접근 방식을 설명합니다. "
+    "사용자 인터뷰에서 발견한 불편함을 정리하고, 자동화된 검증 흐름으로 결과를 확인했습니다. "
+)
+FAKE_GH_SOURCE = """#!{python}
+import json
+import os
+import sys
+import time
+
+args = sys.argv[1:]
+log_path = os.environ.get("FAKE_GH_LOG")
+if log_path:
+    with open(log_path, "a", encoding="utf-8") as log:
+        log.write(" ".join(args) + "\\n")
+if args[:1] == ["--version"]:
+    print("gh version 0.0.0 (benchmark stand-in)")
+elif args[:2] == ["auth", "status"]:
+    print("Logged in to github.com as {login}")
+elif args[:2] == ["auth", "token"]:
+    print("benchmark-token")
+elif args[:2] == ["api", "user"]:
+    print("{login}")
+elif args[:2] == ["api", "rate_limit"]:
+    bucket = {{"limit": 5000, "remaining": 5000, "reset": int(time.time()) + 3600}}
+    print(json.dumps({{"resources": {{"core": bucket, "graphql": bucket}}}}))
+elif args[:2] == ["repo", "view"] or args[:2] == ["repo", "fork"]:
+    print(args[2] if len(args) > 2 else "")
+elif args[:2] == ["pr", "list"]:
+    # FAKE_GH_OPEN_PRS names a file of "<branch>\\t<url>" lines reported as open PRs.
+    rows = []
+    open_prs_path = os.environ.get("FAKE_GH_OPEN_PRS")
+    if open_prs_path and os.path.exists(open_prs_path):
+        with open(open_prs_path, encoding="utf-8") as file:
+            rows = [line.rstrip("\\n").split("\\t") for line in file if line.strip()]
+    if "--head" in args:
+        head = args[args.index("--head") + 1].split(":", 1)[1]
+        print(next((url for branch, url in rows if branch == head), ""))
+    else:
+        print("\\n".join(branch + "\\t" + url for branch, url in rows))
+elif args[:2] == ["pr", "create"]:
+    print("https://github.com/{target}/pull/1")
+else:
+    sys.exit("unsupported gh invocation: " + " ".join(args))
+"""
+
+
+def synthetic_row(index: int, *, text_kb: int) -> Dict[str, object]:
+    repeats = max(1, (text_kb * 1024) // len(KOREAN_PARAGRAPH.encode("utf-8")))
+    long_text = KOREAN_PARAGRAPH * repeats
+    return {
+        "team_name": f"벤치마크 팀 {index}",
+        "project_name": f"바이브 프로젝트 {index}",
+        "repo_url": f"https://github.com/bench/project-{index}",
+        "demo_url_or_run_method": f"https://example.com/demo/{index}",
+        "problem_definition": long_text,
+        "one_liner": f"한 줄 소개 {index}",
+        "team_roles": "- 홍길동: FE\n- 김철수: BE\n- 이영희: 디자인",
+        "solution": long_text,
+        "tech_stack": "Python, Next.js, 타입스크립트",
+        "run_verify": "README 실행 방법 참고",
+        "demo_summary": long_text,
+        "submitted_at": "2026-01-01T00:00:00+09:00",
+        "team_order": index,
+    }
+
+
+def best_of(func: Callable[[], object], *, number: int, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, (time.perf_counter() - started) / number)
+    return best
+
+
+def bench_functions(*, text_kb: int) -> Dict[str, float]:
+    row = synthetic_row(0, text_kb=text_kb)
+    template = submission.load_template(SCRIPT_DIR.parent)
+    compiled = submission.compile_template(template)
+    replacements = {name: f"{name.lower()} {row['problem_definition']}" for name in compiled.placeholders}
+    rendered = submission.normalize_markdown_spacing(compiled.render(replacements))
+    title = str(row["project_name"])
+
+    return {
+        "slugify_us": best_of(lambda: submission.slugify(title), number=2000) * 1e6,
+        "render_template_us": best_of(lambda: submission.render_template(template, replacements), number=500)
+        * 1e6,
+        "validate_document_us": best_of(lambda: submission.validate_document(rendered), number=500) * 1e6,
+        "parse_frontmatter_us": best_of(lambda: submission.parse_frontmatter(rendered), number=2000) * 1e6,
+    }
+
+
+def bench_startup(*, text_kb: int, repeat: int = 7) -> Tuple[Dict[str, float], List[str]]:
+    # Bytecode caching must be on, as it is for a normal import of the module.
+    env = {name: value for name, value in os.environ.items() if name != "PYTHONDONTWRITEBYTECODE"}
+    command = [
+        sys.executable,
+        "-X",
+        "importtime",
+        "-c",
+        STARTUP_PROBE,
+        json.dumps(synthetic_row(0, text_kb=text_kb), ensure_ascii=False),
+        json.dumps(LAZY_MODULES),
+    ]
+    best_import_us = float("inf")
+    best_wall = float("inf")
+    eager_modules: List[str] = []
+    for attempt in range(repeat + 1):
+        started = time.perf_counter()
+        result = subprocess.run(command, cwd=str(SCRIPT_DIR), env=env, capture_output=True, text=True)
+        elapsed = time.perf_counter() - started
+        if result.returncode != 0:
+            raise RuntimeError(f"Start-up probe failed:\n{result.stderr}")
+        if attempt == 0:
+            continue  # first run writes __pycache__
+        for line in result.stderr.splitlines():
+            fields = [field.strip() for field in line.split("|")]
+            if len(fields) == 3 and fields[2] == "create_submission_pr":
+                best_import_us = min(best_import_us, float(fields[1]))
+        best_wall = min(best_wall, elapsed)
+        eager_modules = json.loads(result.stdout)
+    return {"startup_import_ms": best_import_us / 1000, "startup_render_s": best_wall}, eager_modules
+
+
+def run_script(args: Sequence[str], *, env: Optional[Dict[str, str]] = None, cwd: Optional[Path] = None) -> float:
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, str(SUBMISSION_SCRIPT), *args],
+        cwd=str(cwd) if cwd else None,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    elapsed = time.perf_counter() - started
+    if result.returncode != 0:
+        raise RuntimeError(f"Benchmark run failed: {' '.join(args)}\n{result.stdout}\n{result.stderr}")
+    return elapsed
+
+
+def bench_render_only(work_root: Path, *, sizes: Sequence[int], text_kb: int, jobs: Optional[int]) -> Dict[str, float]:
+    results: Dict[str, float] = {}
+    single_args: List[str] = []
+    for key, value in synthetic_row(0, text_kb=text_kb).items():
+        single_args.extend([f"--{key.replace('_', '-')}", str(value)])
+    results["render_only_single_s"] = run_script([*single_args, "--render-only-dir", str(work_root / "single")])
+
+    for size in sizes:
+        manifest = work_root / f"manifest-{size}.jsonl"
+        with manifest.open("w", encoding="utf-8") as file:
+            for index in range(size):
+                file.write(json.dumps(synthetic_row(index, text_kb=text_kb), ensure_ascii=False) + "\n")
+        manifest_args = ["--manifest", str(manifest), "--render-only-dir", str(work_root / f"out-{size}")]
+        if jobs:
+            manifest_args.extend(["--jobs", str(jobs)])
+        results[f"render_manifest_{size}_s"] = run_script(manifest_args)
+    return results
+
+
+def git(*args: str, cwd: Optional[Path] = None, env: Optional[Dict[str, str]] = None) -> None:
+    subprocess.run(["git", *args], cwd=str(cwd) if cwd else None, env=env, check=True, capture_output=True)
+
+
+def prepare_fake_github(work_root: Path) -> Dict[str, str]:
+    bin_dir = work_root / "bin"
+    bin_dir.mkdir(parents=True)
+    fake_gh = bin_dir / "gh"
+    fake_gh.write_text(
+        FAKE_GH_SOURCE.format(python=sys.executable, login=FAKE_LOGIN, target=submission.DEFAULT_TARGET_REPO),
+        encoding="utf-8",
+    )
+    fake_gh.chmod(0o755)
+
+    upstream = work_root / "upstream.git"
+    fork = work_root / "fork.git"
+    git_config = work_root / "gitconfig"
+    target_name = submission.DEFAULT_TARGET_REPO.split("/")[-1]
+    git_config.write_text(
+        "\n".join(
+            [
+                "[user]",
+                "\tname = Benchmark",
+                "\temail = benchmark@example.com",
+                f'[url "file://{upstream}"]',
+                f"\tinsteadOf = https://github.com/{submission.DEFAULT_TARGET_REPO}.git",
+                f'[url "file://{fork}"]',
+                f"\tinsteadOf = https://github.com/{FAKE_LOGIN}/{target_name}.git",
+                '[protocol "file"]',
+                "\tallow = always",
+                "[uploadpack]",
+                "\tallowFilter = true",
+                "\tallowAnySHA1InWant = true",
+                "",
+            ]
+        ),
+        encoding="utf-8",
+    )
+    env = {
+        **os.environ,
+        "PATH": f"{bin_dir}{os.pathsep}{os.environ.get('PATH', '')}",
+        "GIT_CONFIG_GLOBAL": str(git_config),
+        "GIT_CONFIG_NOSYSTEM": "1",
+        "XDG_CACHE_HOME": str(work_root / "cache"),
+    }
+
+    seed = work_root / "seed"
+    docs = seed / "contents" / "docs"
+    (docs / "vibe-coding").mkdir(parents=True)
+    (seed / "contents" / "team").mkdir(parents=True)
+    submission.write_json(docs / "meta.json", {"title": "해카톤 문서", "pages": ["index", "vibe-coding"]})
+    submission.write_json(docs / "vibe-coding" / "meta.json", {"title": "바이브 코딩 결과", "pages": []})
+    media = seed / "public" / "media"
+    media.mkdir(parents=True)
+    for index in range(20):
+        (media / f"demo-{index}.bin").write_bytes(os.urandom(256 * 1024))
+    git("init", "-q", "-b", submission.DEFAULT_BASE_BRANCH, str(seed), env=env)
+    git("add", "-A", cwd=seed, env=env)
+    git("commit", "-q", "-m", "seed", cwd=seed, env=env)
+    git("clone", "-q", "--bare", str(seed), str(upstream), env=env)
+    git("clone", "-q", "--bare", str(seed), str(fork), env=env)
+    return env
+
+
+class FakeGitHubApiHandler(BaseHTTPRequestHandler):
+    """Stub of the GitHub endpoints used by ``--http-api`` and ``--api-submit``.
+
+    Covers the GraphQL session, contents, pulls and the Git Data API, reading
+    the upstream and fork bare repositories. Posted trees, commits, refs and
+    pulls are kept on the server so callers can check them; ``open_pulls``
+    lists the PRs reported as open.
+    """
+
+    protocol_version = "HTTP/1.1"
+    server: Any
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002 - BaseHTTPRequestHandler API
+        return
+
+    def send_json(self, status: int, payload: object, *, etag: Optional[str] = None) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        if etag is not None and self.headers.get("If-None-Match") == etag:
+            status, body = 304, b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if etag is not None:
+            self.send_header("ETag", etag)
+        self.send_header("X-RateLimit-Remaining", "4999")
+        self.send_header("X-RateLimit-Reset", str(int(time.time()) + 3600))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def handle_request(self, method: str) -> None:
+        length = int(self.headers.get("Content-Length") or 0)
+        payload = json.loads(self.rfile.read(length) or b"null")
+        with self.server.lock:
+            self.server.requests.append(f"{method} {self.path}")
+        target = submission.DEFAULT_TARGET_REPO
+        fork = f"{FAKE_LOGIN}/{target.split('/')[-1]}"
+        repos = {target: self.server.upstream, fork: self.server.fork}
+        repo, _, rest = self.path[len("/repos/") :].partition("/")
+        repo_name, _, rest = rest.partition("/")
+        repo = f"{repo}/{repo_name}"
+        git_dir = repos.get(repo)
+        if method == "POST" and self.path == "/graphql":
+            variables = payload["variables"]
+            head = self.rev_parse(self.server.upstream, variables["branch"])
+            self.send_json(
+                200,
+                {
+                    "data": {
+                        "viewer": {
+                            "login": FAKE_LOGIN,
+                            "repository": {"nameWithOwner": f"{FAKE_LOGIN}/{variables['name']}"},
+                        },
+                        "repository": {
+                            "nameWithOwner": target,
+                            "defaultBranchRef": {"name": submission.DEFAULT_BASE_BRANCH},
+                            "ref": {"target": {"oid": head}},
+                        },
+                    }
+                },
+            )
+        elif git_dir is None:
+            self.send_json(404, {"message": "Not Found"})
+        elif method == "GET" and rest.startswith("commits/"):
+            head = self.rev_parse(git_dir, f"refs/heads/{urllib.parse.unquote(rest[len('commits/') :])}")
+            self.send_json(200, {"sha": head}, etag=f'"{head}"')
+        elif method == "GET" and rest.startswith("git/ref/heads/"):
+            head = self.rev_parse(git_dir, f"refs/{rest[len('git/ref/') :]}")
+            if not head:
+                self.send_json(404, {"message": "Not Found"})
+                return
+            self.send_json(200, {"ref": f"refs/{rest[len('git/ref/') :]}", "object": {"sha": head}})
+        elif method == "GET" and rest.startswith("contents/"):
+            path, _, query = rest[len("contents/") :].partition("?ref=")
+            listing = subprocess.run(
+                ["git", "ls-tree", query or "HEAD", "--", urllib.parse.unquote(path)],
+                cwd=git_dir,
+                capture_output=True,
+                check=True,
+            ).stdout.split()
+            if not listing:
+                self.send_json(404, {"message": "Not Found"})
+                return
+            content = subprocess.run(
+                ["git", "cat-file", "blob", listing[2].decode()], cwd=git_dir, capture_output=True, check=True
+            ).stdout
+            self.send_json(
+                200, {"type": "file", "sha": listing[2].decode(), "content": base64.b64encode(content).decode()}
+            )
+        elif method == "GET" and rest.startswith("git/commits/"):
+            sha = rest.rsplit("/", 1)[-1]
+            self.send_json(200, {"sha": sha, "tree": {"sha": self.rev_parse(git_dir, f"{sha}^{{tree}}")}})
+        elif method == "POST" and repo == fork and rest == "git/blobs":
+            content = base64.b64decode(payload["content"])
+            self.send_json(201, {"sha": submission.git_blob_sha(content)})
+        elif method == "POST" and repo == fork and rest in ("git/trees", "git/commits"):
+            kind = rest.rsplit("/", 1)[-1]
+            sha = hashlib.sha1(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+            with self.server.lock:
+                self.server.git_objects[kind].append(payload)
+            self.send_json(201, {"sha": sha})
+        elif method == "POST" and repo == fork and rest == "git/refs":
+            with self.server.lock:
+                self.server.git_objects["refs"].append(payload)
+            self.send_json(201, {"ref": payload["ref"], "object": {"sha": payload["sha"]}})
+        elif method == "PATCH" and repo == fork and rest.startswith("git/refs/heads/"):
+            ref = rest[len("git/") :]
+            with self.server.lock:
+                self.server.git_objects["refs"].append({"ref": ref, **payload})
+            self.send_json(200, {"ref": ref, "object": {"sha": payload["sha"]}})
+        elif method == "GET" and repo == target and rest.startswith("pulls"):
+            query = urllib.parse.parse_qs(urllib.parse.urlsplit(self.path).query)
+            heads = query.get("head")
+            pulls = [
+                {"head": {"ref": branch, "user": {"login": FAKE_LOGIN}}, "html_url": url}
+                for branch, url in self.server.open_pulls
+                if not heads or heads[0] == f"{FAKE_LOGIN}:{branch}"
+            ]
+            self.send_json(200, pulls)
+        elif method == "POST" and repo == target and rest == "pulls":
+            with self.server.lock:
+                self.server.created_pulls.append(payload)
+            self.send_json(201, {"html_url": f"https://github.com/{target}/pull/1"})
+        else:
+            self.send_json(404, {"message": "Not Found"})
+
+    def rev_parse(self, git_dir: Path, ref: str) -> str:
+        return subprocess.run(
+            ["git", "rev-parse", "--verify", "--quiet", ref], cwd=git_dir, capture_output=True, text=True
+        ).stdout.strip()
+
+    def do_GET(self) -> None:
+        self.handle_request("GET")
+
+    def do_POST(self) -> None:
+        self.handle_request("POST")
+
+    def do_PATCH(self) -> None:
+        self.handle_request("PATCH")
+
+
+def start_fake_github_api(upstream: Path, fork: Optional[Path] = None) -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeGitHubApiHandler)
+    server.upstream = upstream  # type: ignore[attr-defined]
+    server.fork = fork or upstream.with_name("fork.git")  # type: ignore[attr-defined]
+    server.requests = []  # type: ignore[attr-defined]
+    server.git_objects = {"trees": [], "commits": [], "refs": []}  # type: ignore[attr-defined]
+    # (branch, html_url) pairs answered as open PRs from the fake login's fork.
+    server.open_pulls = []  # type: ignore[attr-defined]
+    server.created_pulls = []  # type: ignore[attr-defined]
+    server.lock = threading.Lock()  # type: ignore[attr-defined]
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+class FakeMediaHandler(BaseHTTPRequestHandler):
+    """Media host for ``--fetch-media``: ETag/``If-None-Match``, ``Range``/``If-Range`` and ``Repr-Digest``.
+
+    The first transfer of each ``/demo-*`` file is cut off halfway so every cold
+    run exercises a resumed download.
+    """
+
+    protocol_version = "HTTP/1.1"
+    server: Any
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002 - BaseHTTPRequestHandler API
+        return
+
+    def do_GET(self) -> None:
+        path = self.path.split("?", 1)[0]
+        with self.server.lock:
+            self.server.requests.append((path, self.headers.get("Range"), self.headers.get("If-None-Match")))
+            truncate = path.startswith("/demo-") and path not in self.server.truncated
+            self.server.truncated.add(path)
+        if path == "/team.png":
+            content_type, body = "image/png", self.server.image
+        elif path.startswith("/demo-"):
+            content_type, body = "video/mp4", self.server.video
+        else:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        etag = f'"{hashlib.sha256(body).hexdigest()[:16]}"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+        start = 0
+        requested = self.headers.get("Range", "")
+        if requested.startswith("bytes=") and self.headers.get("If-Range") in (None, etag):
+            start = int(requested[len("bytes=") :].split("-", 1)[0])
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{len(body) - 1}/{len(body)}")
+        else:
+            self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("ETag", etag)
+        self.send_header("Repr-Digest", f"sha-256=:{base64.b64encode(hashlib.sha256(body).digest()).decode()}:")
+        self.send_header("Content-Length", str(len(body) - start))
+        self.end_headers()
+        if truncate and start == 0:
+            self.wfile.write(body[: len(body) // 2])
+            self.close_connection = True
+            return
+        self.wfile.write(body[start:])
+
+
+def start_fake_media_server(*, video_bytes: int) -> ThreadingHTTPServer:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeMediaHandler)
+    server.daemon_threads = True
+    server.image = os.urandom(64 * 1024)  # type: ignore[attr-defined]
+    server.video = os.urandom(video_bytes)  # type: ignore[attr-defined]
+    server.requests = []  # type: ignore[attr-defined]
+    server.truncated = set()  # type: ignore[attr-defined]
+    server.lock = threading.Lock()  # type: ignore[attr-defined]
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def bench_media_fetch(work_root: Path, *, text_kb: int, rows: int = 8) -> Dict[str, float]:
+    """Render a manifest with --fetch-media against a local media host, cold (resumed) and warm (304)."""
+    server = start_fake_media_server(video_bytes=4 * 1024 * 1024)
+    try:
+        base_url = f"http://127.0.0.1:{server.server_address[1]}"
+        manifest = work_root / "media.jsonl"
+        manifest.parent.mkdir(parents=True, exist_ok=True)
+        with manifest.open("w", encoding="utf-8") as file:
+            for index in range(rows):
+                row = {
+                    **synthetic_row(index, text_kb=text_kb),
+                    "project_name": f"Media {index}",
+                    "team_image_url": f"{base_url}/team.png",
+                    "demo_url_or_run_method": f"{base_url}/demo-{index}.mp4",
+                }
+                file.write(json.dumps(row, ensure_ascii=False) + "\n")
+        output = work_root / "out"
+        common = ["--manifest", str(manifest), "--fetch-media", "--cache-dir", str(work_root / "cache")]
+        results = {"render_fetch_media_cold_s": run_script([*common, "--render-only-dir", str(output)])}
+        resumed = [request for request in server.requests if request[1]]
+        if len(resumed) != rows:
+            raise RuntimeError(f"--fetch-media resumed {len(resumed)} of {rows} interrupted downloads")
+        for index in range(rows):
+            demo = output / "contents/docs/vibe-coding/assets" / f"media-{index}" / "demo" / f"demo-{index}.mp4"
+            if demo.read_bytes() != server.video:  # type: ignore[attr-defined]
+                raise RuntimeError(f"--fetch-media staged a corrupt copy at {demo}")
+
+        server.requests.clear()  # type: ignore[attr-defined]
+        results["render_fetch_media_warm_s"] = run_script([*common, "--render-only-dir", str(output), "--update"])
+        unconditional = [request for request in server.requests if not request[2]]
+        if unconditional:
+            raise RuntimeError(f"--fetch-media ignored its download cache for {unconditional}")
+        return results
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def check_api_submission(
+    server: ThreadingHTTPServer, upstream: Path, spec: submission.SubmissionSpec, asset: Path
+) -> None:
+    """Check the tree, commit and ref that ``--api-submit`` posted to the stub."""
+    git_objects = server.git_objects  # type: ignore[attr-defined]
+    if [len(git_objects[kind]) for kind in ("trees", "commits", "refs")] != [1, 1, 1]:
+        raise RuntimeError(f"--api-submit posted unexpected Git objects: {git_objects}")
+    tree, commit, ref = git_objects["trees"][0], git_objects["commits"][0], git_objects["refs"][0]
+
+    def rev_parse(name: str) -> str:
+        return subprocess.run(
+            ["git", "rev-parse", name], cwd=upstream, capture_output=True, text=True, check=True
+        ).stdout.strip()
+
+    base_sha = rev_parse(f"refs/heads/{submission.DEFAULT_BASE_BRANCH}")
+    if tree["base_tree"] != rev_parse(f"{base_sha}^{{tree}}"):
+        raise RuntimeError(f"--api-submit tree is not based on the upstream tree: {tree['base_tree']}")
+    entries = {entry["path"]: entry for entry in tree["tree"]}
+    asset_path = f"contents/docs/vibe-coding/assets/{spec.project_slug}/demo/{asset.name}"
+    for path in (
+        submission.result_document_relpath(spec.project_slug),
+        submission.team_card_relpath(spec.team_slug, spec.project_slug),
+    ):
+        if not entries.get(path, {}).get("content"):
+            raise RuntimeError(f"--api-submit tree is missing {path}: {sorted(entries)}")
+    if entries.get(asset_path, {}).get("sha") != submission.git_blob_sha(asset.read_bytes()):
+        raise RuntimeError(f"--api-submit did not upload {asset_path} as a blob: {entries.get(asset_path)}")
+
+    tree_sha = hashlib.sha1(json.dumps(tree, sort_keys=True).encode("utf-8")).hexdigest()
+    if commit["tree"] != tree_sha or commit["parents"] != [base_sha]:
+        raise RuntimeError(f"--api-submit commit does not point at the posted tree and base: {commit}")
+    commit_sha = hashlib.sha1(json.dumps(commit, sort_keys=True).encode("utf-8")).hexdigest()
+    branch_prefix = "refs/heads/" + submission.submission_branch_prefix(spec.team_slug, spec.project_slug)
+    if not ref["ref"].startswith(branch_prefix) or ref["sha"] != commit_sha:
+        raise RuntimeError(f"--api-submit created an unexpected ref: {ref}")
+
+
+def bench_github_paths(work_root: Path, *, text_kb: int) -> Dict[str, float]:
+    env = prepare_fake_github(work_root)
+    base_args: List[str] = []
+    for key, value in synthetic_row(0, text_kb=text_kb).items():
+        base_args.extend([f"--{key.replace('_', '-')}", str(value)])
+
+    modes = {
+        "github_dry_run_s": ["--github-dry-run"],
+        "github_dry_run_sparse_s": ["--github-dry-run", "--sparse-checkout"],
+        "github_dry_run_no_clone_s": ["--github-dry-run", "--no-clone"],
+        "github_submit_s": [],
+        "github_submit_sparse_s": ["--sparse-checkout"],
+        "github_submit_plumbing_s": ["--plumbing-commit"],
+        "github_submit_git_cache_cold_s": ["--git-cache"],
+        "github_submit_git_cache_warm_s": ["--git-cache"],
+    }
+    results: Dict[str, float] = {}
+    for index, (name, mode_args) in enumerate(modes.items()):
+        project_args = ["--project-name", f"GitHub Bench {index}"]
+        results[name] = run_script([*base_args, *project_args, *mode_args], env=env, cwd=work_root)
+
+    server = start_fake_github_api(work_root / "upstream.git")
+    gh_log = work_root / "gh-http-api.log"
+    try:
+        http_env = {
+            **env,
+            "GH_TOKEN": "benchmark-token",
+            "GITHUB_API_URL": f"http://127.0.0.1:{server.server_address[1]}",
+            "FAKE_GH_LOG": str(gh_log),
+        }
+        results["github_dry_run_no_clone_http_api_s"] = run_script(
+            [*base_args, "--project-name", "GitHub Bench HTTP dry-run", "--github-dry-run", "--no-clone", "--http-api"],
+            env=http_env,
+            cwd=work_root,
+        )
+        for name in ("github_submit_http_api_s", "github_submit_http_api_metadata_cache_s"):
+            # The first run fills --metadata-cache; the second skips the lookups it holds.
+            results[name] = run_script(
+                [*base_args, "--project-name", name, "--http-api", "--git-cache", "--metadata-cache"],
+                env=http_env,
+                cwd=work_root,
+            )
+
+        # --api-submit builds the commit through the Git Data API; a binary asset exercises the blob upload.
+        screenshot = work_root / "api-submit-demo.png"
+        screenshot.write_bytes(b"\x89PNG\r\n\x1a\n" + bytes(range(256)) * 64)
+        api_project = "GitHub Bench API submit"
+        results["github_api_submit_s"] = run_script(
+            [*base_args, "--project-name", api_project, "--api-submit", "--asset", f"demo={screenshot}"],
+            env=http_env,
+            cwd=work_root,
+        )
+        check_api_submission(
+            server,
+            work_root / "upstream.git",
+            submission.SubmissionSpec.from_mapping({**synthetic_row(0, text_kb=text_kb), "project_name": api_project}),
+            screenshot,
+        )
+    finally:
+        server.shutdown()
+        server.server_close()
+    if gh_log.exists():
+        raise RuntimeError(f"--http-api still ran gh: {gh_log.read_text(encoding='utf-8').strip()}")
+
+    batch_size = 8
+    manifest = work_root / "batch.jsonl"
+    with manifest.open("w", encoding="utf-8") as file:
+        for index in range(batch_size):
+            row = {**synthetic_row(index, text_kb=text_kb), "project_name": f"GitHub Batch {index}"}
+            file.write(json.dumps(row, ensure_ascii=False) + "\n")
+    results[f"github_batch_submit_{batch_size}_s"] = run_script(
+        ["--manifest", str(manifest), "--batch-submit", "--git-cache", "--concurrency", "4"], env=env, cwd=work_root
+    )
+    return results
+
+
+def compare_with_baseline(results: Dict[str, float], baseline: Dict[str, float], tolerance: float) -> List[str]:
+    regressions = []
+    for name, value in results.items():
+        previous = baseline.get(name)
+        if not isinstance(previous, (int, float)) or previous <= 0:
+            continue
+        if value > previous * (1 + tolerance):
+            regressions.append(f"{name}: {value:.6g} vs baseline {previous:.6g} (+{(value / previous - 1):.0%})")
+    return regressions
+
+
+def parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(description="Benchmark create_submission_pr.py with synthetic submissions.")
+    p.add_argument(
+        "--sizes",
+        default=",".join(str(size) for size in DEFAULT_SIZES),
+        help="Comma-separated manifest sizes for --render-only-dir batch runs.",
+    )
+    p.add_argument("--text-kb", type=int, default=8, help="Size of each long Korean free-text field in KiB.")
+    p.add_argument("--jobs", type=int, default=None, help="Forwarded to --manifest runs.")
+    p.add_argument("--skip-github", action="store_true", help="Skip end-to-end runs with fake gh/local git.")
+    p.add_argument("--output", help="Write benchmark results as JSON to this path.")
+    p.add_argument("--baseline", help="Compare against this JSON baseline and fail on regressions.")
+    p.add_argument("--write-baseline", help="Store the results as the new JSON baseline at this path.")
+    p.add_argument(
+        "--tolerance",
+        type=float,
+        default=DEFAULT_TOLERANCE,
+        help=f"Allowed slowdown ratio before a metric counts as a regression (default: {DEFAULT_TOLERANCE}).",
+    )
+    p.add_argument(
+        "--import-budget-ms",
+        type=float,
+        default=DEFAULT_IMPORT_BUDGET_MS,
+        help=(
+            "Fail when importing create_submission_pr takes longer than this (python -X importtime; "
+            f"default: {DEFAULT_IMPORT_BUDGET_MS:g}, 0 disables)."
+        ),
+    )
+    p.add_argument("--keep-temp", action="store_true")
+    return p
+
+
+def main() -> int:
+    args = parser().parse_args()
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    work_root = Path(tempfile.mkdtemp(prefix="hackathon-submission-bench-"))
+    try:
+        results: Dict[str, float] = {}
+        startup, eager_modules = bench_startup(text_kb=args.text_kb)
+        results.update(startup)
+        results.update(bench_functions(text_kb=args.text_kb))
+        results.update(bench_render_only(work_root / "render", sizes=sizes, text_kb=args.text_kb, jobs=args.jobs))
+        results.update(bench_media_fetch(work_root / "media", text_kb=args.text_kb))
+        if not args.skip_github:
+            results.update(bench_github_paths(work_root / "github", text_kb=args.text_kb))
+        results = {name: round(value, 6) for name, value in results.items()}
+
+        for name, value in results.items():
+            print(f"[BENCH] {name}: {value:.6g}")
+        if args.output:
+            submission.write_json(Path(args.output), results)
+            print(f"[OK] Results written: {args.output}")
+        if args.write_baseline:
+            submission.write_json(Path(args.write_baseline), results)
+            print(f"[OK] Baseline written: {args.write_baseline}")
+        regressions: List[str] = []
+        if eager_modules:
+            regressions.append(f"render path imported {', '.join(eager_modules)}")
+        if args.import_budget_ms and results["startup_import_ms"] > args.import_budget_ms:
+            regressions.append(
+                f"startup_import_ms: {results['startup_import_ms']:.6g} over budget {args.import_budget_ms:.6g}"
+            )
+        if args.baseline:
+            regressions.extend(
+                compare_with_baseline(results, submission.load_json(Path(args.baseline)), args.tolerance)
+            )
+        for regression in regressions:
+            print(f"[REGRESSION] {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+        if args.baseline:
+            print(f"[OK] No regressions against {args.baseline} (tolerance {args.tolerance:.0%}).")
+        return 0
+    except Exception as error:
+        print(f"[ERROR] {error}", file=sys.stderr)
+        return 1
+    finally:
+        if args.keep_temp:
+            print(f"[INFO] Temporary directory kept: {work_root}")
+        else:
+            shutil.rmtree(work_root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,25 +3,46 @@
 
 from __future__ import annotations
 
-import argparse
 import datetime as dt
+import functools
 import hashlib
 import json
+import os
 import re
-import secrets
-import shutil
-import subprocess
 import sys
-import tempfile
+import threading
+import time
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Dict, Iterable, Optional, Sequence, Tuple
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, FrozenSet, Iterable, Iterator, List, NamedTuple, Optional, Sequence, Set, TextIO, Tuple, Union
+
+# Render/validate paths (library API, --render-only-dir, --serve, --validate-tree) import
+# only what they use: argparse, csv, secrets, shutil, subprocess and tempfile are loaded
+# inside the functions that need them.
+if TYPE_CHECKING:
+    import argparse
 
 DEFAULT_TARGET_REPO = "okky-lab/vibe-coding-hackathon"
 DEFAULT_TARGET_REPO_URL = "https://github.com/okky-lab/vibe-coding-hackathon"
 DEFAULT_BASE_BRANCH = "main"
+DEFAULT_GITHUB_API_URL = "https://api.github.com"
 DEFAULT_DOC_FILENAME = "vibecoding-result.mdx"
 TEAM_SUBMISSION_FILE_PREFIX = "submission"
+SPARSE_CHECKOUT_PATHS = ("contents/docs", "contents/team")
+# Overlapping fetches in one repository must not race on FETCH_HEAD or auto-gc.
+PARALLEL_FETCH_GIT = ("git", "-c", "fetch.writeFetchHEAD=false", "-c", "gc.auto=0", "-c", "maintenance.auto=false")
+DEFAULT_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "hackathon-submission"
 KST = dt.timezone(dt.timedelta(hours=9))
+# --asset files are streamed in chunks of this size; GitHub warns above 50 MB and rejects 100 MB.
+ASSET_CHUNK_BYTES = 1024 * 1024
+DEFAULT_MAX_ASSET_MB = 50
+DEFAULT_MAX_ASSETS_TOTAL_MB = 200
+MEDIA_CACHE_VERSION = 1
+DEFAULT_MEDIA_CONCURRENCY = 4
+MEDIA_DOWNLOAD_ATTEMPTS = 3
+# --fetch-media keeps responses with these content types; anything else (HTML pages, JSON) is a link, not media.
+MEDIA_CONTENT_TYPES = ("image/", "video/", "audio/", "application/pdf", "application/octet-stream")
+MEDIA_URL_FIELDS = (("team_image_url", "team"), ("demo_url_or_run_method", "demo"), ("project_url", "demo"))
 ALLOWED_FRONTMATTER_KEYS = {"title", "summary", "description", "full"}
 REQUIRED_FRONTMATTER_KEYS = {"title", "summary", "description"}
 REQUIRED_SECTION_HEADERS = [
@@ -37,39 +58,409 @@ ASSET_READMES = {
     "evidence": "# Evidence Assets\n\n실행/검증 결과 스크린샷 및 로그 파일을 저장합니다.\n",
     "team": "# Team Assets\n\n팀 소개 이미지, 프로필 이미지, 발표용 팀 자료를 저장합니다.\n",
 }
+RESULT_TEMPLATE_PLACEHOLDERS = frozenset(
+    {
+        "FRONTMATTER_TITLE",
+        "FRONTMATTER_SUMMARY",
+        "FRONTMATTER_DESCRIPTION",
+        "TEAM_NAME",
+        "PROJECT_NAME",
+        "REPO_URL",
+        "DEMO_URL_OR_RUN_METHOD",
+        "PROBLEM_DEFINITION",
+        "SOLUTION",
+        "ONE_LINER",
+        "TEAM_ROLES",
+        "DEMO_SUMMARY_SECTION",
+        "TECH_STACK_SECTION",
+        "RUN_VERIFY_SECTION",
+        "LICENSE_SOURCES_SECTION",
+        "PRESENTATION_SECTION",
+        "EXTRA_LINKS_SECTION",
+    }
+)
+TEAM_CARD_BODY_TEMPLATE = "\n".join(
+    [
+        "## 팀 소개",
+        "",
+        "__TEAM_BIO__",
+        "",
+        "## 제출 프로젝트",
+        "",
+        "### __PROJECT_NAME__",
+        "",
+        "- 한 줄 소개: __ONE_LINER__",
+        "- 해결하려는 문제: __PROBLEM_DEFINITION__",
+        "- 팀 구성:",
+        "__TEAM_ROLES__",
+        "",
+    ]
+)
+PLACEHOLDER_PATTERN = re.compile(r"__([A-Z0-9_]+)__")
+SECTION_HEADER_PATTERN = re.compile(r"^##\s+(.+?)\s*$", re.MULTILINE)
+SLUG_SEPARATOR_PATTERN = re.compile(r"[\s_]+", re.UNICODE)
+SLUG_INVALID_PATTERN = re.compile(r"[^\w-]+", re.UNICODE)
+SLUG_REPEATED_DASH_PATTERN = re.compile(r"-{2,}")
+SUBMISSION_BRANCH_SUFFIX_PATTERN = re.compile(r"\d{14}-[0-9a-f]{6}")
+HTTP_URL_PATTERN = re.compile(r"^https?://", re.IGNORECASE)
+BLANK_LINES_PATTERN = re.compile(r"\n{3,}")
+ASSET_SEPARATOR_PATTERN = re.compile(r"[;\n]")
+MEDIA_NAME_INVALID_PATTERN = re.compile(r"[^\w.-]+", re.UNICODE)
+MEDIA_FRAGMENT_CHECKSUM_PATTERN = re.compile(r"(?:^|&)sha256=([0-9a-fA-F]{64})(?:&|$)")
+MEDIA_DIGEST_HEADER_PATTERN = re.compile(r"sha-256=:?([A-Za-z0-9+/]+={0,2}):?", re.IGNORECASE)
+FRONTMATTER_PATTERN = re.compile(r"^---\n(.*?)\n---\n", re.DOTALL)
+INTEGER_PATTERN = re.compile(r"-?\d+")
+TEAM_CARD_REQUIRED_KEYS = ("name", "role", "bio")
+TEAM_CARD_URL_KEYS = ("repositoryUrl", "projectUrl", "demoUrl", "imageUrl")
 
 
 class CommandError(RuntimeError):
     """Raised when a shell command fails."""
 
 
+class ValidationError(ValueError):
+    """Raised when a rendered document fails one or more validation rules."""
+
+    def __init__(self, errors: Sequence[str]) -> None:
+        super().__init__("; ".join(errors))
+        self.errors = list(errors)
+
+
+class SubmissionSpec(NamedTuple):
+    """One submission's input fields, shared by the CLI, manifests and the library API.
+
+    A ``NamedTuple`` rather than a frozen dataclass: ``dataclasses`` imports
+    ``inspect``, which alone costs about a quarter of this module's start-up.
+    """
+
+    team_name: str
+    project_name: str
+    repo_url: str
+    demo_url_or_run_method: str
+    problem_definition: str
+    one_liner: str
+    team_roles: str
+    solution: str = ""
+    tech_stack: str = ""
+    run_verify: str = ""
+    demo_summary: str = ""
+    license_sources: str = ""
+    ai_used: str = "사용함"
+    ai_validation_notes: str = ""
+    presentation_url: str = ""
+    extra_links: str = ""
+    project_url: str = ""
+    team_role_label: str = "참가팀"
+    team_bio: str = ""
+    team_image_url: str = ""
+    submitted_at: str = ""
+    team_order: Optional[int] = None
+    assets: Tuple[str, ...] = ()
+
+    @classmethod
+    def from_mapping(cls, row: Dict[str, object]) -> SubmissionSpec:
+        normalized_row = {str(key).strip().replace("-", "_"): value for key, value in row.items()}
+        unknown = sorted(key for key in normalized_row if key not in SUBMISSION_FIELDS)
+        if unknown:
+            joined = ", ".join(unknown)
+            raise ValueError(f"Unknown submission field(s): {joined}")
+
+        values: Dict[str, Any] = {}
+        missing = []
+        for name in REQUIRED_SUBMISSION_FIELDS:
+            value = normalized_row.get(name)
+            if value is None or not str(value).strip():
+                missing.append(name)
+                continue
+            values[name] = str(value)
+        if missing:
+            joined = ", ".join(missing)
+            raise ValueError(f"Missing required submission field(s): {joined}")
+
+        for name in OPTIONAL_SUBMISSION_FIELD_DEFAULTS:
+            value = normalized_row.get(name)
+            if value is None or (isinstance(value, str) and not value.strip()):
+                continue
+            if name == "team_order":
+                values[name] = int(str(value).strip())
+            elif name == "assets":
+                values[name] = parse_asset_specs(value)
+            else:
+                values[name] = str(value)
+        return cls(**values)
+
+    @classmethod
+    def from_args(cls, args: argparse.Namespace) -> SubmissionSpec:
+        values = {name: getattr(args, name) for name in SUBMISSION_FIELDS}
+        values["assets"] = parse_asset_specs(values["assets"])
+        return cls(**values)
+
+    @property
+    def team_slug(self) -> str:
+        return slugify(self.team_name)
+
+    @property
+    def project_slug(self) -> str:
+        return slugify(self.project_name)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for name in SUBMISSION_FIELDS}
+
+
+REQUIRED_SUBMISSION_FIELDS = tuple(
+    name for name in SubmissionSpec._fields if name not in SubmissionSpec._field_defaults
+)
+OPTIONAL_SUBMISSION_FIELD_DEFAULTS: Dict[str, Any] = dict(SubmissionSpec._field_defaults)
+SUBMISSION_FIELDS = REQUIRED_SUBMISSION_FIELDS + tuple(OPTIONAL_SUBMISSION_FIELD_DEFAULTS)
+
+
+class RenderedSubmission(NamedTuple):
+    """Rendered result document and team card with their repository-relative paths."""
+
+    team_slug: str
+    project_slug: str
+    document_path: str
+    document: str
+    team_card_path: str
+    team_card: str
+
+
+class ArtifactChanges:
+    """Files actually rewritten and document fields that differ from what was on disk."""
+
+    __slots__ = ("paths", "fields")
+
+    def __init__(self) -> None:
+        self.paths: List[Path] = []
+        self.fields: List[str] = []
+
+    def record_write(self, path: Path, changed: bool) -> None:
+        if changed:
+            self.paths.append(path)
+
+
+class RunTimings:
+    """Aggregated phase durations and subprocess accounting for one invocation."""
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self.phases: Dict[str, Dict[str, float]] = {}
+        self.commands: Dict[str, Dict[str, float]] = {}
+        self.profiled_phases: FrozenSet[str] = frozenset()
+        self.profiler: Optional[Any] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _add(bucket: Dict[str, Dict[str, float]], name: str, seconds: float) -> None:
+        entry = bucket.setdefault(name, {"count": 0, "seconds": 0.0, "max_seconds": 0.0})
+        entry["count"] += 1
+        entry["seconds"] += seconds
+        entry["max_seconds"] = max(entry["max_seconds"], seconds)
+
+    @staticmethod
+    def _rounded(entry: Dict[str, float]) -> Dict[str, float]:
+        return {key: round(value, 6) for key, value in entry.items()}
+
+    def record_phase(self, name: str, seconds: float) -> None:
+        with self._lock:
+            self._add(self.phases, name, seconds)
+
+    def record_command(self, cmd: Sequence[str], seconds: float) -> None:
+        name = str(cmd[0])
+        parts = iter(cmd[1:])
+        for part in parts:
+            if part == "-c":
+                next(parts, None)
+            elif not part.startswith("-"):
+                name = f"{name} {part}"
+                break
+        with self._lock:
+            self._add(self.commands, name, seconds)
+
+    def enable_profiler(self, phases: Iterable[str]) -> None:
+        import cProfile
+
+        self.profiler = cProfile.Profile()
+        self.profiled_phases = frozenset(phases)
+
+    def summary(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                "wall_seconds": round(time.perf_counter() - self.started, 6),
+                "subprocess_count": int(sum(entry["count"] for entry in self.commands.values())),
+                "subprocess_seconds": round(sum(entry["seconds"] for entry in self.commands.values()), 6),
+                "phases": {name: self._rounded(entry) for name, entry in self.phases.items()},
+                "subprocesses": {name: self._rounded(entry) for name, entry in self.commands.items()},
+            }
+
+
+TIMINGS = RunTimings()
+PROFILED_RENDER_PHASES = ("create_submission_artifacts",)
+
+
+def timed_phase(name: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            profiler = TIMINGS.profiler if name in TIMINGS.profiled_phases else None
+            started = time.perf_counter()
+            if profiler is not None:
+                profiler.enable()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                if profiler is not None:
+                    profiler.disable()
+                TIMINGS.record_phase(name, time.perf_counter() - started)
+
+        return wrapper
+
+    return decorator
+
+
+_ACTIVE_PROCESS_GROUP = threading.local()
+
+
+class ProcessGroup:
+    """Subprocesses started by ``run`` on threads that joined the group, terminable from any thread.
+
+    Each command runs in its own session so stopping it also stops the
+    helpers it spawned (``git-remote-https``, ``ssh``, wrapper scripts).
+    """
+
+    def __init__(self) -> None:
+        self.cancelled = False
+        self._processes: Set[Any] = set()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def current() -> Optional[ProcessGroup]:
+        return getattr(_ACTIVE_PROCESS_GROUP, "group", None)
+
+    @contextmanager
+    def joined(self) -> Iterator[None]:
+        previous = ProcessGroup.current()
+        _ACTIVE_PROCESS_GROUP.group = self
+        try:
+            yield
+        finally:
+            _ACTIVE_PROCESS_GROUP.group = previous
+
+    @staticmethod
+    def stop(process: Any, *, kill: bool = False) -> None:
+        import signal
+
+        try:
+            if os.name == "posix":
+                os.killpg(process.pid, signal.SIGKILL if kill else signal.SIGTERM)
+            elif kill:
+                process.kill()
+            else:
+                process.terminate()
+        except ProcessLookupError:
+            pass
+
+    def add(self, process: Any) -> None:
+        with self._lock:
+            self._processes.add(process)
+            cancelled = self.cancelled
+        if cancelled:
+            ProcessGroup.stop(process)
+
+    def discard(self, process: Any) -> None:
+        with self._lock:
+            self._processes.discard(process)
+
+    def terminate(self) -> None:
+        with self._lock:
+            self.cancelled = True
+            processes = list(self._processes)
+        for process in processes:
+            ProcessGroup.stop(process)
+
+
 def run(
     cmd: Sequence[str],
     *,
     cwd: Optional[Path] = None,
     check: bool = True,
     capture_output: bool = True,
+    env: Optional[Dict[str, str]] = None,
+    input_text: Optional[str] = None,
+    strip: bool = True,
 ) -> str:
-    result = subprocess.run(
-        list(cmd),
-        cwd=str(cwd) if cwd else None,
-        text=True,
-        capture_output=capture_output,
-    )
-    stdout = result.stdout.strip() if result.stdout else ""
-    stderr = result.stderr.strip() if result.stderr else ""
-    if check and result.returncode != 0:
+    import subprocess
+
+    group = ProcessGroup.current()
+    pipe = subprocess.PIPE if capture_output else None
+    started = time.perf_counter()
+    try:
+        with subprocess.Popen(
+            list(cmd),
+            cwd=str(cwd) if cwd else None,
+            text=True,
+            stdin=subprocess.PIPE if input_text is not None else None,
+            stdout=pipe,
+            stderr=pipe,
+            env={**os.environ, **env} if env else None,
+            start_new_session=group is not None and os.name == "posix",
+        ) as process:
+            if group is not None:
+                group.add(process)
+            try:
+                stdout, stderr = process.communicate(input_text)
+            except BaseException:
+                if group is not None:
+                    ProcessGroup.stop(process, kill=True)
+                else:
+                    process.kill()
+                raise
+            finally:
+                if group is not None:
+                    group.discard(process)
+    finally:
+        TIMINGS.record_command(cmd, time.perf_counter() - started)
+    stdout = stdout or ""
+    if strip:
+        stdout = stdout.strip()
+    stderr = stderr.strip() if stderr else ""
+    if check and process.returncode != 0:
         pretty_cmd = " ".join(cmd)
-        raise CommandError(f"Command failed ({result.returncode}): {pretty_cmd}\n{stderr}")
+        raise CommandError(f"Command failed ({process.returncode}): {pretty_cmd}\n{stderr}")
     return stdout
 
 
+def run_concurrently(
+    commands: Sequence[Sequence[str]],
+    *,
+    cwd: Optional[Path] = None,
+    check: bool = True,
+) -> List[str]:
+    if len(commands) <= 1:
+        return [run(cmd, cwd=cwd, check=check) for cmd in commands]
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    group = ProcessGroup.current()
+
+    def run_in_group(cmd: Sequence[str]) -> str:
+        if group is None:
+            return run(cmd, cwd=cwd, check=check)
+        with group.joined():
+            return run(cmd, cwd=cwd, check=check)
+
+    with ThreadPoolExecutor(max_workers=len(commands)) as pool:
+        futures = [pool.submit(run_in_group, cmd) for cmd in commands]
+    # All commands have finished here; re-raise the first failure in command order.
+    return [future.result() for future in futures]
+
+
 def slugify(text: str) -> str:
     source = text.strip()
     value = source.lower()
-    value = re.sub(r"[\s_]+", "-", value, flags=re.UNICODE)
-    value = re.sub(r"[^\w-]+", "-", value, flags=re.UNICODE)
-    value = re.sub(r"-{2,}", "-", value).strip("-_")
+    value = SLUG_SEPARATOR_PATTERN.sub("-", value)
+    value = SLUG_INVALID_PATTERN.sub("-", value)
+    value = SLUG_REPEATED_DASH_PATTERN.sub("-", value).strip("-_")
     if not value:
         digest = hashlib.sha1(source.encode("utf-8")).hexdigest()[:8]
         value = f"item-{digest}"
@@ -100,7 +491,7 @@ def sanitize_frontmatter_value(value: str) -> str:
 
 
 def is_http_url(value: str) -> bool:
-    return bool(re.match(r"^https?://", value.strip(), flags=re.IGNORECASE))
+    return bool(HTTP_URL_PATTERN.match(value.strip()))
 
 
 def as_optional_url(value: str) -> Optional[str]:
@@ -117,53 +508,26 @@ def normalize_submitted_at(value: str) -> str:
     return dt.datetime.now(KST).replace(microsecond=0).isoformat()
 
 
-def create_team_submission_doc(
-    repo_root: Path,
-    *,
-    team_slug: str,
-    project_slug: str,
-    team_name: str,
-    project_name: str,
-    one_liner: str,
-    problem_definition: str,
-    team_roles: str,
-    repo_url: str,
-    demo_url_or_run_method: str,
-    project_url: str,
-    team_role_label: str,
-    team_bio: str,
-    team_image_url: str,
-    submitted_at: str,
-    team_order: Optional[int],
-    update_existing: bool,
-) -> Path:
-    team_root = repo_root / "contents" / "team"
-    team_file = team_root / f"{TEAM_SUBMISSION_FILE_PREFIX}-{team_slug}-{project_slug}.mdx"
-
-    if team_file.exists() and not update_existing:
-        raise FileExistsError(
-            f"Team submission card already exists at {team_file}. Re-run with --update to overwrite."
-        )
-
-    normalized_name = normalize_text(team_name)
-    normalized_project_name = normalize_text(project_name)
-    normalized_one_liner = normalize_text(one_liner)
-    normalized_problem = normalize_text(problem_definition)
-    normalized_roles = normalize_text(team_roles)
-    normalized_role_label = normalize_text(team_role_label, "참가팀")
-    normalized_bio = normalize_text(team_bio, normalized_one_liner)
+def render_team_card(spec: SubmissionSpec, *, submitted_at: Optional[str] = None) -> str:
+    normalized_name = normalize_text(spec.team_name)
+    normalized_project_name = normalize_text(spec.project_name)
+    normalized_one_liner = normalize_text(spec.one_liner)
+    normalized_problem = normalize_text(spec.problem_definition)
+    normalized_roles = normalize_text(spec.team_roles)
+    normalized_role_label = normalize_text(spec.team_role_label, "참가팀")
+    normalized_bio = normalize_text(spec.team_bio, normalized_one_liner)
 
-    repository_url = as_optional_url(repo_url)
+    repository_url = as_optional_url(spec.repo_url)
     if not repository_url:
         raise ValueError("--repo-url must be a valid http(s) URL.")
 
-    normalized_project_url = as_optional_url(project_url)
-    normalized_demo_url = as_optional_url(demo_url_or_run_method)
+    normalized_project_url = as_optional_url(spec.project_url)
+    normalized_demo_url = as_optional_url(spec.demo_url_or_run_method)
     if not normalized_project_url:
         normalized_project_url = normalized_demo_url
 
-    normalized_image_url = as_optional_url(team_image_url)
-    normalized_submitted_at = normalize_submitted_at(submitted_at)
+    normalized_image_url = as_optional_url(spec.team_image_url)
+    normalized_submitted_at = normalize_submitted_at(spec.submitted_at if submitted_at is None else submitted_at)
 
     frontmatter_lines = [
         "---",
@@ -182,31 +546,49 @@ def create_team_submission_doc(
         frontmatter_lines.append(f'demoUrl: "{sanitize_frontmatter_value(normalized_demo_url)}"')
     if normalized_image_url:
         frontmatter_lines.append(f'imageUrl: "{sanitize_frontmatter_value(normalized_image_url)}"')
-    if team_order is not None:
-        frontmatter_lines.append(f"order: {team_order}")
+    if spec.team_order is not None:
+        frontmatter_lines.append(f"order: {spec.team_order}")
 
     frontmatter_lines.extend(["---", ""])
 
-    body = "\n".join(
-        [
-            "## 팀 소개",
-            "",
-            normalized_bio,
-            "",
-            "## 제출 프로젝트",
-            "",
-            f"### {normalized_project_name}",
-            "",
-            f"- 한 줄 소개: {normalized_one_liner}",
-            f"- 해결하려는 문제: {normalized_problem}",
-            "- 팀 구성:",
-            normalized_roles,
-            "",
-        ]
+    body = compile_template(TEAM_CARD_BODY_TEMPLATE).render(
+        {
+            "TEAM_BIO": normalized_bio,
+            "PROJECT_NAME": normalized_project_name,
+            "ONE_LINER": normalized_one_liner,
+            "PROBLEM_DEFINITION": normalized_problem,
+            "TEAM_ROLES": normalized_roles,
+        }
     )
+    return "\n".join(frontmatter_lines) + body
+
+
+def create_team_submission_doc(
+    repo_root: Path,
+    spec: SubmissionSpec,
+    *,
+    update_existing: bool,
+    changes: Optional[ArtifactChanges] = None,
+) -> Path:
+    team_file = repo_root / team_card_relpath(spec.team_slug, spec.project_slug)
+
+    if team_file.exists() and not update_existing:
+        raise FileExistsError(
+            f"Team submission card already exists at {team_file}. Re-run with --update to overwrite."
+        )
+
+    previous_card = team_file.read_text(encoding="utf-8") if team_file.exists() else None
+    submitted_at = spec.submitted_at
+    if previous_card is not None and not submitted_at.strip():
+        # Keep the original submission time so a re-run does not rewrite the card.
+        submitted_at = parse_frontmatter(previous_card).get("submittedAt", "").strip('"')
 
-    team_file.parent.mkdir(parents=True, exist_ok=True)
-    team_file.write_text("\n".join(frontmatter_lines) + body, encoding="utf-8")
+    content = render_team_card(spec, submitted_at=submitted_at)
+    changed = write_text_if_changed(team_file, content)
+    if changes is not None:
+        changes.record_write(team_file, changed)
+        if changed and previous_card is not None:
+            changes.fields.extend(f"team card: {name}" for name in changed_document_fields(previous_card, content))
     return team_file
 
 
@@ -217,34 +599,80 @@ def load_template(skill_root: Path) -> str:
     return template_path.read_text(encoding="utf-8")
 
 
-def ensure_required_placeholders(template: str, placeholders: Iterable[str]) -> None:
-    missing = [name for name in placeholders if f"__{name}__" not in template]
+@functools.lru_cache(maxsize=None)
+def default_template() -> CompiledTemplate:
+    compiled_template = compile_template(load_template(Path(__file__).resolve().parents[1]))
+    ensure_required_placeholders(compiled_template, RESULT_TEMPLATE_PLACEHOLDERS)
+    return compiled_template
+
+
+class CompiledTemplate:
+    """Template parsed once into alternating literal and placeholder segments."""
+
+    __slots__ = ("literals", "names", "placeholders")
+
+    def __init__(self, source: str) -> None:
+        pieces = PLACEHOLDER_PATTERN.split(source)
+        self.literals: Tuple[str, ...] = tuple(pieces[0::2])
+        self.names: Tuple[str, ...] = tuple(pieces[1::2])
+        self.placeholders: FrozenSet[str] = frozenset(self.names)
+
+    def render(self, replacements: Dict[str, str]) -> str:
+        unresolved = self.placeholders.difference(replacements)
+        if unresolved:
+            joined = ", ".join(f"__{name}__" for name in sorted(unresolved))
+            raise ValueError(f"Unresolved template placeholder(s): {joined}")
+        parts = [self.literals[0]]
+        for name, literal in zip(self.names, self.literals[1:]):
+            parts.append(replacements[name])
+            parts.append(literal)
+        return "".join(parts)
+
+
+# Keyed on the text itself: str caches its hash, so a hit on a module constant costs no rehashing.
+@functools.lru_cache(maxsize=32)
+def _compile_template_text(template: str) -> CompiledTemplate:
+    return CompiledTemplate(template)
+
+
+def compile_template(template: Union[str, CompiledTemplate]) -> CompiledTemplate:
+    if isinstance(template, CompiledTemplate):
+        return template
+    return _compile_template_text(template)
+
+
+def ensure_required_placeholders(
+    template: Union[str, CompiledTemplate], placeholders: Iterable[str]
+) -> None:
+    compiled = compile_template(template)
+    expected = frozenset(placeholders)
+    missing = sorted(expected - compiled.placeholders)
     if missing:
         joined = ", ".join(missing)
         raise ValueError(f"Template missing placeholder(s): {joined}")
+    unresolved = sorted(compiled.placeholders - expected)
+    if unresolved:
+        joined = ", ".join(f"__{name}__" for name in unresolved)
+        raise ValueError(f"Unresolved template placeholder(s): {joined}")
 
 
-def render_template(template: str, replacements: Dict[str, str]) -> str:
-    rendered = template
-    for key, value in replacements.items():
-        rendered = rendered.replace(f"__{key}__", value)
-    leftovers = sorted(set(re.findall(r"__[A-Z0-9_]+__", rendered)))
-    if leftovers:
-        joined = ", ".join(leftovers)
-        raise ValueError(f"Unresolved template placeholder(s): {joined}")
-    return rendered
+def render_template(template: Union[str, CompiledTemplate], replacements: Dict[str, str]) -> str:
+    return compile_template(template).render(replacements)
 
 
 def normalize_markdown_spacing(content: str) -> str:
-    collapsed = re.sub(r"\n{3,}", "\n\n", content.strip())
+    collapsed = BLANK_LINES_PATTERN.sub("\n\n", content.strip())
     return f"{collapsed}\n"
 
 
 def parse_frontmatter(content: str) -> Dict[str, str]:
-    match = re.match(r"^---\n(.*?)\n---\n", content, re.DOTALL)
+    match = FRONTMATTER_PATTERN.match(content)
     if not match:
         raise ValueError("Document does not include valid YAML frontmatter.")
-    frontmatter_lines = match.group(1).splitlines()
+    return parse_frontmatter_lines(match.group(1).splitlines())
+
+
+def parse_frontmatter_lines(frontmatter_lines: Iterable[str]) -> Dict[str, str]:
     data: Dict[str, str] = {}
     for line in frontmatter_lines:
         if ":" not in line:
@@ -254,22 +682,214 @@ def parse_frontmatter(content: str) -> Dict[str, str]:
     return data
 
 
-def validate_document(content: str) -> None:
-    frontmatter = parse_frontmatter(content)
+def frontmatter_errors(frontmatter: Dict[str, str]) -> List[str]:
+    errors: List[str] = []
     keys = set(frontmatter.keys())
     unexpected = sorted(keys - ALLOWED_FRONTMATTER_KEYS)
     if unexpected:
         joined = ", ".join(unexpected)
-        raise ValueError(f"Unexpected frontmatter keys: {joined}")
+        errors.append(f"Unexpected frontmatter keys: {joined}")
 
     missing = sorted(REQUIRED_FRONTMATTER_KEYS - keys)
     if missing:
         joined = ", ".join(missing)
-        raise ValueError(f"Missing required frontmatter keys: {joined}")
+        errors.append(f"Missing required frontmatter keys: {joined}")
+    return errors
+
 
+def document_errors(content: str) -> List[str]:
+    try:
+        frontmatter = parse_frontmatter(content)
+    except ValueError as error:
+        return [str(error)]
+
+    errors = frontmatter_errors(frontmatter)
     for required_header in REQUIRED_SECTION_HEADERS:
         if required_header not in content:
-            raise ValueError(f"Missing required section: {required_header}")
+            errors.append(f"Missing required section: {required_header}")
+    return errors
+
+
+def validate_document(content: str) -> None:
+    errors = document_errors(content)
+    if errors:
+        raise ValidationError(errors)
+
+
+def document_fields(content: str) -> Dict[str, str]:
+    try:
+        fields = dict(parse_frontmatter(content))
+        body = content.split("\n---\n", 1)[1]
+    except (ValueError, IndexError):
+        fields, body = {}, content
+    matches = list(SECTION_HEADER_PATTERN.finditer(body))
+    for index, match in enumerate(matches):
+        end = matches[index + 1].start() if index + 1 < len(matches) else len(body)
+        fields[match.group(1)] = body[match.end() : end].strip()
+    return fields
+
+
+def changed_document_fields(previous: str, current: str) -> List[str]:
+    previous_fields = document_fields(previous)
+    current_fields = document_fields(current)
+    changed = [name for name, value in current_fields.items() if previous_fields.get(name) != value]
+    changed.extend(name for name in previous_fields if name not in current_fields)
+    return changed
+
+
+def content_digest(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+def write_text_if_changed(path: Path, content: str) -> bool:
+    import tempfile
+
+    encoded = content.encode("utf-8")
+    if path.is_file() and content_digest(path.read_bytes()) == content_digest(encoded):
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Write a sibling temp file and rename it so readers never see a partial file.
+    fd, temp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(encoded)
+        os.chmod(temp_name, path.stat().st_mode & 0o777 if path.exists() else 0o644)
+        os.replace(temp_name, path)
+    except BaseException:
+        Path(temp_name).unlink(missing_ok=True)
+        raise
+    return True
+
+
+def read_frontmatter_header(handle: TextIO) -> Dict[str, str]:
+    if handle.readline().rstrip("\r\n") != "---":
+        raise ValueError("Document does not include valid YAML frontmatter.")
+    frontmatter_lines = []
+    for line in handle:
+        stripped = line.rstrip("\r\n")
+        if stripped == "---":
+            return parse_frontmatter_lines(frontmatter_lines)
+        frontmatter_lines.append(stripped)
+    raise ValueError("Document does not include valid YAML frontmatter.")
+
+
+def frontmatter_value(raw_value: str) -> str:
+    value = raw_value.strip()
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in {'"', "'"}:
+        value = value[1:-1]
+    return value
+
+
+def team_card_errors(frontmatter: Dict[str, str]) -> List[str]:
+    errors: List[str] = []
+    missing = [key for key in TEAM_CARD_REQUIRED_KEYS if not frontmatter_value(frontmatter.get(key, ""))]
+    if missing:
+        joined = ", ".join(missing)
+        errors.append(f"Missing required team card keys: {joined}")
+    for key in TEAM_CARD_URL_KEYS:
+        if key in frontmatter and not is_http_url(frontmatter_value(frontmatter[key])):
+            errors.append(f"Team card {key} must be a valid http(s) URL.")
+    order = frontmatter.get("order")
+    if order is not None and not INTEGER_PATTERN.fullmatch(order.strip()):
+        errors.append("Team card order must be an integer.")
+    return errors
+
+
+def validate_tree_file(repo_root: Path, kind: str, relative_path: str) -> Dict[str, object]:
+    errors: List[str] = []
+    try:
+        with (repo_root / relative_path).open("r", encoding="utf-8") as handle:
+            frontmatter = read_frontmatter_header(handle)
+            if kind == "team":
+                errors.extend(team_card_errors(frontmatter))
+            else:
+                errors.extend(frontmatter_errors(frontmatter))
+                # Stream the body line by line instead of loading the whole file.
+                remaining = list(REQUIRED_SECTION_HEADERS)
+                for line in handle:
+                    if remaining:
+                        remaining = [header for header in remaining if header not in line]
+                    if not remaining:
+                        break
+                errors.extend(f"Missing required section: {header}" for header in remaining)
+    except (OSError, UnicodeDecodeError, ValueError) as error:
+        errors.append(str(error))
+    return {"path": relative_path, "kind": kind, "ok": not errors, "errors": errors}
+
+
+def tree_document_kind(relative_path: str) -> Optional[str]:
+    parent, _, name = relative_path.rpartition("/")
+    if not name.endswith(".mdx"):
+        return None
+    if parent == "contents/docs/vibe-coding" and name != "index.mdx":
+        return "result"
+    if parent == "contents/team":
+        return "team"
+    return None
+
+
+def iter_tree_documents(repo_root: Path, *, changed_since: Optional[str] = None) -> Iterator[Tuple[str, str]]:
+    if changed_since:
+        scopes = ["contents/docs/vibe-coding", "contents/team"]
+        changed, untracked = run_concurrently(
+            [
+                ["git", "diff", "--name-only", "-z", "--diff-filter=d", changed_since, "--", *scopes],
+                ["git", "ls-files", "--others", "--exclude-standard", "-z", "--", *scopes],
+            ],
+            cwd=repo_root,
+        )
+        candidates: Iterable[str] = sorted(set(filter(None, (changed + "\0" + untracked).split("\0"))))
+    else:
+        candidates = (
+            path.relative_to(repo_root).as_posix()
+            for folder in (repo_root / "contents" / "docs" / "vibe-coding", repo_root / "contents" / "team")
+            if folder.is_dir()
+            for path in sorted(folder.glob("*.mdx"))
+        )
+    for relative_path in candidates:
+        kind = tree_document_kind(relative_path)
+        if kind:
+            yield kind, relative_path
+
+
+def _validate_tree_batch(repo_root: Path, batch: List[Tuple[str, str]]) -> List[Dict[str, object]]:
+    return [validate_tree_file(repo_root, kind, relative_path) for kind, relative_path in batch]
+
+
+def run_validate_tree(args: argparse.Namespace) -> int:
+    from concurrent.futures import ProcessPoolExecutor
+
+    repo_root = Path(args.validate_tree).resolve()
+    if not (repo_root / "contents").is_dir():
+        raise FileNotFoundError(f"No contents/ directory under {repo_root}")
+
+    documents = list(iter_tree_documents(repo_root, changed_since=args.changed_since))
+    jobs = max(1, args.jobs or os.cpu_count() or 1)
+    batch_size = 64
+    batches = [documents[index : index + batch_size] for index in range(0, len(documents), batch_size)]
+
+    failed = 0
+
+    def report(results: List[Dict[str, object]]) -> None:
+        nonlocal failed
+        for result in results:
+            failed += 0 if result["ok"] else 1
+            sys.stdout.write(json.dumps(result, ensure_ascii=False) + "\n")
+        sys.stdout.flush()
+
+    if jobs == 1 or len(batches) <= 1:
+        for batch in batches:
+            report(_validate_tree_batch(repo_root, batch))
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            for results in pool.map(_validate_tree_batch, [repo_root] * len(batches), batches):
+                report(results)
+
+    print(
+        f"[OK] Tree validation completed: {len(documents) - failed} passed, {failed} failed.",
+        file=sys.stderr,
+    )
+    return 1 if failed else 0
 
 
 def load_json(path: Path) -> Dict[str, object]:
@@ -282,170 +902,1273 @@ def load_json(path: Path) -> Dict[str, object]:
     return raw
 
 
-def write_json(path: Path, payload: Dict[str, object]) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", encoding="utf-8") as file:
-        json.dump(payload, file, ensure_ascii=False, indent=2)
-        file.write("\n")
+def write_json(path: Path, payload: Dict[str, object]) -> bool:
+    return write_text_if_changed(path, json.dumps(payload, ensure_ascii=False, indent=2) + "\n")
+
+
+@contextmanager
+def file_lock(lock_path: Path) -> Iterator[None]:
+    try:
+        import fcntl
+    except ImportError:
+        fcntl = None
 
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with lock_path.open("a+") as handle:
+        if fcntl is not None:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+
+class MetaIndexWriter:
+    """Collects meta.json page insertions and writes each file once, atomically and under a lock."""
+
+    def __init__(self) -> None:
+        self._pending: Dict[Path, Tuple[str, Dict[str, None]]] = {}
+
+    def add(self, meta_path: Path, title: str, page: str) -> None:
+        _, pages = self._pending.setdefault(meta_path, (title, {}))
+        pages[page] = None
+
+    def flush(self) -> List[Path]:
+        written = []
+        for meta_path, (title, new_pages) in self._pending.items():
+            with file_lock(meta_lock_path()):
+                payload = load_json(meta_path)
+                payload["title"] = payload.get("title", title) or title
+                pages = payload.get("pages")
+                normalized_pages = [item for item in pages if isinstance(item, str)] if isinstance(pages, list) else []
+                seen = set(normalized_pages)
+                normalized_pages.extend(page for page in new_pages if page not in seen)
+                payload["pages"] = normalized_pages
+                if write_json(meta_path, payload):
+                    written.append(meta_path)
+        self._pending.clear()
+        return written
+
+
+def meta_lock_path() -> Path:
+    import tempfile
 
-def ensure_meta_page(meta_path: Path, title: str, page: str) -> None:
-    payload = load_json(meta_path)
-    payload["title"] = payload.get("title", title) or title
-    pages = payload.get("pages")
-    if not isinstance(pages, list):
-        pages = []
-    normalized_pages = [item for item in pages if isinstance(item, str)]
-    if page not in normalized_pages:
-        normalized_pages.append(page)
-    payload["pages"] = normalized_pages
-    write_json(meta_path, payload)
+    # The lock lives outside the content tree so it is never staged. One fixed file serves
+    # every meta.json (the writes are tiny), so temporary trees leave no lock files behind.
+    uid = os.getuid() if hasattr(os, "getuid") else 0
+    return Path(tempfile.gettempdir()) / f"hackathon-submission-meta-{uid}.lock"
 
 
-def create_assets(docs_root: Path, *, project_slug: str) -> None:
+def ensure_meta_page(meta_path: Path, title: str, page: str) -> bool:
+    writer = MetaIndexWriter()
+    writer.add(meta_path, title, page)
+    return bool(writer.flush())
+
+
+def add_submission_meta_pages(meta_index: MetaIndexWriter, docs_root: Path, project_slug: str) -> None:
+    meta_index.add(docs_root / "meta.json", "해카톤 문서", "vibe-coding")
+    meta_index.add(docs_root / "vibe-coding" / "meta.json", "바이브 코딩 결과", project_slug)
+
+
+def create_assets(docs_root: Path, *, project_slug: str) -> List[Path]:
     assets_root = docs_root / "vibe-coding" / "assets" / project_slug
+    written = []
     for folder, content in ASSET_READMES.items():
         readme_path = assets_root / folder / "README.md"
-        readme_path.parent.mkdir(parents=True, exist_ok=True)
-        readme_path.write_text(content, encoding="utf-8")
+        if write_text_if_changed(readme_path, content):
+            written.append(readme_path)
+    return written
 
 
-def create_submission_artifacts(
-    repo_root: Path,
-    *,
-    team_name: str,
-    project_name: str,
-    repo_url: str,
-    demo_url_or_run_method: str,
-    problem_definition: str,
-    one_liner: str,
-    team_roles: str,
-    solution: str,
-    tech_stack: str,
-    run_verify: str,
-    demo_summary: str,
-    license_sources: str,
-    ai_used: str,
-    ai_validation_notes: str,
-    presentation_url: str,
-    extra_links: str,
-    project_url: str,
-    team_role_label: str,
-    team_bio: str,
-    team_image_url: str,
-    submitted_at: str,
-    team_order: Optional[int],
-    update_existing: bool,
-) -> Tuple[Path, Path]:
-    skill_root = Path(__file__).resolve().parents[1]
-    template = load_template(skill_root)
+def parse_asset_specs(value: object) -> Tuple[str, ...]:
+    """Normalise ``--asset`` and manifest ``assets`` values to ``("kind=path", ...)``.
 
-    required_placeholders = {
-        "FRONTMATTER_TITLE",
-        "FRONTMATTER_SUMMARY",
-        "FRONTMATTER_DESCRIPTION",
-        "TEAM_NAME",
-        "PROJECT_NAME",
-        "REPO_URL",
-        "DEMO_URL_OR_RUN_METHOD",
-        "PROBLEM_DEFINITION",
-        "SOLUTION",
-        "ONE_LINER",
-        "TEAM_ROLES",
-        "DEMO_SUMMARY_SECTION",
-        "TECH_STACK_SECTION",
-        "RUN_VERIFY_SECTION",
-        "LICENSE_SOURCES_SECTION",
-        "PRESENTATION_SECTION",
-        "EXTRA_LINKS_SECTION",
-    }
-    ensure_required_placeholders(template, required_placeholders)
+    Accepts a list of ``kind=path`` strings, a ``{kind: path-or-paths}`` object
+    (JSONL) or one string with entries separated by ``;`` or newlines (CSV).
+    """
+    def strings(items: object) -> List[str]:
+        if isinstance(items, str):
+            return [items]
+        if isinstance(items, (list, tuple)) and all(isinstance(item, str) for item in items):
+            return list(items)
+        raise ValueError("assets must be a string, list, or mapping of strings")
 
-    team_slug = slugify(team_name)
-    project_slug = slugify(project_name)
+    if value is None:
+        return ()
+    if isinstance(value, dict):
+        return tuple(f"{kind}={path}" for kind, paths in value.items() for path in strings(paths))
+    items = ASSET_SEPARATOR_PATTERN.split(value) if isinstance(value, str) else strings(value)
+    return tuple(item.strip() for item in items if item.strip())
 
-    docs_root = repo_root / "contents" / "docs"
-    doc_file = docs_root / "vibe-coding" / f"{project_slug}.mdx"
-    if doc_file.exists() and not update_existing:
-        raise FileExistsError(
-            f"Document already exists at {doc_file}. Re-run with --update to overwrite."
-        )
 
-    replacements = {
-        "FRONTMATTER_TITLE": sanitize_frontmatter_value(project_name),
-        "FRONTMATTER_SUMMARY": sanitize_frontmatter_value(one_liner),
-        "FRONTMATTER_DESCRIPTION": sanitize_frontmatter_value(
-            f"{project_name} 프로젝트 요약"
-        ),
-        "TEAM_NAME": normalize_text(team_name),
-        "PROJECT_NAME": normalize_text(project_name),
-        "REPO_URL": normalize_text(repo_url),
-        "DEMO_URL_OR_RUN_METHOD": normalize_text(demo_url_or_run_method),
-        "PROBLEM_DEFINITION": normalize_text(problem_definition),
-        "SOLUTION": normalize_text(solution, "핵심 구현 아이디어와 접근 방식을 정리했습니다."),
-        "ONE_LINER": normalize_text(one_liner),
-        "TEAM_ROLES": normalize_text(team_roles),
-        "DEMO_SUMMARY_SECTION": optional_section("데모 설명 (3분 이내 기준)", demo_summary),
-        "TECH_STACK_SECTION": optional_section("기술 스택", tech_stack),
-        "RUN_VERIFY_SECTION": optional_section("실행/검증 방법", run_verify),
-        "LICENSE_SOURCES_SECTION": optional_section("라이선스/출처", license_sources),
-        "PRESENTATION_SECTION": optional_section("발표 자료", presentation_url),
-        "EXTRA_LINKS_SECTION": optional_section("추가 링크", extra_links),
-    }
+class AssetStore:
+    """Local asset files staged by this process, content-hashed for dedupe across a batch.
 
-    rendered = normalize_markdown_spacing(render_template(template, replacements))
-    validate_document(rendered)
+    Sources are hashed once per inode in ``ASSET_CHUNK_BYTES`` chunks, so memory
+    stays flat for multi-hundred-megabyte media. Each copy uses a reflink,
+    ``copy_file_range`` or ``sendfile`` when the platform has them. With
+    ``link_duplicates`` (throwaway checkouts only), content already staged in
+    the batch is hard-linked instead of copied again.
+    """
 
-    doc_file.parent.mkdir(parents=True, exist_ok=True)
-    doc_file.write_text(rendered, encoding="utf-8")
-    create_assets(docs_root, project_slug=project_slug)
+    def __init__(
+        self,
+        *,
+        max_file_bytes: int = DEFAULT_MAX_ASSET_MB * 1024 * 1024,
+        max_total_bytes: int = DEFAULT_MAX_ASSETS_TOTAL_MB * 1024 * 1024,
+        link_duplicates: bool = False,
+    ) -> None:
+        self.max_file_bytes = max_file_bytes
+        self.max_total_bytes = max_total_bytes
+        self.link_duplicates = link_duplicates
+        self.stats = {"copied": 0, "linked": 0, "unchanged": 0, "bytes_copied": 0}
+        self._digests: Dict[Tuple[int, int, int, int], str] = {}
+        self._staged: Dict[str, Path] = {}
+        self._lock = threading.Lock()
 
-    ensure_meta_page(docs_root / "meta.json", "해카톤 문서", "vibe-coding")
-    ensure_meta_page(docs_root / "vibe-coding" / "meta.json", "바이브 코딩 결과", project_slug)
+    def plan(self, spec: SubmissionSpec) -> List[Tuple[Path, str]]:
+        """Return ``(source, assets-relative target)`` pairs, raising ValidationError before anything is staged."""
+        errors: List[str] = []
+        planned: List[Tuple[Path, str]] = []
+        targets: Dict[str, str] = {}
+        total = 0
+        for entry in spec.assets:
+            kind, separator, raw_path = entry.partition("=")
+            kind = kind.strip()
+            if not separator or not raw_path.strip():
+                errors.append(f"Asset must look like kind=path: {entry}")
+                continue
+            if kind not in ASSET_READMES:
+                errors.append(f"Unknown asset kind '{kind}' (use {', '.join(ASSET_READMES)}): {entry}")
+                continue
+            source = Path(raw_path.strip()).expanduser()
+            if not source.is_file():
+                errors.append(f"Asset file not found: {source}")
+                continue
+            size = source.stat().st_size
+            if size > self.max_file_bytes:
+                errors.append(
+                    f"Asset {source} is {size / 1024 / 1024:.1f} MiB, over the "
+                    f"{self.max_file_bytes / 1024 / 1024:.0f} MiB per-file limit."
+                )
+            total += size
+            target = f"{kind}/{source.name}"
+            if source.name == "README.md" or target in targets:
+                errors.append(f"Asset {source} collides with {targets.get(target, 'the folder README')} at {target}.")
+            targets[target] = str(source)
+            planned.append((source, target))
+        if total > self.max_total_bytes:
+            errors.append(
+                f"Assets total {total / 1024 / 1024:.1f} MiB, over the "
+                f"{self.max_total_bytes / 1024 / 1024:.0f} MiB per-submission limit."
+            )
+        if errors:
+            raise ValidationError(errors)
+        return planned
 
-    team_file = create_team_submission_doc(
-        repo_root,
-        team_slug=team_slug,
-        project_slug=project_slug,
-        team_name=team_name,
-        project_name=project_name,
-        one_liner=one_liner,
-        problem_definition=problem_definition,
-        team_roles=team_roles,
-        repo_url=repo_url,
-        demo_url_or_run_method=demo_url_or_run_method,
-        project_url=project_url,
-        team_role_label=team_role_label,
-        team_bio=team_bio,
-        team_image_url=team_image_url,
-        submitted_at=submitted_at,
-        team_order=team_order,
-        update_existing=update_existing,
-    )
+    def relocate(self, old: Path, new: Path) -> None:
+        """Point dedupe at ``new`` after a staged copy moved there, so later duplicates can link to it."""
+        with self._lock:
+            for digest, staged in self._staged.items():
+                if staged == old:
+                    self._staged[digest] = new
 
-    return doc_file, team_file
+    def digest(self, path: Path) -> str:
+        info = path.stat()
+        key = (info.st_dev, info.st_ino, info.st_size, info.st_mtime_ns)
+        with self._lock:
+            cached = self._digests.get(key)
+        if cached is not None:
+            return cached
+        digest = hashlib.sha256()
+        buffer = bytearray(ASSET_CHUNK_BYTES)
+        view = memoryview(buffer)
+        with path.open("rb") as file:
+            while True:
+                read = file.readinto(buffer)
+                if not read:
+                    break
+                digest.update(view[:read])
+        value = digest.hexdigest()
+        with self._lock:
+            self._digests[key] = value
+        return value
 
+    def stage(self, source: Path, target: Path) -> bool:
+        """Place ``source`` at ``target``; return False when the same content is already there."""
+        digest = self.digest(source)
+        if target.is_file() and target.stat().st_size == source.stat().st_size and self.digest(target) == digest:
+            with self._lock:
+                self.stats["unchanged"] += 1
+                self._staged.setdefault(digest, target)
+            return False
+        target.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = target.with_name(f".{target.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with self._lock:
+            staged = self._staged.get(digest)
+        try:
+            linked = False
+            if self.link_duplicates and staged is not None and staged.is_file():
+                try:
+                    os.link(staged, temp_path)
+                    linked = True
+                except OSError:
+                    pass
+            if not linked:
+                copy_file_contents(source, temp_path)
+            os.replace(temp_path, target)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+        with self._lock:
+            self._staged.setdefault(digest, target)
+            if linked:
+                self.stats["linked"] += 1
+            else:
+                self.stats["copied"] += 1
+                self.stats["bytes_copied"] += target.stat().st_size
+        return True
 
-def ensure_gh_cli_and_auth() -> None:
-    run(["gh", "--version"])
-    run(["gh", "auth", "status"])
 
+ASSET_STORE = AssetStore()
 
-def ensure_fork(target_repo: str, login: str, *, create_if_missing: bool = True) -> str:
-    target_repo_name = target_repo.split("/")[-1]
-    fork_repo = f"{login}/{target_repo_name}"
-    try:
-        run(["gh", "repo", "view", fork_repo])
-    except CommandError:
-        if not create_if_missing:
-            raise RuntimeError(
-                f"Fork repository does not exist: {fork_repo}. "
-                f"Create it first with: gh repo fork {target_repo} --clone=false --remote=false"
-            )
-        run(["gh", "repo", "fork", target_repo, "--clone=false", "--remote=false"])
-    return fork_repo
 
+def copy_file_contents(source: Path, target: Path) -> str:
+    """Copy ``source`` to a new ``target`` without a userspace buffer where possible.
 
+    Tries a reflink (``FICLONE``), then ``os.copy_file_range``, then
+    ``os.sendfile``, then chunked reads; returns the method that finished the copy.
+    """
+    import shutil
+
+    with source.open("rb") as src, target.open("wb") as dst:
+        size = os.fstat(src.fileno()).st_size
+        if sys.platform.startswith("linux"):
+            try:
+                import fcntl
+
+                # FICLONE from linux/fs.h; fcntl only exports the name on Python 3.12+.
+                fcntl.ioctl(dst.fileno(), getattr(fcntl, "FICLONE", 0x40049409), src.fileno())
+                return "reflink"
+            except OSError:
+                pass
+        copied = 0
+        for method in ("copy_file_range", "sendfile"):
+            if not hasattr(os, method):
+                continue
+            if method == "sendfile":
+                # copy_file_range takes explicit offsets, but sendfile writes at the file position.
+                dst.seek(copied)
+            try:
+                while copied < size:
+                    if method == "copy_file_range":
+                        sent = os.copy_file_range(src.fileno(), dst.fileno(), size - copied, copied, copied)
+                    else:
+                        sent = os.sendfile(dst.fileno(), src.fileno(), copied, size - copied)
+                    if not sent:
+                        break
+                    copied += sent
+            except OSError:
+                continue
+            if copied >= size:
+                return method
+        src.seek(copied)
+        dst.seek(copied)
+        shutil.copyfileobj(src, dst, ASSET_CHUNK_BYTES)
+        return "read"
+
+
+def stage_submission_assets(docs_root: Path, spec: SubmissionSpec, planned: Sequence[Tuple[Path, str]]) -> List[Path]:
+    assets_root = docs_root / "vibe-coding" / "assets" / spec.project_slug
+    written = []
+    for source, relative_target in planned:
+        target = assets_root / relative_target
+        if ASSET_STORE.stage(source, target):
+            written.append(target)
+    return written
+
+
+class MediaResult(NamedTuple):
+    """Outcome of one ``MediaFetcher`` download: the cached file, or why there is none."""
+
+    path: Optional[Path]
+    status: str
+    size: int = 0
+
+
+def media_file_name(url: str, content_type: str, fallback: str) -> str:
+    import mimetypes
+    import urllib.parse
+
+    raw_name = urllib.parse.unquote(urllib.parse.urlsplit(url).path.rsplit("/", 1)[-1])
+    name = MEDIA_NAME_INVALID_PATTERN.sub("-", raw_name).strip(".-")
+    if not name or name == "README.md":
+        name = fallback
+    if "." not in name:
+        name += mimetypes.guess_extension(content_type) or ""
+    return name
+
+
+def media_expected_sha256(url: str) -> Tuple[str, Optional[str]]:
+    """Split a ``#sha256=<hex>`` checksum fragment off ``url``."""
+    request_url, _, fragment = url.partition("#")
+    match = MEDIA_FRAGMENT_CHECKSUM_PATTERN.search(fragment)
+    return request_url, match.group(1).lower() if match else None
+
+
+def media_header_sha256(headers: Any) -> Optional[str]:
+    """Return the SHA-256 announced in ``Repr-Digest`` (RFC 9530) or ``Digest`` (RFC 3230), as hex."""
+    import base64
+    import binascii
+
+    for name in ("Repr-Digest", "Digest"):
+        match = MEDIA_DIGEST_HEADER_PATTERN.search(headers.get(name) or "")
+        if match:
+            try:
+                return base64.b64decode(match.group(1), validate=True).hex()
+            except (binascii.Error, ValueError):
+                return None
+    return None
+
+
+class MediaFetcher:
+    """Downloads media referenced by submission URLs (``--fetch-media``) into a bounded pool.
+
+    Files land in ``<cache-dir>/media/objects/<sha256>/<name>`` and the index
+    remembers each URL's ETag/Last-Modified, so a re-run revalidates with a
+    conditional request and a ``304`` reuses the cached file. Bodies are
+    streamed to ``media/partial`` in ``ASSET_CHUNK_BYTES`` chunks; an
+    interrupted transfer resumes with ``Range``/``If-Range`` on the next
+    attempt. A ``#sha256=<hex>`` URL fragment or a ``Repr-Digest``/``Digest``
+    header is checked before a file is accepted. The same URL requested by
+    several rows is downloaded once.
+    """
+
+    def __init__(
+        self,
+        cache_root: Path,
+        *,
+        max_workers: int = DEFAULT_MEDIA_CONCURRENCY,
+        timeout: float = 30.0,
+    ) -> None:
+        self.root = cache_root / "media"
+        self.index_path = self.root / "index.json"
+        self.max_workers = max(1, max_workers)
+        self.timeout = timeout
+        self._lock = threading.Lock()
+        self._pool: Optional[Any] = None
+        self._in_flight: Dict[str, Any] = {}
+        self._updated: Dict[str, Dict[str, Any]] = {}
+        try:
+            state = load_json(self.index_path)
+        except ValueError:
+            state = {}
+        entries = state.get("entries") if state.get("version") == MEDIA_CACHE_VERSION else None
+        self.entries: Dict[str, Dict[str, Any]] = dict(entries) if isinstance(entries, dict) else {}
+
+    def fetch(self, url: str) -> Any:
+        """Schedule ``url`` on the pool and return its Future; concurrent callers share one download."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        with self._lock:
+            future = self._in_flight.get(url)
+            if future is None:
+                if self._pool is None:
+                    self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="media")
+                future = self._in_flight[url] = self._pool.submit(self._download, url)
+        return future
+
+    def prefetch(self, spec: SubmissionSpec) -> None:
+        for field_name, _ in MEDIA_URL_FIELDS:
+            url = as_optional_url(str(getattr(spec, field_name) or ""))
+            if url:
+                self.fetch(url)
+
+    @timed_phase("fetch_submission_media")
+    def attach(self, spec: SubmissionSpec, *, stream: Optional[TextIO] = None) -> SubmissionSpec:
+        """Wait for ``spec``'s media and return it with the downloaded files added to ``assets``."""
+        stream = stream or sys.stdout
+        self.prefetch(spec)
+        taken: Set[str] = set()
+        total = 0
+        for entry in spec.assets:
+            kind, _, raw_path = entry.partition("=")
+            source = Path(raw_path.strip()).expanduser()
+            taken.add(f"{kind.strip()}/{source.name}")
+            if source.is_file():
+                total += source.stat().st_size
+        attached: List[str] = []
+        seen: Set[Path] = set()
+        for field_name, kind in MEDIA_URL_FIELDS:
+            url = as_optional_url(str(getattr(spec, field_name) or ""))
+            if not url:
+                continue
+            result: MediaResult = self.fetch(url).result()
+            if result.path is None:
+                # A web page behind a demo or project link is expected; only real failures warn.
+                level = "INFO" if result.status.startswith("not media") else "WARN"
+                print(f"[{level}] Media not fetched ({result.status}): {url}", file=stream)
+                continue
+            if result.path in seen:
+                continue
+            seen.add(result.path)
+            path = result.path
+            if f"{kind}/{path.name}" in taken:
+                path = self._alias(path, f"{field_name.split('_', 1)[0]}-{path.name}")
+            if total + result.size > ASSET_STORE.max_total_bytes:
+                print(f"[WARN] Media skipped (over --max-assets-total-mb): {url}", file=stream)
+                continue
+            total += result.size
+            taken.add(f"{kind}/{path.name}")
+            attached.append(f"{kind}={path}")
+            print(
+                f"[INFO] Media {kind}/{path.name} ({result.status}, {result.size / 1024 / 1024:.1f} MiB): {url}",
+                file=stream,
+            )
+        if not attached:
+            return spec
+        return spec._replace(assets=spec.assets + tuple(attached))
+
+    def save(self) -> None:
+        with self._lock:
+            updated = dict(self._updated)
+        if not updated:
+            return
+        with file_lock(self.index_path.with_suffix(".lock")):
+            try:
+                state = load_json(self.index_path)
+            except ValueError:
+                state = {}
+            entries = state.get("entries") if state.get("version") == MEDIA_CACHE_VERSION else None
+            merged = dict(entries) if isinstance(entries, dict) else {}
+            merged.update(updated)
+            write_json(self.index_path, {"version": MEDIA_CACHE_VERSION, "entries": merged})
+
+    def close(self) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+        self.save()
+
+    def _alias(self, path: Path, name: str) -> Path:
+        alias = path.with_name(name)
+        if not alias.exists():
+            try:
+                os.link(path, alias)
+            except FileExistsError:
+                pass
+            except OSError:
+                copy_file_contents(path, alias)
+        return alias
+
+    def _cached(self, request_url: str, expected: Optional[str]) -> Tuple[Dict[str, Any], Optional[Path]]:
+        with self._lock:
+            entry = dict(self.entries.get(request_url) or {})
+        if not entry:
+            return entry, None
+        cached = self.root / "objects" / str(entry.get("sha256")) / str(entry.get("name"))
+        if not cached.is_file() or (expected is not None and entry.get("sha256") != expected):
+            return {}, None
+        return entry, cached
+
+    def _download(self, url: str) -> MediaResult:
+        import http.client
+        import urllib.error
+        import urllib.request
+
+        request_url, expected = media_expected_sha256(url)
+        entry, cached = self._cached(request_url, expected)
+        key = hashlib.sha256(request_url.encode("utf-8")).hexdigest()
+        part = self.root / "partial" / f"{key}.part"
+        part_meta = part.with_suffix(".json")
+        last_error = "no response"
+        for _ in range(MEDIA_DOWNLOAD_ATTEMPTS):
+            headers = {"User-Agent": "hackathon-submission", "Accept-Encoding": "identity"}
+            if cached is not None:
+                if entry.get("etag"):
+                    headers["If-None-Match"] = str(entry["etag"])
+                elif entry.get("lastModified"):
+                    headers["If-Modified-Since"] = str(entry["lastModified"])
+            try:
+                validator = load_json(part_meta).get("validator") if part.is_file() else None
+            except ValueError:
+                validator = None
+            offset = part.stat().st_size if validator else 0
+            if offset:
+                headers["Range"] = f"bytes={offset}-"
+                headers["If-Range"] = str(validator)
+            try:
+                response = urllib.request.urlopen(
+                    urllib.request.Request(request_url, headers=headers), timeout=self.timeout
+                )
+            except urllib.error.HTTPError as error:
+                error.close()
+                if error.code == 304 and cached is not None:
+                    return MediaResult(cached, "cached", cached.stat().st_size)
+                if error.code == 416:
+                    part.unlink(missing_ok=True)
+                    continue
+                return MediaResult(None, f"HTTP {error.code}")
+            except (OSError, http.client.HTTPException) as error:
+                last_error = str(error)
+                continue
+
+            with response:
+                content_type = response.headers.get_content_type()
+                if not content_type.startswith(MEDIA_CONTENT_TYPES):
+                    return MediaResult(None, f"not media: {content_type}")
+                resumed = response.status == 206 and offset > 0
+                if not resumed:
+                    offset = 0
+                length = response.headers.get("Content-Length")
+                size = offset + int(length) if length and length.isdigit() else None
+                if size is not None and size > ASSET_STORE.max_file_bytes:
+                    part.unlink(missing_ok=True)
+                    return MediaResult(None, f"{size / 1024 / 1024:.1f} MiB is over --max-asset-mb")
+                validator = response.headers.get("ETag") or response.headers.get("Last-Modified")
+                part.parent.mkdir(parents=True, exist_ok=True)
+                write_json(part_meta, {"url": request_url, "validator": validator})
+                received = offset
+                buffer = bytearray(ASSET_CHUNK_BYTES)
+                view = memoryview(buffer)
+                try:
+                    with part.open("ab" if resumed else "wb") as file:
+                        while True:
+                            read = response.readinto(buffer)
+                            if not read:
+                                break
+                            file.write(view[:read])
+                            received += read
+                            if received > ASSET_STORE.max_file_bytes:
+                                break
+                except (OSError, http.client.HTTPException) as error:
+                    # Keep the partial file: the next attempt asks only for the missing range.
+                    last_error = f"interrupted after {received} bytes: {error}"
+                    continue
+                if received > ASSET_STORE.max_file_bytes:
+                    part.unlink(missing_ok=True)
+                    return MediaResult(None, "over --max-asset-mb")
+                if size is not None and received < size:
+                    last_error = f"truncated at {received} of {size} bytes"
+                    continue
+                announced = media_header_sha256(response.headers)
+                final_url = response.geturl()
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+
+            digest = ASSET_STORE.digest(part)
+            for label, checksum in (("URL #sha256", expected), ("Digest header", announced)):
+                if checksum is not None and checksum != digest:
+                    part.unlink(missing_ok=True)
+                    part_meta.unlink(missing_ok=True)
+                    return MediaResult(None, f"{label} mismatch, got sha256={digest}")
+            name = media_file_name(final_url, content_type, f"{key[:12]}")
+            target = self.root / "objects" / digest / name
+            target.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(part, target)
+            part_meta.unlink(missing_ok=True)
+            entry = {"sha256": digest, "name": name, "size": received, "contentType": content_type}
+            if etag:
+                entry["etag"] = etag
+            if last_modified:
+                entry["lastModified"] = last_modified
+            with self._lock:
+                self.entries[request_url] = entry
+                self._updated[request_url] = entry
+            return MediaResult(target, "resumed" if resumed else "downloaded", received)
+        return MediaResult(None, last_error)
+
+
+def open_media_fetcher(args: argparse.Namespace) -> Optional[MediaFetcher]:
+    if not args.fetch_media:
+        return None
+    return MediaFetcher(Path(args.cache_dir).expanduser(), max_workers=args.media_concurrency)
+
+
+def result_document_relpath(project_slug: str) -> str:
+    return f"contents/docs/vibe-coding/{project_slug}.mdx"
+
+
+def team_card_relpath(team_slug: str, project_slug: str) -> str:
+    return f"contents/team/{TEAM_SUBMISSION_FILE_PREFIX}-{team_slug}-{project_slug}.mdx"
+
+
+def render_result_document(
+    spec: SubmissionSpec,
+    template: Union[str, CompiledTemplate, None] = None,
+    *,
+    validate: bool = True,
+) -> str:
+    if template is None:
+        compiled_template = default_template()
+    else:
+        compiled_template = compile_template(template)
+        ensure_required_placeholders(compiled_template, RESULT_TEMPLATE_PLACEHOLDERS)
+
+    replacements = {
+        "FRONTMATTER_TITLE": sanitize_frontmatter_value(spec.project_name),
+        "FRONTMATTER_SUMMARY": sanitize_frontmatter_value(spec.one_liner),
+        "FRONTMATTER_DESCRIPTION": sanitize_frontmatter_value(
+            f"{spec.project_name} 프로젝트 요약"
+        ),
+        "TEAM_NAME": normalize_text(spec.team_name),
+        "PROJECT_NAME": normalize_text(spec.project_name),
+        "REPO_URL": normalize_text(spec.repo_url),
+        "DEMO_URL_OR_RUN_METHOD": normalize_text(spec.demo_url_or_run_method),
+        "PROBLEM_DEFINITION": normalize_text(spec.problem_definition),
+        "SOLUTION": normalize_text(spec.solution, "핵심 구현 아이디어와 접근 방식을 정리했습니다."),
+        "ONE_LINER": normalize_text(spec.one_liner),
+        "TEAM_ROLES": normalize_text(spec.team_roles),
+        "DEMO_SUMMARY_SECTION": optional_section("데모 설명 (3분 이내 기준)", spec.demo_summary),
+        "TECH_STACK_SECTION": optional_section("기술 스택", spec.tech_stack),
+        "RUN_VERIFY_SECTION": optional_section("실행/검증 방법", spec.run_verify),
+        "LICENSE_SOURCES_SECTION": optional_section("라이선스/출처", spec.license_sources),
+        "PRESENTATION_SECTION": optional_section("발표 자료", spec.presentation_url),
+        "EXTRA_LINKS_SECTION": optional_section("추가 링크", spec.extra_links),
+    }
+
+    rendered = normalize_markdown_spacing(compiled_template.render(replacements))
+    if validate:
+        validate_document(rendered)
+    return rendered
+
+
+@timed_phase("create_submission_artifacts")
+def create_submission_artifacts(
+    repo_root: Path,
+    spec: SubmissionSpec,
+    *,
+    update_existing: bool,
+    template: Union[str, CompiledTemplate, None] = None,
+    update_meta: bool = True,
+    changes: Optional[ArtifactChanges] = None,
+) -> Tuple[Path, Path]:
+    if changes is None:
+        changes = ArtifactChanges()
+
+    project_slug = spec.project_slug
+    docs_root = repo_root / "contents" / "docs"
+    doc_file = repo_root / result_document_relpath(project_slug)
+    if doc_file.exists() and not update_existing:
+        raise FileExistsError(
+            f"Document already exists at {doc_file}. Re-run with --update to overwrite."
+        )
+
+    rendered = render_result_document(spec, template)
+    planned_assets = ASSET_STORE.plan(spec)
+
+    previous_doc = doc_file.read_text(encoding="utf-8") if doc_file.exists() else None
+    doc_changed = write_text_if_changed(doc_file, rendered)
+    changes.record_write(doc_file, doc_changed)
+    if doc_changed and previous_doc is not None:
+        changes.fields.extend(
+            f"{DEFAULT_DOC_FILENAME}: {name}" for name in changed_document_fields(previous_doc, rendered)
+        )
+    changes.paths.extend(create_assets(docs_root, project_slug=project_slug))
+    changes.paths.extend(stage_submission_assets(docs_root, spec, planned_assets))
+
+    if update_meta:
+        meta_index = MetaIndexWriter()
+        add_submission_meta_pages(meta_index, docs_root, project_slug)
+        changes.paths.extend(meta_index.flush())
+
+    team_file = create_team_submission_doc(
+        repo_root,
+        spec,
+        update_existing=update_existing,
+        changes=changes,
+    )
+
+    return doc_file, team_file
+
+
+def stage_during_checkout(checkout: Callable[[], Any], stage_root: Path, spec: SubmissionSpec) -> Any:
+    """Run ``checkout`` in the background while ``spec`` renders into ``stage_root``.
+
+    The staged tree has the document, team card and asset files but no
+    ``meta.json`` updates (see ``merge_staged_submission``). A template or
+    validation error terminates the checkout's git subprocesses and is raised
+    right away instead of after the clone.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    commands = ProcessGroup()
+
+    def run_checkout() -> Any:
+        with commands.joined():
+            return checkout()
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        pending = pool.submit(run_checkout)
+        try:
+            create_submission_artifacts(stage_root, spec, update_existing=True, update_meta=False)
+        except BaseException:
+            commands.terminate()
+            raise
+        return pending.result()
+
+
+@timed_phase("merge_staged_submission")
+def merge_staged_submission(
+    stage_root: Path,
+    repo_root: Path,
+    spec: SubmissionSpec,
+    *,
+    update_existing: bool,
+    update_meta: bool = True,
+    changes: Optional[ArtifactChanges] = None,
+) -> Tuple[Path, Path]:
+    """Move a tree staged by ``stage_during_checkout`` into ``repo_root`` and update ``meta.json``.
+
+    The resulting files and change report match ``create_submission_artifacts``
+    run directly against ``repo_root``. Every precondition is checked before the
+    first file moves, so a rejected submission leaves ``repo_root`` untouched.
+    """
+    import filecmp
+    import shutil
+
+    if changes is None:
+        changes = ArtifactChanges()
+    doc_relpath = result_document_relpath(spec.project_slug)
+    team_relpath = team_card_relpath(spec.team_slug, spec.project_slug)
+    doc_file = repo_root / doc_relpath
+    if doc_file.exists() and not update_existing:
+        raise FileExistsError(f"Document already exists at {doc_file}. Re-run with --update to overwrite.")
+    team_file = repo_root / team_relpath
+    if team_file.exists() and not update_existing:
+        raise FileExistsError(
+            f"Team submission card already exists at {team_file}. Re-run with --update to overwrite."
+        )
+
+    staged_files = sorted(
+        (path.relative_to(stage_root).as_posix() for path in stage_root.rglob("*") if path.is_file()),
+        key=lambda relative_path: relative_path != doc_relpath,
+    )
+    for relative_path in staged_files:
+        if relative_path == team_relpath:
+            # The card keeps the submittedAt of the checkout's copy, so it is written below.
+            continue
+        staged = stage_root / relative_path
+        target = repo_root / relative_path
+        if target.exists():
+            if filecmp.cmp(target, staged, shallow=False):
+                continue
+            if relative_path == doc_relpath:
+                changes.fields.extend(
+                    f"{DEFAULT_DOC_FILENAME}: {name}"
+                    for name in changed_document_fields(
+                        target.read_text(encoding="utf-8"), staged.read_text(encoding="utf-8")
+                    )
+                )
+        target.parent.mkdir(parents=True, exist_ok=True)
+        shutil.move(str(staged), str(target))
+        ASSET_STORE.relocate(staged, target)
+        changes.paths.append(target)
+
+    if update_meta:
+        meta_index = MetaIndexWriter()
+        add_submission_meta_pages(meta_index, repo_root / "contents" / "docs", spec.project_slug)
+        changes.paths.extend(meta_index.flush())
+    create_team_submission_doc(repo_root, spec, update_existing=update_existing, changes=changes)
+    return doc_file, team_file
+
+
+def manifest_format(manifest: str, requested: Optional[str]) -> str:
+    if requested:
+        return requested
+    if manifest == "-":
+        return "jsonl"
+    suffix = Path(manifest).suffix.lower()
+    if suffix == ".csv":
+        return "csv"
+    if suffix in {".jsonl", ".ndjson"}:
+        return "jsonl"
+    raise ValueError(f"Unsupported manifest format: {manifest} (use .csv or .jsonl, or --manifest-format)")
+
+
+def iter_manifest_rows(
+    manifest: str, *, format_name: Optional[str] = None
+) -> Iterator[Tuple[int, Dict[str, object]]]:
+    resolved_format = manifest_format(manifest, format_name)
+    if manifest == "-":
+        source: TextIO = sys.stdin
+    else:
+        manifest_path = Path(manifest)
+        if not manifest_path.exists():
+            raise FileNotFoundError(f"Manifest not found: {manifest_path}")
+        encoding = "utf-8-sig" if resolved_format == "csv" else "utf-8"
+        source = manifest_path.open("r", encoding=encoding, newline="")
+
+    try:
+        if resolved_format == "csv":
+            import csv
+
+            for row_number, row in enumerate(csv.DictReader(source), start=1):
+                yield row_number, dict(row)
+            return
+
+        row_number = 0
+        for line_number, line in enumerate(source, start=1):
+            if not line.strip():
+                continue
+            row_number += 1
+            try:
+                row = json.loads(line)
+            except json.JSONDecodeError as error:
+                raise ValueError(f"Manifest line {line_number} is not valid JSON: {error}") from error
+            if not isinstance(row, dict):
+                raise ValueError(f"Manifest line {line_number} is not a JSON object.")
+            yield row_number, row
+    finally:
+        if source is not sys.stdin:
+            source.close()
+
+
+_BATCH_TEMPLATE: Optional[CompiledTemplate] = None
+
+
+def print_change_report(changes: ArtifactChanges) -> None:
+    if changes.fields:
+        print(f"[INFO] Changed fields: {', '.join(changes.fields)}")
+
+
+def print_asset_report() -> None:
+    stats = ASSET_STORE.stats
+    if stats["copied"] or stats["linked"] or stats["unchanged"]:
+        print(
+            f"[INFO] Assets: {stats['copied']} copied ({stats['bytes_copied'] / 1024 / 1024:.1f} MiB), "
+            f"{stats['linked']} deduplicated, {stats['unchanged']} unchanged."
+        )
+
+
+def _init_batch_worker(template: str, max_file_bytes: int, max_total_bytes: int) -> None:
+    global _BATCH_TEMPLATE
+    _BATCH_TEMPLATE = compile_template(template)
+    ASSET_STORE.max_file_bytes = max_file_bytes
+    ASSET_STORE.max_total_bytes = max_total_bytes
+
+
+def manifest_row_result(
+    row_number: int,
+    *,
+    team_slug: str = "",
+    project_slug: str = "",
+    doc_path: Optional[Path] = None,
+    team_card_path: Optional[Path] = None,
+    errors: Sequence[str] = (),
+    changed_files: int = 0,
+    elapsed_ms: float = 0.0,
+) -> Dict[str, object]:
+    return {
+        "row": row_number,
+        "ok": not errors,
+        "team_slug": team_slug,
+        "project_slug": project_slug,
+        "doc_path": str(doc_path) if doc_path else None,
+        "team_card_path": str(team_card_path) if team_card_path else None,
+        "errors": list(errors),
+        "changed_files": changed_files,
+        "elapsed_ms": round(elapsed_ms, 3),
+    }
+
+
+def _render_manifest_row(
+    row_number: int,
+    output_root: Path,
+    update_existing: bool,
+    kwargs: Dict[str, object],
+) -> Dict[str, object]:
+    started = time.perf_counter()
+    spec = SubmissionSpec(**kwargs)
+    team_slug = spec.team_slug
+    project_slug = spec.project_slug
+    changes = ArtifactChanges()
+    try:
+        created_doc, created_team_card = create_submission_artifacts(
+            output_root,
+            spec,
+            update_existing=update_existing,
+            template=_BATCH_TEMPLATE,
+            update_meta=False,
+            changes=changes,
+        )
+    except ValidationError as error:
+        errors: Sequence[str] = error.errors
+    except Exception as error:
+        errors = [str(error)]
+    else:
+        return manifest_row_result(
+            row_number,
+            team_slug=team_slug,
+            project_slug=project_slug,
+            doc_path=created_doc,
+            team_card_path=created_team_card,
+            changed_files=len(changes.paths),
+            elapsed_ms=(time.perf_counter() - started) * 1000,
+        )
+    return manifest_row_result(
+        row_number,
+        team_slug=team_slug,
+        project_slug=project_slug,
+        errors=errors,
+        elapsed_ms=(time.perf_counter() - started) * 1000,
+    )
+
+
+def run_manifest_render(args: argparse.Namespace, *, output_root: Path) -> int:
+    from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+
+    template = default_template()
+    rows = iter_manifest_rows(args.manifest, format_name=args.manifest_format)
+
+    results_stream: Optional[TextIO] = None
+    if args.results_jsonl == "-":
+        results_stream = sys.stdout
+    elif args.results_jsonl:
+        results_stream = Path(args.results_jsonl).open("w", encoding="utf-8")
+    summary_stream = sys.stderr if results_stream is sys.stdout else sys.stdout
+
+    claimed_slugs: Dict[str, int] = {}
+    docs_root = output_root / "contents" / "docs"
+    meta_index = MetaIndexWriter()
+    counts = {"succeeded": 0, "failed": 0}
+
+    def report(result: Dict[str, object]) -> None:
+        if result["ok"]:
+            counts["succeeded"] += 1
+            add_submission_meta_pages(meta_index, docs_root, str(result["project_slug"]))
+        else:
+            counts["failed"] += 1
+        if results_stream is not None:
+            results_stream.write(json.dumps(result, ensure_ascii=False) + "\n")
+            results_stream.flush()
+        elif result["ok"]:
+            print(f"[OK] Row {result['row']}: {result['doc_path']} | {result['team_card_path']}")
+        else:
+            joined = "; ".join(result["errors"])
+            print(f"[ERROR] Row {result['row']}: {joined}", file=sys.stderr)
+
+    def claimed_rows() -> Iterator[Tuple[int, SubmissionSpec]]:
+        for row_number, row in rows:
+            try:
+                spec = SubmissionSpec.from_mapping(row)
+                project_slug = spec.project_slug
+            except Exception as error:
+                report(manifest_row_result(row_number, errors=[str(error)]))
+                continue
+            if project_slug in claimed_slugs:
+                report(
+                    manifest_row_result(
+                        row_number,
+                        project_slug=project_slug,
+                        errors=[
+                            f"Project slug '{project_slug}' is already used by row "
+                            f"{claimed_slugs[project_slug]}."
+                        ],
+                    )
+                )
+                continue
+            claimed_slugs[project_slug] = row_number
+            yield row_number, spec
+
+    def prepared_rows() -> Iterator[Tuple[int, Dict[str, object]]]:
+        if media is None:
+            for row_number, spec in claimed_rows():
+                yield row_number, spec.as_dict()
+            return
+        from collections import deque
+
+        # Rows start downloading a window ahead, so the pool stays busy while earlier rows render.
+        window: Deque[Tuple[int, SubmissionSpec]] = deque()
+        for row_number, spec in claimed_rows():
+            media.prefetch(spec)
+            window.append((row_number, spec))
+            if len(window) > media.max_workers * 2:
+                ready_row, ready_spec = window.popleft()
+                yield ready_row, media.attach(ready_spec, stream=summary_stream).as_dict()
+        for ready_row, ready_spec in window:
+            yield ready_row, media.attach(ready_spec, stream=summary_stream).as_dict()
+
+    media = open_media_fetcher(args)
+    try:
+        jobs = max(1, args.jobs or os.cpu_count() or 1)
+        if jobs == 1:
+            _init_batch_worker(template, ASSET_STORE.max_file_bytes, ASSET_STORE.max_total_bytes)
+            for row_number, kwargs in prepared_rows():
+                report(_render_manifest_row(row_number, output_root, args.update, kwargs))
+        else:
+            max_in_flight = jobs * 4
+            with ProcessPoolExecutor(
+                max_workers=jobs,
+                initializer=_init_batch_worker,
+                initargs=(template, ASSET_STORE.max_file_bytes, ASSET_STORE.max_total_bytes),
+            ) as pool:
+                in_flight: Set[Future] = set()
+                for row_number, kwargs in prepared_rows():
+                    if len(in_flight) >= max_in_flight:
+                        done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            report(future.result())
+                    in_flight.add(
+                        pool.submit(_render_manifest_row, row_number, output_root, args.update, kwargs)
+                    )
+                for future in wait(in_flight).done:
+                    report(future.result())
+
+        meta_index.flush()
+    finally:
+        if media is not None:
+            media.close()
+        if results_stream is not None and results_stream is not sys.stdout:
+            results_stream.close()
+
+    print(
+        f"[OK] Manifest render completed: {counts['succeeded']} succeeded, {counts['failed']} failed.",
+        file=summary_stream,
+    )
+    return 1 if counts["failed"] else 0
+
+
+HANGUL_INITIALS = ("g", "kk", "n", "d", "tt", "r", "m", "b", "pp", "s", "ss", "", "j", "jj", "ch", "k", "t", "p", "h")
+HANGUL_MEDIALS = (
+    "a", "ae", "ya", "yae", "eo", "e", "yeo", "ye", "o", "wa", "wae",
+    "oe", "yo", "u", "wo", "we", "wi", "yu", "eu", "ui", "i",
+)
+HANGUL_FINALS = (
+    "", "k", "k", "k", "n", "n", "n", "t", "l", "k", "m", "l", "l", "l",
+    "p", "l", "m", "p", "p", "t", "t", "ng", "t", "t", "k", "t", "p", "t",
+)
+SLUG_INDEX_VERSION = 1
+SLUG_SUFFIX_PATTERN = re.compile(r"-\d+$")
+SLUG_SKELETON_DROP_PATTERN = re.compile(r"[\W_]+", re.UNICODE)
+
+
+def romanize_hangul(text: str) -> str:
+    parts: List[str] = []
+    for char in text:
+        offset = ord(char) - 0xAC00
+        if 0 <= offset < 11172:
+            parts.append(HANGUL_INITIALS[offset // 588] + HANGUL_MEDIALS[(offset % 588) // 28] + HANGUL_FINALS[offset % 28])
+        else:
+            parts.append(char)
+    return "".join(parts)
+
+
+def slug_skeleton(slug: str) -> str:
+    import unicodedata
+
+    value = SLUG_SUFFIX_PATTERN.sub("", unicodedata.normalize("NFKC", slug).casefold())
+    return SLUG_SKELETON_DROP_PATTERN.sub("", romanize_hangul(value))
+
+
+class SlugIndex:
+    """Project and team slugs already present in the target repository.
+
+    The listing is persisted as JSON and only rebuilt when the source changes:
+    directory mtimes for a checkout, tree SHAs of ``upstream/<base>`` for a bare
+    git mirror. Lookups go through in-memory dicts.
+    """
+
+    def __init__(self, projects: Iterable[str], team_cards: Iterable[str]) -> None:
+        self.projects: Set[str] = set(projects)
+        # Stems of submission-<team-slug>-<project-slug>.mdx. Both slugs may contain dashes, so a
+        # stem is only ever matched against a concrete (team, project) pair, never split by guessing.
+        self.team_cards: Set[str] = set(team_cards)
+        self.skeletons: Dict[str, Set[str]] = {}
+        for slug in self.projects:
+            self.skeletons.setdefault(slug_skeleton(slug), set()).add(slug)
+
+    def similar(self, project_slug: str) -> List[str]:
+        return sorted(self.skeletons.get(slug_skeleton(project_slug), set()) - {project_slug})
+
+    def suggest(self, team_slug: str, project_slug: str, limit: int = 3) -> List[str]:
+        suggestions: List[str] = []
+        candidate = f"{project_slug}-{team_slug}"
+        if candidate not in self.projects:
+            suggestions.append(candidate)
+        number = 2
+        while len(suggestions) < limit:
+            candidate = f"{project_slug}-{number}"
+            if candidate not in self.projects:
+                suggestions.append(candidate)
+            number += 1
+        return suggestions
+
+    def owners(self, project_slug: str) -> List[str]:
+        """Team slugs whose card name ends in ``-<project_slug>``, i.e. every team that may own it."""
+        suffix = f"-{project_slug}"
+        return sorted(
+            stem[: -len(suffix)] for stem in self.team_cards if stem.endswith(suffix) and len(stem) > len(suffix)
+        )
+
+    def collision_errors(self, team_slug: str, project_slug: str, *, update_existing: bool) -> List[str]:
+        if project_slug not in self.projects:
+            return []
+        if f"{team_slug}-{project_slug}" in self.team_cards:
+            owners = [team_slug]
+        else:
+            owners = self.owners(project_slug)
+        if update_existing and (not owners or team_slug in owners):
+            # The team's own document, or one no card claims (e.g. added by hand): --update may overwrite it.
+            return []
+        suggestions = ", ".join(self.suggest(team_slug, project_slug))
+        if owners and team_slug not in owners:
+            joined = "', '".join(owners)
+            return [
+                f"Project slug '{project_slug}' is already used by team '{joined}'. "
+                f"Choose a different --project-name (for example: {suggestions})."
+            ]
+        return [
+            f"Result document for '{project_slug}' already exists. "
+            f"Re-run with --update to overwrite, or choose a different --project-name (for example: {suggestions})."
+        ]
+
+
+def slug_index_state_path(cache_root: Path, source: Path) -> Path:
+    digest = hashlib.sha1(str(source).encode("utf-8")).hexdigest()[:16]
+    return cache_root / "slug-index" / f"{digest}.json"
+
+
+def slug_index_listing(source: Path, *, base_branch: str, previous: Dict[str, object]) -> Dict[str, object]:
+    scopes = ("contents/docs/vibe-coding", "contents/team")
+    if (source / "HEAD").is_file() and not (source / "contents").is_dir():
+        # Bare mirror from --git-cache: key the listing by the tree SHAs of the last fetched base.
+        ref = f"refs/remotes/upstream/{base_branch}"
+        if not run(["git", "rev-parse", "--verify", "--quiet", ref], cwd=source, check=False):
+            ref = "HEAD"
+        # A scope that does not exist yet resolves to an empty key and an empty listing.
+        keys = run_concurrently(
+            [["git", "rev-parse", "--verify", "--quiet", f"{ref}:{scope}"] for scope in scopes],
+            cwd=source,
+            check=False,
+        )
+        if previous.get("keys") == keys:
+            return previous
+        names = run_concurrently(
+            [["git", "ls-tree", "--name-only", "-z", tree] for tree in keys if tree],
+            cwd=source,
+        )
+        listings = [[name for name in names.pop(0).split("\0") if name] if tree else [] for tree in keys]
+    else:
+        folders = [source / scope for scope in scopes]
+        keys = [folder.stat().st_mtime_ns if folder.is_dir() else 0 for folder in folders]
+        if previous.get("keys") == keys:
+            return previous
+        listings = [sorted(os.listdir(folder)) if folder.is_dir() else [] for folder in folders]
+
+    docs, team = listings
+    return {
+        "version": SLUG_INDEX_VERSION,
+        "source": str(source),
+        "keys": keys,
+        "projects": sorted(name[: -len(".mdx")] for name in docs if name.endswith(".mdx") and name != "index.mdx"),
+        "teamCards": sorted(
+            name[len(TEAM_SUBMISSION_FILE_PREFIX) + 1 : -len(".mdx")]
+            for name in team
+            if name.startswith(f"{TEAM_SUBMISSION_FILE_PREFIX}-") and name.endswith(".mdx")
+        ),
+    }
+
+
+@timed_phase("load_slug_index")
+def load_slug_index(source: Path, *, cache_root: Path, base_branch: str) -> SlugIndex:
+    state_path = slug_index_state_path(cache_root, source)
+    try:
+        previous = load_json(state_path)
+    except ValueError:
+        previous = {}
+    if previous.get("version") != SLUG_INDEX_VERSION or previous.get("source") != str(source):
+        previous = {}
+    state = slug_index_listing(source, base_branch=base_branch, previous=previous)
+    if state is not previous:
+        state_path.parent.mkdir(parents=True, exist_ok=True)
+        write_json(state_path, state)
+    return SlugIndex(state["projects"], state["teamCards"])
+
+
+def slug_index_source(args: argparse.Namespace, target_repo: str) -> Optional[Path]:
+    if args.slug_index:
+        return Path(args.slug_index).expanduser().resolve()
+    if not args.git_cache:
+        return None
+    upstream_url = f"https://github.com/{target_repo}.git"
+    mirrors_root = Path(args.cache_dir).expanduser() / "mirrors"
+    for mirror_path in sorted(mirrors_root.glob("*.git")) if mirrors_root.is_dir() else []:
+        if run(["git", "config", "remote.upstream.url"], cwd=mirror_path, check=False) == upstream_url:
+            return mirror_path
+    return None
+
+
+def check_slug_index(args: argparse.Namespace, target_repo: str, team_slug: str, project_slug: str) -> None:
+    source = slug_index_source(args, target_repo)
+    if source is None:
+        return
+    index = load_slug_index(
+        source,
+        cache_root=Path(args.cache_dir).expanduser(),
+        base_branch=args.base_branch,
+    )
+    errors = index.collision_errors(team_slug, project_slug, update_existing=args.update)
+    if errors:
+        raise ValidationError(errors)
+    similar = index.similar(project_slug)
+    if similar:
+        print(f"[WARN] Similar existing project slug(s): {', '.join(similar)}", file=sys.stderr)
+
+
+@timed_phase("ensure_gh_cli_and_auth")
+def ensure_gh_cli_and_auth() -> None:
+    run_concurrently([["gh", "--version"], ["gh", "auth", "status"]])
+
+
+def open_github_client(args: argparse.Namespace, *, limiter: Optional[RateLimiter] = None) -> Optional[GitHubApi]:
+    """Return the in-process client for ``--http-api`` runs, or None to keep using ``gh``."""
+    if not args.http_api:
+        return None
+    return GitHubApi(resolve_github_token(), limiter=limiter)
+
+
+def lookup_login(target_repo: str, base_branch: str = DEFAULT_BASE_BRANCH, *, api: Optional[GitHubApi] = None) -> str:
+    if api is None:
+        return run(["gh", "api", "user", "--jq", ".login"])
+    # Same query as the fork check below, so ensure_fork is answered from the cached session.
+    return str(api.session(target_repo, base_branch)["login"])
+
+
+@timed_phase("ensure_fork")
+def ensure_fork(
+    target_repo: str,
+    login: str,
+    *,
+    create_if_missing: bool = True,
+    api: Optional[GitHubApi] = None,
+) -> str:
+    target_repo_name = target_repo.split("/")[-1]
+    fork_repo = f"{login}/{target_repo_name}"
+    if api is not None:
+        exists = api.session(target_repo)["fork_repo"] is not None
+    else:
+        try:
+            run(["gh", "repo", "view", fork_repo])
+            exists = True
+        except CommandError:
+            exists = False
+    if exists:
+        return fork_repo
+    if not create_if_missing:
+        raise RuntimeError(
+            f"Fork repository does not exist: {fork_repo}. "
+            f"Create it first with: gh repo fork {target_repo} --clone=false --remote=false"
+        )
+    if api is not None:
+        return ensure_fork_via_api(api, target_repo, login)
+    run(["gh", "repo", "fork", target_repo, "--clone=false", "--remote=false"])
+    return fork_repo
+
+
+@timed_phase("prepare_git_checkout")
 def prepare_git_checkout(
     *,
     temp_root: Path,
@@ -453,108 +2176,1521 @@ def prepare_git_checkout(
     base_branch: str,
     fork_repo: str,
     branch_name: str,
+    sparse: bool = False,
+    cache_root: Optional[Path] = None,
 ) -> Path:
     repo_path = temp_root / "repo"
-    run(["git", "clone", f"https://github.com/{fork_repo}.git", str(repo_path)])
+    if cache_root is not None:
+        mirror_path = git_mirror_path(cache_root, fork_repo)
+        with file_lock(mirror_path.with_suffix(".lock")):
+            refresh_git_mirror(
+                mirror_path,
+                target_repo=target_repo,
+                fork_repo=fork_repo,
+                base_branch=base_branch,
+            )
+            worktree_cmd = ["git", "worktree", "add", "-B", branch_name, str(repo_path), f"upstream/{base_branch}"]
+            if sparse:
+                worktree_cmd.insert(3, "--no-checkout")
+            run(worktree_cmd, cwd=mirror_path)
+        if sparse:
+            run(["git", "sparse-checkout", "set", "--cone", *SPARSE_CHECKOUT_PATHS], cwd=repo_path)
+            run(["git", "checkout", "-f", branch_name], cwd=repo_path)
+        return repo_path
+
+    if not sparse:
+        run(["git", "clone", f"https://github.com/{fork_repo}.git", str(repo_path)])
+        run(["git", "remote", "add", "upstream", f"https://github.com/{target_repo}.git"], cwd=repo_path)
+        run_concurrently(
+            [
+                [*PARALLEL_FETCH_GIT, "fetch", "origin"],
+                [*PARALLEL_FETCH_GIT, "fetch", "upstream", base_branch],
+            ],
+            cwd=repo_path,
+        )
+        run(["git", "checkout", "-B", branch_name, f"upstream/{base_branch}"], cwd=repo_path)
+        return repo_path
+
+    # Only the tip of upstream/<base> is needed; blobs outside the sparse
+    # cone are never downloaded, and history is deepened lazily on push.
+    run(
+        [
+            "git",
+            "clone",
+            "--filter=blob:none",
+            "--depth=1",
+            "--no-checkout",
+            f"https://github.com/{fork_repo}.git",
+            str(repo_path),
+        ]
+    )
     run(["git", "remote", "add", "upstream", f"https://github.com/{target_repo}.git"], cwd=repo_path)
-    run(["git", "fetch", "origin"], cwd=repo_path)
-    run(["git", "fetch", "upstream", base_branch], cwd=repo_path)
+    run(["git", "sparse-checkout", "set", "--cone", *SPARSE_CHECKOUT_PATHS], cwd=repo_path)
+    run(["git", "fetch", "--filter=blob:none", "--depth=1", "upstream", base_branch], cwd=repo_path)
     run(["git", "checkout", "-B", branch_name, f"upstream/{base_branch}"], cwd=repo_path)
     return repo_path
 
 
-def create_branch_name(team_slug: str, project_slug: str) -> str:
-    ts = dt.datetime.now(dt.timezone.utc).strftime("%Y%m%d%H%M%S")
-    suffix = secrets.token_hex(3)
-    return f"submission/{team_slug}-{project_slug}-{ts}-{suffix}"
+def git_mirror_path(cache_root: Path, fork_repo: str) -> Path:
+    return cache_root / "mirrors" / f"{fork_repo.replace('/', '__')}.git"
+
+
+def refresh_git_mirror(mirror_path: Path, *, target_repo: str, fork_repo: str, base_branch: str) -> None:
+    if not (mirror_path / "HEAD").exists():
+        mirror_path.parent.mkdir(parents=True, exist_ok=True)
+        run(["git", "init", "--bare", str(mirror_path)])
+        run(["git", "remote", "add", "origin", f"https://github.com/{fork_repo}.git"], cwd=mirror_path)
+        run(["git", "remote", "add", "upstream", f"https://github.com/{target_repo}.git"], cwd=mirror_path)
+    run(["git", "worktree", "prune"], cwd=mirror_path)
+    run_concurrently(
+        [
+            [*PARALLEL_FETCH_GIT, "fetch", "--prune", "origin"],
+            [*PARALLEL_FETCH_GIT, "fetch", "upstream", base_branch],
+        ],
+        cwd=mirror_path,
+    )
+
+
+def release_git_checkout(repo_path: Path, branch_name: Optional[str]) -> None:
+    is_worktree = (repo_path / ".git").is_file()
+    if is_worktree:
+        common_dir = run(["git", "rev-parse", "--git-common-dir"], cwd=repo_path, check=False)
+        if not common_dir:
+            return
+        mirror_path = (repo_path / common_dir).resolve()
+    elif repo_path.is_dir() and run(
+        ["git", "rev-parse", "--is-bare-repository"], cwd=repo_path, check=False
+    ) == "true":
+        mirror_path = repo_path
+    else:
+        return
+    with file_lock(mirror_path.with_suffix(".lock")):
+        if is_worktree:
+            run(["git", "worktree", "remove", "--force", str(repo_path)], cwd=mirror_path, check=False)
+        if branch_name:
+            run(["git", "branch", "-D", branch_name], cwd=mirror_path, check=False)
+
+
+def is_shallow_repository(repo_path: Path) -> bool:
+    return run(["git", "rev-parse", "--is-shallow-repository"], cwd=repo_path, check=False) == "true"
+
+
+@timed_phase("push_branch")
+def push_branch(
+    repo_path: Path,
+    branch_name: str,
+    *,
+    base_branch: str = DEFAULT_BASE_BRANCH,
+    remote_branch: Optional[str] = None,
+) -> None:
+    """Push ``branch_name``, or fast-forward the fork's ``remote_branch`` to it."""
+    if remote_branch is None:
+        cmd = ["git", "push", "--set-upstream", "origin", branch_name]
+    else:
+        cmd = ["git", "push", "origin", f"{branch_name}:refs/heads/{remote_branch}"]
+    try:
+        run(cmd, cwd=repo_path)
+    except CommandError:
+        if not is_shallow_repository(repo_path):
+            raise
+        # The fork is behind the shallow boundary; fetch the missing commits
+        # and trees (still without blobs) so the push can be completed.
+        run(["git", "fetch", "--filter=blob:none", "--unshallow", "upstream", base_branch], cwd=repo_path)
+        run(cmd, cwd=repo_path)
+
+
+def submission_branch_prefix(team_slug: str, project_slug: str) -> str:
+    return f"submission/{team_slug}-{project_slug}-"
+
+
+def create_branch_name(team_slug: str, project_slug: str) -> str:
+    import secrets
+
+    ts = dt.datetime.now(dt.timezone.utc).strftime("%Y%m%d%H%M%S")
+    suffix = secrets.token_hex(3)
+    return f"{submission_branch_prefix(team_slug, project_slug)}{ts}-{suffix}"
+
+
+@timed_phase("find_open_submission_pr")
+def find_open_submission_pr(
+    *,
+    target_repo: str,
+    base_branch: str,
+    login: str,
+    team_slug: str,
+    project_slug: str,
+    api: Optional[GitHubApi] = None,
+) -> Optional[Tuple[str, str]]:
+    """Return ``(branch, pr_url)`` of the newest open PR from ``login``'s fork for this team and project."""
+    import urllib.parse
+
+    if api is not None:
+        pulls = api.request(
+            "GET",
+            f"/repos/{target_repo}/pulls?state=open&base={urllib.parse.quote(base_branch, safe='')}&per_page=100",
+        )
+        candidates = [
+            (str(pull["head"]["ref"]), str(pull["html_url"]))
+            for pull in (pulls if isinstance(pulls, list) else [])
+            if ((pull.get("head") or {}).get("user") or {}).get("login") == login
+        ]
+    else:
+        listing = run(
+            [
+                "gh",
+                "pr",
+                "list",
+                "--repo",
+                target_repo,
+                "--state",
+                "open",
+                "--base",
+                base_branch,
+                "--author",
+                login,
+                "--limit",
+                "100",
+                "--json",
+                "headRefName,url",
+                "--jq",
+                ".[] | [.headRefName, .url] | @tsv",
+            ]
+        )
+        candidates = [
+            (head, url) for head, _, url in (line.partition("\t") for line in listing.splitlines()) if url
+        ]
+    prefix = submission_branch_prefix(team_slug, project_slug)
+    matches = sorted(
+        (head, url)
+        for head, url in candidates
+        if head.startswith(prefix) and SUBMISSION_BRANCH_SUFFIX_PATTERN.fullmatch(head[len(prefix) :])
+    )
+    # Branch names embed a UTC timestamp, so the last one sorted is the newest submission.
+    return matches[-1] if matches else None
+
+
+def fetch_fork_branch(repo_path: Path, branch_name: str) -> str:
+    """Fetch ``branch_name`` from the fork (shallow and blob-less in a shallow clone) and return its SHA."""
+    ref = f"refs/remotes/origin/{branch_name}"
+    cmd = [*PARALLEL_FETCH_GIT, "fetch", "--no-tags"]
+    if is_shallow_repository(repo_path):
+        cmd.extend(["--depth=1", "--filter=blob:none"])
+    run([*cmd, "origin", f"+refs/heads/{branch_name}:{ref}"], cwd=repo_path)
+    return run(["git", "rev-parse", f"{ref}^{{commit}}"], cwd=repo_path)
+
+
+def ensure_git_identity(repo_path: Path) -> None:
+    name = run(["git", "config", "--get", "user.name"], cwd=repo_path, check=False)
+    email = run(["git", "config", "--get", "user.email"], cwd=repo_path, check=False)
+    if name and email:
+        return
+    raise RuntimeError(
+        "Git user identity is missing. Set user.name and user.email before running this script."
+    )
+
+
+def build_commit_message(*, team_slug: str, project_slug: str, project_name: str, team_name: str) -> str:
+    return "\n".join(
+        [
+            f"docs(submission): add {project_name} result document",
+            "",
+            "Why:",
+            "- 해카톤 제출 준비/제출 요건을 단일 결과 문서로 공개하기 위해",
+            "",
+            "What:",
+            f"- contents/docs/vibe-coding/{project_slug}.mdx 생성",
+            f"- contents/team/{TEAM_SUBMISSION_FILE_PREFIX}-{team_slug}-{project_slug}.mdx 카드 데이터 생성",
+            "- 제출용 assets 안내 파일 및 docs/team meta 데이터 갱신",
+            "",
+            "Verify:",
+            "- create_submission_pr.py frontmatter/섹션 검증 통과",
+            "- 중복 생성 방지 규칙과 경로 생성 규칙 점검",
+            "",
+            "AI:",
+            f"- AI 도구를 사용해 초안을 생성하고, 최종 스크립트 동작은 {team_name} 팀 제출 흐름 기준으로 검증",
+        ]
+    )
+
+
+def commit_changes(repo_path: Path, *, team_slug: str, project_slug: str, project_name: str, team_name: str) -> str:
+    commit_message = build_commit_message(
+        team_slug=team_slug,
+        project_slug=project_slug,
+        project_name=project_name,
+        team_name=team_name,
+    )
+    return commit_worktree(repo_path, commit_message)
+
+
+@timed_phase("commit_changes")
+def commit_worktree(repo_path: Path, message: str) -> str:
+    run(
+        ["git", "add", "contents/docs/meta.json", "contents/docs/vibe-coding", "contents/team"],
+        cwd=repo_path,
+    )
+    staged = run(["git", "status", "--short"], cwd=repo_path)
+    if not staged:
+        raise RuntimeError("No staged changes were found. Nothing to commit.")
+
+    run(["git", "commit", "-m", message], cwd=repo_path)
+    return run(["git", "rev-parse", "HEAD"], cwd=repo_path)
+
+
+def submission_target_paths(team_slug: str, project_slug: str) -> List[str]:
+    paths = [
+        "contents/docs/meta.json",
+        "contents/docs/vibe-coding/meta.json",
+        result_document_relpath(project_slug),
+        team_card_relpath(team_slug, project_slug),
+    ]
+    paths.extend(
+        f"contents/docs/vibe-coding/assets/{project_slug}/{folder}/README.md" for folder in ASSET_READMES
+    )
+    return paths
+
+
+@timed_phase("prepare_object_store")
+def prepare_object_store(
+    *,
+    temp_root: Path,
+    target_repo: str,
+    base_branch: str,
+    fork_repo: str,
+    cache_root: Optional[Path] = None,
+) -> Path:
+    if cache_root is not None:
+        mirror_path = git_mirror_path(cache_root, fork_repo)
+        with file_lock(mirror_path.with_suffix(".lock")):
+            refresh_git_mirror(
+                mirror_path,
+                target_repo=target_repo,
+                fork_repo=fork_repo,
+                base_branch=base_branch,
+            )
+        return mirror_path
+
+    git_dir = temp_root / "repo.git"
+    run(
+        [
+            "git",
+            "clone",
+            "--bare",
+            "--filter=blob:none",
+            "--depth=1",
+            f"https://github.com/{fork_repo}.git",
+            str(git_dir),
+        ]
+    )
+    run(["git", "remote", "add", "upstream", f"https://github.com/{target_repo}.git"], cwd=git_dir)
+    run(["git", "fetch", "--filter=blob:none", "--depth=1", "upstream", base_branch], cwd=git_dir)
+    return git_dir
+
+
+def seed_staging_root(git_dir: Path, staging_root: Path, *, base_ref: str, paths: Sequence[str]) -> Path:
+    existing = run(["git", "ls-tree", "-r", "-z", "--name-only", base_ref, "--", *paths], cwd=git_dir)
+    for relative_path in filter(None, existing.split("\0")):
+        content = run(["git", "cat-file", "blob", f"{base_ref}:{relative_path}"], cwd=git_dir, strip=False)
+        target = staging_root / relative_path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(content, encoding="utf-8")
+    staging_root.mkdir(parents=True, exist_ok=True)
+    return staging_root
+
+
+def ls_remote_head(target_repo: str, base_branch: str) -> str:
+    output = run(
+        ["git", "ls-remote", "--exit-code", f"https://github.com/{target_repo}.git", f"refs/heads/{base_branch}"]
+    )
+    return output.split()[0]
+
+
+@timed_phase("fetch_upstream_paths")
+def fetch_upstream_paths(
+    temp_root: Path,
+    staging_root: Path,
+    *,
+    target_repo: str,
+    base_sha: str,
+    paths: Sequence[str],
+    mirror_path: Optional[Path] = None,
+) -> Dict[str, str]:
+    """Copy ``paths`` at ``base_sha`` into ``staging_root`` and return their blob SHAs.
+
+    A ``--git-cache`` mirror that already has the commit is read locally.
+    Otherwise a blob-less, depth-1 fetch brings only the commit and its trees,
+    and one more fetch asks for the blobs of ``paths``.
+    """
+    git_dir = mirror_path
+    partial = git_dir is None or not (git_dir / "HEAD").exists() or not run(
+        ["git", "rev-parse", "--verify", "--quiet", f"{base_sha}^{{commit}}"], cwd=git_dir, check=False
+    )
+    if partial:
+        git_dir = temp_root / "upstream.git"
+        run(["git", "init", "--bare", "-q", str(git_dir)])
+        run(["git", "remote", "add", "upstream", f"https://github.com/{target_repo}.git"], cwd=git_dir)
+        run(["git", "fetch", "-q", "--depth=1", "--filter=blob:none", "--no-tags", "upstream", base_sha], cwd=git_dir)
+
+    blobs: Dict[str, str] = {}
+    for entry in filter(None, run(["git", "ls-tree", "-r", "-z", base_sha, "--", *paths], cwd=git_dir).split("\0")):
+        info, relative_path = entry.split("\t", 1)
+        blobs[relative_path] = info.split()[2]
+    if partial and blobs:
+        # One round trip for every blob instead of a lazy fetch per cat-file.
+        run(
+            [
+                "git",
+                "-c",
+                "fetch.negotiationAlgorithm=noop",
+                "fetch",
+                "-q",
+                "--no-tags",
+                "--no-write-fetch-head",
+                "--filter=blob:none",
+                "upstream",
+                *sorted(set(blobs.values())),
+            ],
+            cwd=git_dir,
+        )
+    staging_root.mkdir(parents=True, exist_ok=True)
+    for relative_path, blob_sha in blobs.items():
+        target = staging_root / relative_path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(run(["git", "cat-file", "blob", blob_sha], cwd=git_dir, strip=False), encoding="utf-8")
+    return blobs
+
+
+@timed_phase("commit_staged_tree")
+def commit_staged_tree(
+    git_dir: Path,
+    *,
+    staging_root: Path,
+    base_ref: str,
+    branch_name: str,
+    message: str,
+) -> str:
+    relative_paths = sorted(
+        path.relative_to(staging_root).as_posix() for path in staging_root.rglob("*") if path.is_file()
+    )
+    if not relative_paths:
+        raise RuntimeError("No staged changes were found. Nothing to commit.")
+
+    blob_shas = run(
+        ["git", "hash-object", "-w", "--stdin-paths"],
+        cwd=git_dir,
+        input_text="\n".join(str(staging_root / path) for path in relative_paths) + "\n",
+    ).splitlines()
+    index_info = "".join(f"100644 {sha}\t{path}\n" for sha, path in zip(blob_shas, relative_paths))
+
+    index_env = {"GIT_INDEX_FILE": str(staging_root.parent / "staging.index")}
+    base_sha = run(["git", "rev-parse", f"{base_ref}^{{commit}}"], cwd=git_dir)
+    base_tree = run(["git", "rev-parse", f"{base_ref}^{{tree}}"], cwd=git_dir)
+    run(["git", "read-tree", base_ref], cwd=git_dir, env=index_env)
+    run(["git", "update-index", "--index-info"], cwd=git_dir, env=index_env, input_text=index_info)
+    tree_sha = run(["git", "write-tree"], cwd=git_dir, env=index_env)
+    if tree_sha == base_tree:
+        raise RuntimeError("No staged changes were found. Nothing to commit.")
+
+    commit_sha = run(["git", "commit-tree", tree_sha, "-p", base_sha, "-m", message], cwd=git_dir)
+    run(["git", "update-ref", f"refs/heads/{branch_name}", commit_sha], cwd=git_dir)
+    return commit_sha
+
+
+@timed_phase("create_or_get_pr")
+def create_or_get_pr(
+    *,
+    target_repo: str,
+    base_branch: str,
+    login: str,
+    branch_name: str,
+    project_name: str,
+    team_name: str,
+    title: Optional[str] = None,
+    body: Optional[str] = None,
+    api: Optional[GitHubApi] = None,
+) -> str:
+    if api is not None:
+        return create_or_get_pr_via_api(
+            api,
+            target_repo=target_repo,
+            base_branch=base_branch,
+            login=login,
+            branch_name=branch_name,
+            project_name=project_name,
+            team_name=team_name,
+            title=title,
+            body=body,
+        )
+    existing_pr = run(
+        [
+            "gh",
+            "pr",
+            "list",
+            "--repo",
+            target_repo,
+            "--state",
+            "open",
+            "--head",
+            f"{login}:{branch_name}",
+            "--json",
+            "url",
+            "--jq",
+            ".[0].url",
+        ]
+    )
+    if existing_pr:
+        return existing_pr
+
+    pr_title = title or f"[Submission] {project_name}"
+    pr_body = body or build_pr_body(project_name=project_name, team_name=team_name)
+    pr_url = run(
+        [
+            "gh",
+            "pr",
+            "create",
+            "--repo",
+            target_repo,
+            "--base",
+            base_branch,
+            "--head",
+            f"{login}:{branch_name}",
+            "--title",
+            pr_title,
+            "--body",
+            pr_body,
+        ]
+    )
+    return pr_url.strip().splitlines()[-1]
+
+
+def build_pr_body(*, project_name: str, team_name: str) -> str:
+    return "\n".join(
+        [
+            f"Team: {team_name}",
+            f"Project: {project_name}",
+            "",
+            "Why:",
+            "- 해카톤 제출 결과 문서를 공개 저장소에 등록합니다.",
+            "",
+            "What:",
+            "- vibecoding-result.mdx 및 제출 assets 구조를 생성/갱신했습니다.",
+            "",
+            "Verify:",
+            "- frontmatter 필수 필드 검증",
+            "- 요구 섹션 존재 검증",
+            "- docs meta.json 네비게이션 반영 검증",
+        ]
+    )
+
+
+def resolve_github_token() -> str:
+    for name in ("GH_TOKEN", "GITHUB_TOKEN"):
+        token = os.environ.get(name, "").strip()
+        if token:
+            return token
+    token = run(["gh", "auth", "token"])
+    if not token:
+        raise RuntimeError("GitHub token is missing. Run `gh auth login` or set GH_TOKEN.")
+    return token
+
+
+def git_blob_sha(content: bytes) -> str:
+    return hashlib.sha1(b"blob %d\0" % len(content) + content).hexdigest()
+
+
+class GitHubApiError(CommandError):
+    """Raised when a GitHub API request fails."""
+
+
+GITHUB_SESSION_QUERY = """
+query($owner: String!, $name: String!, $branch: String!) {
+  viewer { login repository(name: $name) { nameWithOwner } }
+  repository(owner: $owner, name: $name) {
+    nameWithOwner
+    defaultBranchRef { name }
+    ref(qualifiedName: $branch) { target { oid } }
+  }
+}
+"""
+
+
+class GitHubApi:
+    """Minimal JSON client for the GitHub REST and GraphQL APIs.
+
+    Requests share a small pool of keep-alive connections, so a submission
+    pays for one TLS handshake instead of one ``gh`` process per call. The
+    base URL honours ``GITHUB_API_URL`` (GitHub Enterprise or a local stub).
+    """
+
+    def __init__(
+        self,
+        token: str,
+        *,
+        base_url: Optional[str] = None,
+        max_connections: int = 8,
+        limiter: Optional[RateLimiter] = None,
+    ) -> None:
+        import urllib.parse
+
+        self.token = token
+        self.base_url = (base_url or os.environ.get("GITHUB_API_URL") or DEFAULT_GITHUB_API_URL).rstrip("/")
+        self.max_connections = max_connections
+        self.limiter = limiter
+        parts = urllib.parse.urlsplit(self.base_url)
+        self._scheme = parts.scheme
+        self._netloc = parts.netloc
+        self._prefix = parts.path.rstrip("/")
+        # github.com serves GraphQL at /graphql; Enterprise at /api/graphql next to /api/v3.
+        self.graphql_path = (
+            f"{self._prefix[:-3]}/graphql" if self._prefix.endswith("/v3") else f"{self._prefix}/graphql"
+        )
+        self._idle: List[Any] = []
+        self._sessions: Dict[str, Dict[str, Optional[str]]] = {}
+        self._lock = threading.Lock()
+
+    def _connection(self) -> Tuple[Any, bool]:
+        import http.client
+
+        with self._lock:
+            if self._idle:
+                return self._idle.pop(), True
+        connection_class = http.client.HTTPSConnection if self._scheme == "https" else http.client.HTTPConnection
+        return connection_class(self._netloc, timeout=30), False
+
+    def _release(self, connection: Any) -> None:
+        with self._lock:
+            if len(self._idle) < self.max_connections:
+                self._idle.append(connection)
+                return
+        connection.close()
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for connection in idle:
+            connection.close()
+
+    def send(
+        self,
+        method: str,
+        path: str,
+        payload: Optional[Dict[str, object]] = None,
+        *,
+        extra_headers: Optional[Dict[str, str]] = None,
+    ) -> Tuple[int, bytes, Any]:
+        import http.client
+
+        data = json.dumps(payload).encode("utf-8") if payload is not None else None
+        headers = {
+            "Accept": "application/vnd.github+json",
+            "Authorization": f"Bearer {self.token}",
+            "Content-Type": "application/json",
+            "User-Agent": "hackathon-submission",
+            "X-GitHub-Api-Version": "2022-11-28",
+            **(extra_headers or {}),
+        }
+        while True:
+            connection, reused = self._connection()
+            try:
+                connection.request(method, path, body=data, headers=headers)
+                response = connection.getresponse()
+                body = response.read()
+            except (OSError, http.client.HTTPException) as error:
+                connection.close()
+                if reused:
+                    # The server closed an idle keep-alive connection; retry on a fresh one.
+                    continue
+                raise GitHubApiError(f"GitHub API unreachable: {method} {path}\n{error}") from error
+            if response.will_close:
+                connection.close()
+            else:
+                self._release(connection)
+            if self.limiter is not None:
+                self.limiter.observe_headers(response.headers)
+            return response.status, body, response.headers
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        payload: Optional[Dict[str, object]] = None,
+        *,
+        allow_not_found: bool = False,
+    ) -> object:
+        status, body, _ = self.send(method, f"{self._prefix}{path}", payload)
+        if status >= 400:
+            if allow_not_found and status == 404:
+                return None
+            detail = body.decode("utf-8", errors="replace").strip()
+            raise GitHubApiError(f"GitHub API failed (HTTP {status}): {method} {path}\n{detail}")
+        return json.loads(body) if body else None
+
+    def get_if_changed(self, path: str, etag: Optional[str]) -> Tuple[object, Optional[str]]:
+        """Conditional GET: return ``(None, etag)`` on 304, else the new body and ETag.
+
+        GitHub does not count 304 responses against the rate limit.
+        """
+        extra_headers = {"If-None-Match": etag} if etag else None
+        status, body, headers = self.send("GET", f"{self._prefix}{path}", extra_headers=extra_headers)
+        if status == 304:
+            return None, etag
+        if status >= 400:
+            detail = body.decode("utf-8", errors="replace").strip()
+            raise GitHubApiError(f"GitHub API failed (HTTP {status}): GET {path}\n{detail}")
+        return json.loads(body) if body else None, headers.get("ETag")
+
+    def graphql(self, query: str, variables: Optional[Dict[str, object]] = None) -> Dict[str, Any]:
+        status, body, _ = self.send("POST", self.graphql_path, {"query": query, "variables": variables or {}})
+        detail = body.decode("utf-8", errors="replace").strip()
+        if status >= 400:
+            raise GitHubApiError(f"GitHub GraphQL failed (HTTP {status})\n{detail}")
+        result = json.loads(body)
+        # Missing objects come back as null fields plus NOT_FOUND errors; anything else is fatal.
+        errors = [error for error in result.get("errors") or [] if error.get("type") != "NOT_FOUND"]
+        if errors or not isinstance(result.get("data"), dict):
+            raise GitHubApiError(f"GitHub GraphQL failed\n{detail}")
+        return result["data"]
+
+    def session(self, target_repo: str, base_branch: Optional[str] = None) -> Dict[str, Optional[str]]:
+        """Look up login, fork, default branch and upstream head for ``target_repo`` in one GraphQL query.
+
+        The result is cached per target repository; asking for a different
+        ``base_branch`` than the cached one re-runs the query.
+        """
+        with self._lock:
+            cached = self._sessions.get(target_repo)
+        if cached is not None and base_branch in (None, cached["base_branch"]):
+            return cached
+        branch = base_branch or DEFAULT_BASE_BRANCH
+        owner, name = target_repo.split("/", 1)
+        data = self.graphql(
+            GITHUB_SESSION_QUERY,
+            {"owner": owner, "name": name, "branch": f"refs/heads/{branch}"},
+        )
+        upstream = data.get("repository")
+        if upstream is None:
+            raise GitHubApiError(f"Target repository is not accessible: {target_repo}")
+        fork = data["viewer"].get("repository")
+        head = upstream.get("ref") or {}
+        info: Dict[str, Optional[str]] = {
+            "login": str(data["viewer"]["login"]),
+            "fork_repo": str(fork["nameWithOwner"]) if fork else None,
+            "default_branch": (upstream.get("defaultBranchRef") or {}).get("name"),
+            "base_branch": branch,
+            "upstream_head": (head.get("target") or {}).get("oid"),
+        }
+        with self._lock:
+            self._sessions[target_repo] = info
+        return info
+
+    def forget_session(self, target_repo: str) -> None:
+        with self._lock:
+            self._sessions.pop(target_repo, None)
+
+
+METADATA_CACHE_VERSION = 1
+# Seconds before an entry must be looked up (or revalidated) again, by key kind.
+METADATA_CACHE_TTLS = {"login": 24 * 3600, "fork": 24 * 3600, "default_branch": 24 * 3600, "head": 60}
+
+
+class MetadataCache:
+    """GitHub lookups that rarely change within a working session, persisted per token.
+
+    Entries live in ``<cache-dir>/github-metadata/<fingerprint>.json``, where the
+    fingerprint is a hash of the token (never the token itself), so switching
+    accounts never reuses another login's answers. Keys are ``login``,
+    ``fork:<target>``, ``default_branch:<target>`` and ``head:<target>:<branch>``;
+    each kind expires after its ``METADATA_CACHE_TTLS`` entry. An expired entry
+    keeps its ETag for a conditional revalidation.
+    """
+
+    def __init__(self, cache_root: Path, token: str) -> None:
+        fingerprint = hashlib.sha256(token.encode("utf-8")).hexdigest()[:16]
+        self.path = cache_root / "github-metadata" / f"{fingerprint}.json"
+        self._lock = threading.Lock()
+        try:
+            state = load_json(self.path)
+        except ValueError:
+            state = {}
+        entries = state.get("entries") if state.get("version") == METADATA_CACHE_VERSION else None
+        self.entries: Dict[str, Dict[str, Any]] = dict(entries) if isinstance(entries, dict) else {}
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self.entries.get(key)
+        if entry is None:
+            return None
+        if time.time() - float(entry.get("storedAt", 0)) > METADATA_CACHE_TTLS[key.split(":", 1)[0]]:
+            return None
+        return entry.get("value")
+
+    def etag(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self.entries.get(key) or {}
+        return entry.get("etag")
+
+    def put(self, key: str, value: Any, *, etag: Optional[str] = None) -> None:
+        with self._lock:
+            entry: Dict[str, Any] = {"value": value, "storedAt": time.time()}
+            if etag:
+                entry["etag"] = etag
+            self.entries[key] = entry
+
+    def touch(self, key: str) -> Optional[Any]:
+        """Mark a revalidated (304) entry fresh again and return its value."""
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            entry["storedAt"] = time.time()
+            return entry.get("value")
+
+    def save(self) -> None:
+        with self._lock:
+            state = {"version": METADATA_CACHE_VERSION, "entries": dict(self.entries)}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        write_json(self.path, state)
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self.entries.clear()
+        self.path.unlink(missing_ok=True)
+
+    def invalidate_on(self, error: BaseException) -> None:
+        # Any failed command may mean a cached answer is stale (deleted fork, revoked token, moved head).
+        if isinstance(error, CommandError):
+            self.invalidate()
+
+
+def open_metadata_cache(args: argparse.Namespace, *, api: Optional[GitHubApi] = None) -> Optional[MetadataCache]:
+    if not args.metadata_cache:
+        return None
+    token = api.token if api is not None else resolve_github_token()
+    return MetadataCache(Path(args.cache_dir).expanduser(), token)
+
+
+@timed_phase("ensure_fork_via_api")
+def ensure_fork_via_api(api: GitHubApi, target_repo: str, login: str) -> str:
+    target_repo_name = target_repo.split("/")[-1]
+    fork_repo = f"{login}/{target_repo_name}"
+    if api.session(target_repo)["fork_repo"] is not None:
+        return fork_repo
+    api.request("POST", f"/repos/{target_repo}/forks", {"default_branch_only": True})
+    api.forget_session(target_repo)
+    # Fork creation is asynchronous; wait until the repository is readable.
+    for delay in (1, 2, 4, 8, 15):
+        time.sleep(delay)
+        if api.request("GET", f"/repos/{fork_repo}", allow_not_found=True) is not None:
+            return fork_repo
+    raise RuntimeError(f"Fork repository was not ready in time: {fork_repo}")
+
+
+def resolve_github_identity(
+    target_repo: str,
+    base_branch: str = DEFAULT_BASE_BRANCH,
+    *,
+    create_fork: bool = True,
+    check_target: bool = False,
+    api: Optional[GitHubApi] = None,
+    cache: Optional[MetadataCache] = None,
+    limiter: Optional[RateLimiter] = None,
+) -> Tuple[str, str]:
+    """Return ``(login, fork_repo)``, checking auth and the fork only on a metadata cache miss.
+
+    ``check_target`` also confirms the target repository is readable.
+    """
+    if cache is not None:
+        login = cache.get("login")
+        fork_repo = cache.get(f"fork:{target_repo}")
+        target_known = not check_target or cache.get(f"default_branch:{target_repo}") is not None
+        if login and fork_repo and target_known:
+            return str(login), str(fork_repo)
+
+    default_branch: Optional[str] = None
+    if api is not None:
+        # The session query fails when the target repository is not readable.
+        login = lookup_login(target_repo, base_branch, api=api)
+        default_branch = api.session(target_repo)["default_branch"]
+    else:
+        ensure_gh_cli_and_auth()
+        if check_target:
+            login, default_branch = run_concurrently(
+                [
+                    ["gh", "api", "user", "--jq", ".login"],
+                    ["gh", "repo", "view", target_repo, "--json", "defaultBranchRef", "--jq", ".defaultBranchRef.name"],
+                ]
+            )
+        else:
+            login = lookup_login(target_repo, base_branch)
+
+    def check_fork() -> str:
+        return ensure_fork(target_repo, login, create_if_missing=create_fork, api=api)
+
+    fork_repo = limiter.call(check_fork) if limiter is not None else check_fork()
+    if cache is not None:
+        cache.put("login", login)
+        cache.put(f"fork:{target_repo}", fork_repo)
+        if default_branch:
+            cache.put(f"default_branch:{target_repo}", default_branch)
+        if api is not None:
+            session = api.session(target_repo, base_branch)
+            if session["upstream_head"]:
+                cache.put(f"head:{target_repo}:{base_branch}", session["upstream_head"])
+        cache.save()
+    return login, fork_repo
+
+
+def upstream_head(
+    api: GitHubApi,
+    target_repo: str,
+    base_branch: str,
+    *,
+    cache: Optional[MetadataCache] = None,
+) -> str:
+    """Return the upstream base branch head SHA, revalidating a cached value with its ETag."""
+    if cache is None:
+        head = api.session(target_repo, base_branch)["upstream_head"]
+    else:
+        key = f"head:{target_repo}:{base_branch}"
+        head = cache.get(key)
+        if head is None:
+            import urllib.parse
+
+            commit, etag = api.get_if_changed(
+                f"/repos/{target_repo}/commits/{urllib.parse.quote(base_branch, safe='')}", cache.etag(key)
+            )
+            if commit is None:
+                head = cache.touch(key)
+            else:
+                head = str(commit["sha"])
+                cache.put(key, head, etag=etag)
+            cache.save()
+    if not head:
+        raise RuntimeError(f"Base branch not found: {target_repo}@{base_branch}")
+    return str(head)
+
+
+def seed_staging_root_via_api(
+    api: GitHubApi,
+    staging_root: Path,
+    *,
+    target_repo: str,
+    base_sha: str,
+    paths: Sequence[str],
+) -> Dict[str, str]:
+    import base64
+    import urllib.parse
+
+    seeded: Dict[str, str] = {}
+    staging_root.mkdir(parents=True, exist_ok=True)
+    for relative_path in paths:
+        quoted_path = urllib.parse.quote(relative_path)
+        entry = api.request(
+            "GET",
+            f"/repos/{target_repo}/contents/{quoted_path}?ref={base_sha}",
+            allow_not_found=True,
+        )
+        if not isinstance(entry, dict) or entry.get("type") != "file":
+            continue
+        target = staging_root / relative_path
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_bytes(base64.b64decode(str(entry.get("content", ""))))
+        seeded[relative_path] = str(entry["sha"])
+    return seeded
+
+
+@timed_phase("commit_staged_tree_via_api")
+def commit_staged_tree_via_api(
+    api: GitHubApi,
+    *,
+    fork_repo: str,
+    staging_root: Path,
+    seeded: Dict[str, str],
+    base_sha: str,
+    base_tree: str,
+    branch_name: str,
+    message: str,
+    update_branch: bool = False,
+) -> str:
+    """Commit the staged files on ``base_sha`` and create ``branch_name``, or fast-forward it with ``update_branch``."""
+    import base64
+
+    tree_entries: List[Dict[str, object]] = []
+    for path in sorted(staging_root.rglob("*")):
+        if not path.is_file():
+            continue
+        relative_path = path.relative_to(staging_root).as_posix()
+        content = path.read_bytes()
+        if seeded.get(relative_path) == git_blob_sha(content):
+            continue
+        entry: Dict[str, object] = {"path": relative_path, "mode": "100644", "type": "blob"}
+        try:
+            entry["content"] = content.decode("utf-8")
+        except UnicodeDecodeError:
+            blob = api.request(
+                "POST",
+                f"/repos/{fork_repo}/git/blobs",
+                {"content": base64.b64encode(content).decode("ascii"), "encoding": "base64"},
+            )
+            entry["sha"] = blob["sha"]
+        tree_entries.append(entry)
+    if not tree_entries:
+        raise RuntimeError("No staged changes were found. Nothing to commit.")
+
+    tree = api.request("POST", f"/repos/{fork_repo}/git/trees", {"base_tree": base_tree, "tree": tree_entries})
+    commit = api.request(
+        "POST",
+        f"/repos/{fork_repo}/git/commits",
+        {"message": message, "tree": tree["sha"], "parents": [base_sha]},
+    )
+    commit_sha = str(commit["sha"])
+    if update_branch:
+        api.request("PATCH", f"/repos/{fork_repo}/git/refs/heads/{branch_name}", {"sha": commit_sha, "force": False})
+    else:
+        api.request("POST", f"/repos/{fork_repo}/git/refs", {"ref": f"refs/heads/{branch_name}", "sha": commit_sha})
+    return commit_sha
+
+
+@timed_phase("create_or_get_pr_via_api")
+def create_or_get_pr_via_api(
+    api: GitHubApi,
+    *,
+    target_repo: str,
+    base_branch: str,
+    login: str,
+    branch_name: str,
+    project_name: str,
+    team_name: str,
+    title: Optional[str] = None,
+    body: Optional[str] = None,
+) -> str:
+    import urllib.parse
+
+    head = urllib.parse.quote(f"{login}:{branch_name}", safe=":")
+    existing_prs = api.request("GET", f"/repos/{target_repo}/pulls?state=open&head={head}")
+    if isinstance(existing_prs, list) and existing_prs:
+        return str(existing_prs[0]["html_url"])
+
+    pr = api.request(
+        "POST",
+        f"/repos/{target_repo}/pulls",
+        {
+            "title": title or f"[Submission] {project_name}",
+            "head": f"{login}:{branch_name}",
+            "base": base_branch,
+            "body": body or build_pr_body(project_name=project_name, team_name=team_name),
+        },
+    )
+    return str(pr["html_url"])
+
+
+RATE_LIMIT_ERROR_PATTERN = re.compile(
+    r"rate limit|submitted too quickly|abuse detection|HTTP 429|HTTP 403: You have exceeded", re.IGNORECASE
+)
+
+
+class RateLimiter:
+    """GitHub rate-limit state shared by concurrent submissions.
+
+    The remaining quota comes from ``gh api rate_limit`` (refreshed every few
+    calls) or from response headers. A rate-limited call pauses every worker
+    with exponential backoff instead of failing the run.
+    """
+
+    def __init__(
+        self,
+        *,
+        refresh_every: int = 10,
+        min_remaining: int = 20,
+        backoff_seconds: float = 30.0,
+        max_attempts: int = 6,
+    ) -> None:
+        self.refresh_every = refresh_every
+        self.min_remaining = min_remaining
+        self.backoff_seconds = backoff_seconds
+        self.max_attempts = max_attempts
+        self.remaining: Optional[int] = None
+        self.reset_at = 0.0
+        self.paused_until = 0.0
+        self.calls_since_refresh = refresh_every
+        self._lock = threading.Lock()
+
+    def refresh(self) -> None:
+        output = run(["gh", "api", "rate_limit"], check=False)
+        try:
+            resources = json.loads(output)["resources"]
+        except (ValueError, KeyError, TypeError):
+            return
+        # gh pr list/create go through GraphQL; gh repo view and pushes count against core.
+        buckets = [resources[name] for name in ("core", "graphql") if isinstance(resources.get(name), dict)]
+        if buckets:
+            self.observe(
+                remaining=min(int(bucket.get("remaining", 0)) for bucket in buckets),
+                reset_at=max(float(bucket.get("reset", 0)) for bucket in buckets),
+            )
+
+    def observe(
+        self,
+        *,
+        remaining: Optional[int] = None,
+        reset_at: Optional[float] = None,
+        retry_after: Optional[float] = None,
+    ) -> None:
+        with self._lock:
+            if remaining is not None:
+                self.remaining = remaining
+                self.calls_since_refresh = 0
+            if reset_at is not None:
+                self.reset_at = reset_at
+            if retry_after is not None:
+                self.paused_until = max(self.paused_until, time.time() + retry_after)
+                self.calls_since_refresh = self.refresh_every
+
+    def observe_headers(self, headers: Any) -> None:
+        remaining = headers.get("X-RateLimit-Remaining")
+        reset_at = headers.get("X-RateLimit-Reset")
+        retry_after = headers.get("Retry-After")
+        self.observe(
+            remaining=int(remaining) if remaining is not None else None,
+            reset_at=float(reset_at) if reset_at is not None else None,
+            retry_after=float(retry_after) if retry_after is not None else None,
+        )
+
+    def wait(self) -> None:
+        with self._lock:
+            self.calls_since_refresh += 1
+            needs_refresh = self.calls_since_refresh > self.refresh_every
+        if needs_refresh:
+            self.refresh()
+        with self._lock:
+            resume_at = self.paused_until
+            if self.remaining is not None and self.remaining <= self.min_remaining:
+                resume_at = max(resume_at, self.reset_at + 1)
+                # Assume the window resets; the next call refreshes the real quota.
+                self.remaining = None
+                self.calls_since_refresh = self.refresh_every
+        delay = resume_at - time.time()
+        if delay > 0:
+            print(f"[WAIT] GitHub rate limit: pausing {delay:.0f}s.", file=sys.stderr)
+            time.sleep(delay)
+
+    def call(self, func: Callable[[], str]) -> str:
+        attempt = 0
+        while True:
+            self.wait()
+            try:
+                return func()
+            except CommandError as error:
+                attempt += 1
+                if attempt >= self.max_attempts or not RATE_LIMIT_ERROR_PATTERN.search(str(error)):
+                    raise
+                self.observe(retry_after=self.backoff_seconds * 2 ** (attempt - 1))
+
+
+class ProgressLedger:
+    """Append-only JSONL record of per-team progress so an interrupted batch can resume."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.entries: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        if path.exists():
+            with path.open("r", encoding="utf-8") as file:
+                for line in file:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # a line cut short by an interruption
+                    if isinstance(entry, dict) and "key" in entry:
+                        self.entries[str(entry["key"])] = entry
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            return self.entries.get(key)
+
+    def record(self, key: str, status: str, **fields: Any) -> None:
+        entry = {"key": key, "status": status, **fields, "at": dt.datetime.now(KST).isoformat()}
+        line = json.dumps(entry, ensure_ascii=False) + "\n"
+        with self._lock:
+            self.entries[key] = entry
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as file:
+                file.write(line)
+                file.flush()
+                os.fsync(file.fileno())
+
+
+class SubmissionProgress:
+    """How far one submission got, so a failure can still report commit and branch."""
+
+    __slots__ = (
+        "branch_name",
+        "local_branch",
+        "repo_path",
+        "commit_sha",
+        "pr_url",
+        "existing_pr",
+        "doc_path",
+        "team_card_path",
+        "changes",
+    )
+
+    def __init__(self, branch_name: str) -> None:
+        # branch_name is the fork branch the PR uses; it differs from local_branch when an open PR is reused.
+        self.branch_name = branch_name
+        self.local_branch = branch_name
+        # "" for a new PR; "up_to_date" or "updated" when an open PR for the same submission was found.
+        self.existing_pr = ""
+        self.repo_path: Optional[Path] = None
+        self.commit_sha: Optional[str] = None
+        self.pr_url: Optional[str] = None
+        self.doc_path: Optional[Path] = None
+        self.team_card_path: Optional[Path] = None
+        self.changes = ArtifactChanges()
+
+
+def submit_via_git(
+    args: argparse.Namespace,
+    spec: SubmissionSpec,
+    progress: SubmissionProgress,
+    *,
+    target_repo: str,
+    login: str,
+    fork_repo: str,
+    temp_dir: Path,
+    limiter: Optional[RateLimiter] = None,
+    on_pushed: Optional[Callable[[SubmissionProgress], None]] = None,
+    api: Optional[GitHubApi] = None,
+) -> None:
+    import shutil
+
+    team_slug = spec.team_slug
+    project_slug = spec.project_slug
+    branch_name = progress.branch_name
+    cache_root = Path(args.cache_dir).expanduser() if args.git_cache else None
+    base_ref = f"upstream/{args.base_branch}"
+
+    def checkout() -> Tuple[Path, Path]:
+        if args.plumbing_commit:
+            repo_path = progress.repo_path = prepare_object_store(
+                temp_root=temp_dir,
+                target_repo=target_repo,
+                base_branch=args.base_branch,
+                fork_repo=fork_repo,
+                cache_root=cache_root,
+            )
+            render_root = seed_staging_root(
+                repo_path,
+                temp_dir / "staging",
+                base_ref=base_ref,
+                paths=submission_target_paths(team_slug, project_slug),
+            )
+        else:
+            repo_path = progress.repo_path = prepare_git_checkout(
+                temp_root=temp_dir,
+                target_repo=target_repo,
+                base_branch=args.base_branch,
+                fork_repo=fork_repo,
+                branch_name=branch_name,
+                sparse=args.sparse_checkout,
+                cache_root=cache_root,
+            )
+            render_root = repo_path
+        ensure_git_identity(repo_path)
+        return repo_path, render_root
+
+    def find_pr() -> Optional[Tuple[str, str]]:
+        return find_open_submission_pr(
+            target_repo=target_repo,
+            base_branch=args.base_branch,
+            login=login,
+            team_slug=team_slug,
+            project_slug=project_slug,
+            api=api,
+        )
+
+    stage_root = temp_dir / "rendered"
+    repo_path, render_root = stage_during_checkout(checkout, stage_root, spec)
+    # A re-run while the previous PR is still open builds on that PR's branch instead of opening another one.
+    existing = limiter.call(find_pr) if limiter is not None else find_pr()
+    if existing is not None:
+        existing_branch, existing_url = existing
+        if not args.update:
+            raise FileExistsError(
+                f"An open submission PR already exists: {existing_url}. Re-run with --update to add a commit to it."
+            )
+        existing_sha = fetch_fork_branch(repo_path, existing_branch)
+        if args.plumbing_commit:
+            shutil.rmtree(render_root)
+            seed_staging_root(
+                repo_path, render_root, base_ref=existing_sha, paths=submission_target_paths(team_slug, project_slug)
+            )
+            base_ref = existing_sha
+        else:
+            run(["git", "checkout", "-B", branch_name, existing_sha], cwd=repo_path)
+    progress.doc_path, progress.team_card_path = merge_staged_submission(
+        stage_root,
+        render_root,
+        spec,
+        update_existing=args.update,
+        changes=progress.changes,
+    )
+    if not progress.changes.paths:
+        if existing is not None:
+            progress.branch_name = existing_branch
+            progress.commit_sha = existing_sha
+            progress.pr_url = existing_url
+            progress.existing_pr = "up_to_date"
+        return
+
+    if args.plumbing_commit:
+        progress.commit_sha = commit_staged_tree(
+            repo_path,
+            staging_root=render_root,
+            base_ref=base_ref,
+            branch_name=branch_name,
+            message=build_commit_message(
+                team_slug=team_slug,
+                project_slug=project_slug,
+                project_name=spec.project_name,
+                team_name=spec.team_name,
+            ),
+        )
+    else:
+        progress.commit_sha = commit_changes(
+            repo_path,
+            team_slug=team_slug,
+            project_slug=project_slug,
+            project_name=spec.project_name,
+            team_name=spec.team_name,
+        )
+
+    if existing is not None:
+        # The new commit sits on top of the PR head, so this is a plain fast-forward push.
+        progress.branch_name = existing_branch
+        push_branch(repo_path, branch_name, base_branch=args.base_branch, remote_branch=existing_branch)
+        progress.existing_pr = "updated"
+        if on_pushed is not None:
+            on_pushed(progress)
+        progress.pr_url = existing_url
+        return
+
+    push_branch(repo_path, branch_name, base_branch=args.base_branch)
+    if on_pushed is not None:
+        on_pushed(progress)
 
+    def open_pr() -> str:
+        return create_or_get_pr(
+            target_repo=target_repo,
+            base_branch=args.base_branch,
+            login=login,
+            branch_name=branch_name,
+            project_name=spec.project_name,
+            team_name=spec.team_name,
+            api=api,
+        )
 
-def ensure_git_identity(repo_path: Path) -> None:
-    name = run(["git", "config", "--get", "user.name"], cwd=repo_path, check=False)
-    email = run(["git", "config", "--get", "user.email"], cwd=repo_path, check=False)
-    if name and email:
-        return
-    raise RuntimeError(
-        "Git user identity is missing. Set user.name and user.email before running this script."
+    progress.pr_url = limiter.call(open_pr) if limiter is not None else open_pr()
+
+
+def default_ledger_path(args: argparse.Namespace) -> Path:
+    if args.ledger:
+        return Path(args.ledger)
+    if args.manifest == "-":
+        raise ValueError("--batch-submit with --manifest - requires --ledger.")
+    return Path(f"{args.manifest}.ledger.jsonl")
+
+
+def run_manifest_submission(args: argparse.Namespace, *, target_repo: str) -> int:
+    import shutil
+    import tempfile
+    from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+    ledger = ProgressLedger(default_ledger_path(args))
+    limiter = RateLimiter()
+    api = open_github_client(args, limiter=limiter)
+    cache = open_metadata_cache(args, api=api)
+    login, fork_repo = resolve_github_identity(
+        target_repo, args.base_branch, api=api, cache=cache, limiter=limiter
     )
+    media = open_media_fetcher(args)
+    temp_root = Path(tempfile.mkdtemp(prefix="hackathon-submission-batch-"))
+    counts = {"submitted": 0, "up_to_date": 0, "skipped": 0, "failed": 0}
+    claimed_slugs: Dict[str, int] = {}
 
+    def submit_row(row_number: int, spec: SubmissionSpec) -> Tuple[str, str]:
+        key = f"{spec.team_slug}/{spec.project_slug}"
+        previous = ledger.get(key) or {}
+        if (previous.get("status") == "pushed" or previous.get("pushed")) and previous.get("branch"):
+            # Interrupted or failed between push and PR: the branch is already on the fork.
+            branch_name = str(previous["branch"])
+            pushed = {"row": row_number, "branch": branch_name, "commit": previous.get("commit")}
+            try:
+                pr_url = limiter.call(
+                    lambda: create_or_get_pr(
+                        target_repo=target_repo,
+                        base_branch=args.base_branch,
+                        login=login,
+                        branch_name=branch_name,
+                        project_name=spec.project_name,
+                        team_name=spec.team_name,
+                        api=api,
+                    )
+                )
+            except Exception as error:
+                ledger.record(key, "failed", pushed=True, error=str(error), **pushed)
+                raise
+            ledger.record(key, "submitted", pr_url=pr_url, **pushed)
+            return "submitted", pr_url
 
-def commit_changes(repo_path: Path, *, team_slug: str, project_slug: str, project_name: str, team_name: str) -> str:
-    run(
-        ["git", "add", "contents/docs/meta.json", "contents/docs/vibe-coding", "contents/team"],
-        cwd=repo_path,
+        if media is not None:
+            spec = media.attach(spec)
+        progress = SubmissionProgress(create_branch_name(spec.team_slug, spec.project_slug))
+        temp_dir = temp_root / f"row-{row_number}"
+        temp_dir.mkdir()
+        try:
+            submit_via_git(
+                args,
+                spec,
+                progress,
+                target_repo=target_repo,
+                login=login,
+                fork_repo=fork_repo,
+                temp_dir=temp_dir,
+                limiter=limiter,
+                api=api,
+                on_pushed=lambda pushed: ledger.record(
+                    key, "pushed", row=row_number, branch=pushed.branch_name, commit=pushed.commit_sha
+                ),
+            )
+        except Exception as error:
+            ledger.record(
+                key,
+                "failed",
+                row=row_number,
+                branch=progress.branch_name,
+                commit=progress.commit_sha,
+                pushed=(ledger.get(key) or {}).get("status") == "pushed",
+                error=str(error),
+            )
+            raise
+        finally:
+            if not args.keep_temp:
+                if progress.repo_path is not None:
+                    release_git_checkout(progress.repo_path, progress.local_branch)
+                shutil.rmtree(temp_dir, ignore_errors=True)
+        if progress.pr_url is None:
+            ledger.record(key, "up_to_date", row=row_number)
+            return "up_to_date", "already up to date"
+        if progress.existing_pr == "up_to_date":
+            ledger.record(key, "up_to_date", row=row_number, branch=progress.branch_name, pr_url=progress.pr_url)
+            return "up_to_date", f"{progress.pr_url} (open PR already up to date)"
+        ledger.record(
+            key,
+            "submitted",
+            row=row_number,
+            branch=progress.branch_name,
+            commit=progress.commit_sha,
+            pr_url=progress.pr_url,
+        )
+        return "submitted", progress.pr_url
+
+    def report(row_number: int, future: Future) -> None:
+        try:
+            status, detail = future.result()
+        except Exception as error:
+            counts["failed"] += 1
+            print(f"[ERROR] Row {row_number}: {error}", file=sys.stderr)
+            if cache is not None:
+                cache.invalidate_on(error)
+            return
+        counts[status] += 1
+        print(f"[OK] Row {row_number}: {detail}")
+
+    try:
+        concurrency = max(1, args.concurrency)
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            in_flight: Dict[Future, int] = {}
+            for row_number, row in iter_manifest_rows(args.manifest, format_name=args.manifest_format):
+                try:
+                    spec = SubmissionSpec.from_mapping(row)
+                except ValueError as error:
+                    counts["failed"] += 1
+                    print(f"[ERROR] Row {row_number}: {error}", file=sys.stderr)
+                    continue
+                if spec.project_slug in claimed_slugs:
+                    counts["failed"] += 1
+                    print(
+                        f"[ERROR] Row {row_number}: Project slug '{spec.project_slug}' is already used by row "
+                        f"{claimed_slugs[spec.project_slug]}.",
+                        file=sys.stderr,
+                    )
+                    continue
+                claimed_slugs[spec.project_slug] = row_number
+                previous = ledger.get(f"{spec.team_slug}/{spec.project_slug}") or {}
+                if previous.get("status") in {"submitted", "up_to_date"}:
+                    counts["skipped"] += 1
+                    print(f"[SKIP] Row {row_number}: {previous.get('pr_url') or previous['status']} (ledger)")
+                    continue
+                if media is not None:
+                    media.prefetch(spec)
+                if len(in_flight) >= concurrency * 2:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        report(in_flight.pop(future), future)
+                in_flight[pool.submit(submit_row, row_number, spec)] = row_number
+            for future in wait(in_flight).done:
+                report(in_flight[future], future)
+    finally:
+        if media is not None:
+            media.close()
+        if args.keep_temp:
+            print(f"[INFO] Temporary directory kept: {temp_root}")
+        else:
+            shutil.rmtree(temp_root, ignore_errors=True)
+
+    print(
+        f"[OK] Batch submission completed: {counts['submitted']} submitted, {counts['up_to_date']} up to date, "
+        f"{counts['skipped']} skipped (ledger), {counts['failed']} failed."
     )
-    staged = run(["git", "status", "--short"], cwd=repo_path)
-    if not staged:
-        raise RuntimeError("No staged changes were found. Nothing to commit.")
+    print(f"[OK] Progress ledger: {ledger.path}")
+    print_asset_report()
+    return 1 if counts["failed"] else 0
 
-    commit_message = "\n".join(
+
+def build_batch_commit_message(submitted: Sequence[SubmissionSpec]) -> str:
+    lines = [
+        f"docs(submission): add {len(submitted)} team result documents",
+        "",
+        "What:",
+    ]
+    lines.extend(f"- {spec.team_name}: {result_document_relpath(spec.project_slug)}" for spec in submitted)
+    lines.extend(
         [
-            f"docs(submission): add {project_name} result document",
-            "",
-            "Why:",
-            "- 해카톤 제출 준비/제출 요건을 단일 결과 문서로 공개하기 위해",
-            "",
-            "What:",
-            f"- contents/docs/vibe-coding/{project_slug}.mdx 생성",
-            f"- contents/team/{TEAM_SUBMISSION_FILE_PREFIX}-{team_slug}-{project_slug}.mdx 카드 데이터 생성",
-            "- 제출용 assets 안내 파일 및 docs/team meta 데이터 갱신",
             "",
             "Verify:",
-            "- create_submission_pr.py frontmatter/섹션 검증 통과",
-            "- 중복 생성 방지 규칙과 경로 생성 규칙 점검",
-            "",
-            "AI:",
-            f"- AI 도구를 사용해 초안을 생성하고, 최종 스크립트 동작은 {team_name} 팀 제출 흐름 기준으로 검증",
+            "- create_submission_pr.py frontmatter/섹션 검증 통과 (팀별)",
         ]
     )
-    run(["git", "commit", "-m", commit_message], cwd=repo_path)
-    return run(["git", "rev-parse", "HEAD"], cwd=repo_path)
+    return "\n".join(lines)
 
 
-def create_or_get_pr(
-    *,
-    repo_path: Path,
-    target_repo: str,
-    base_branch: str,
-    login: str,
-    branch_name: str,
-    project_name: str,
-    team_name: str,
-) -> str:
-    run(["git", "push", "--set-upstream", "origin", branch_name], cwd=repo_path)
+def build_batch_pr_body(submitted: Sequence[SubmissionSpec]) -> str:
+    def cell(value: str) -> str:
+        return value.replace("|", "\\|").replace("\n", " ")
 
-    existing_pr = run(
-        [
-            "gh",
-            "pr",
-            "list",
-            "--repo",
-            target_repo,
-            "--state",
-            "open",
-            "--head",
-            f"{login}:{branch_name}",
-            "--json",
-            "url",
-            "--jq",
-            ".[0].url",
-        ]
+    lines = [
+        f"Teams: {len(submitted)}",
+        "",
+        "| # | Team | Project | Result document | Team card |",
+        "| --- | --- | --- | --- | --- |",
+    ]
+    lines.extend(
+        f"| {index} | {cell(spec.team_name)} | {cell(spec.project_name)} | "
+        f"`{result_document_relpath(spec.project_slug)}` | `{team_card_relpath(spec.team_slug, spec.project_slug)}` |"
+        for index, spec in enumerate(submitted, start=1)
     )
-    if existing_pr:
-        return existing_pr
-
-    pr_title = f"[Submission] {project_name}"
-    pr_body = "\n".join(
+    lines.extend(
         [
-            f"Team: {team_name}",
-            f"Project: {project_name}",
-            "",
-            "Why:",
-            "- 해카톤 제출 결과 문서를 공개 저장소에 등록합니다.",
-            "",
-            "What:",
-            "- vibecoding-result.mdx 및 제출 assets 구조를 생성/갱신했습니다.",
             "",
             "Verify:",
             "- frontmatter 필수 필드 검증",
@@ -562,40 +3698,207 @@ def create_or_get_pr(
             "- docs meta.json 네비게이션 반영 검증",
         ]
     )
-    pr_url = run(
-        [
-            "gh",
-            "pr",
-            "create",
-            "--repo",
-            target_repo,
-            "--base",
-            base_branch,
-            "--head",
-            f"{login}:{branch_name}",
-            "--title",
-            pr_title,
-            "--body",
-            pr_body,
-        ]
-    )
-    return pr_url.strip().splitlines()[-1]
+    return "\n".join(lines)
+
+
+def run_manifest_single_pr(args: argparse.Namespace, *, target_repo: str) -> int:
+    import shutil
+    import tempfile
+
+    if args.commit_per_team and args.plumbing_commit:
+        raise ValueError("--commit-per-team needs a working tree; it cannot be combined with --plumbing-commit.")
+
+    specs: List[Tuple[int, SubmissionSpec]] = []
+    claimed_slugs: Dict[str, int] = {}
+    failed = 0
+    for row_number, row in iter_manifest_rows(args.manifest, format_name=args.manifest_format):
+        try:
+            spec = SubmissionSpec.from_mapping(row)
+        except ValueError as error:
+            failed += 1
+            print(f"[ERROR] Row {row_number}: {error}", file=sys.stderr)
+            continue
+        errors = validate(spec)
+        if spec.project_slug in claimed_slugs:
+            errors.append(
+                f"Project slug '{spec.project_slug}' is already used by row {claimed_slugs[spec.project_slug]}."
+            )
+        if errors:
+            failed += 1
+            print(f"[ERROR] Row {row_number}: {'; '.join(errors)}", file=sys.stderr)
+            continue
+        claimed_slugs[spec.project_slug] = row_number
+        specs.append((row_number, spec))
+
+    media = open_media_fetcher(args)
+    if media is not None:
+        try:
+            for _, spec in specs:
+                media.prefetch(spec)
+            specs = [(row_number, media.attach(spec)) for row_number, spec in specs]
+        finally:
+            media.close()
+
+    manifest_name = "stdin" if args.manifest == "-" else Path(args.manifest).stem
+    temp_dir = Path(tempfile.mkdtemp(prefix="hackathon-submission-single-pr-"))
+    repo_path: Optional[Path] = None
+    login: Optional[str] = None
+    branch_name: Optional[str] = None
+    commit_sha: Optional[str] = None
+    cache: Optional[MetadataCache] = None
+    try:
+        api = open_github_client(args)
+        cache = open_metadata_cache(args, api=api)
+        login, fork_repo = resolve_github_identity(target_repo, args.base_branch, api=api, cache=cache)
+        branch_name = create_branch_name("batch", slugify(manifest_name))
+        cache_root = Path(args.cache_dir).expanduser() if args.git_cache else None
+        base_ref = f"upstream/{args.base_branch}"
+        if args.plumbing_commit:
+            repo_path = prepare_object_store(
+                temp_root=temp_dir,
+                target_repo=target_repo,
+                base_branch=args.base_branch,
+                fork_repo=fork_repo,
+                cache_root=cache_root,
+            )
+            target_paths = dict.fromkeys(
+                path for _, spec in specs for path in submission_target_paths(spec.team_slug, spec.project_slug)
+            )
+            render_root = seed_staging_root(repo_path, temp_dir / "staging", base_ref=base_ref, paths=list(target_paths))
+        else:
+            repo_path = prepare_git_checkout(
+                temp_root=temp_dir,
+                target_repo=target_repo,
+                base_branch=args.base_branch,
+                fork_repo=fork_repo,
+                branch_name=branch_name,
+                sparse=args.sparse_checkout,
+                cache_root=cache_root,
+            )
+            render_root = repo_path
+        ensure_git_identity(repo_path)
+
+        template = default_template()
+        docs_root = render_root / "contents" / "docs"
+        meta_index = MetaIndexWriter()
+        submitted: List[SubmissionSpec] = []
+        for row_number, spec in specs:
+            changes = ArtifactChanges()
+            # Each row renders into its own staging dir and is merged only once it fully succeeds,
+            # so a rejected row never leaves files behind in the shared tree.
+            stage_root = temp_dir / "rows" / f"row-{row_number}"
+            try:
+                create_submission_artifacts(
+                    stage_root, spec, update_existing=True, template=template, update_meta=False
+                )
+                created_doc, _ = merge_staged_submission(
+                    stage_root,
+                    render_root,
+                    spec,
+                    update_existing=args.update,
+                    update_meta=args.commit_per_team,
+                    changes=changes,
+                )
+            except Exception as error:
+                failed += 1
+                print(f"[ERROR] Row {row_number}: {error}", file=sys.stderr)
+                continue
+            finally:
+                shutil.rmtree(stage_root, ignore_errors=True)
+            if not args.commit_per_team:
+                add_submission_meta_pages(meta_index, docs_root, spec.project_slug)
+            if not changes.paths:
+                print(f"[OK] Row {row_number}: already up to date")
+                continue
+            if args.commit_per_team:
+                commit_changes(
+                    repo_path,
+                    team_slug=spec.team_slug,
+                    project_slug=spec.project_slug,
+                    project_name=spec.project_name,
+                    team_name=spec.team_name,
+                )
+            submitted.append(spec)
+            print(f"[OK] Row {row_number}: {created_doc.relative_to(render_root).as_posix()}")
+
+        if not submitted:
+            print("[OK] All submissions are already up to date; no commit, push or PR was created.")
+            return 1 if failed else 0
+
+        if args.commit_per_team:
+            commit_sha = run(["git", "rev-parse", "HEAD"], cwd=repo_path)
+        else:
+            meta_index.flush()
+            message = build_batch_commit_message(submitted)
+            if args.plumbing_commit:
+                commit_sha = commit_staged_tree(
+                    repo_path,
+                    staging_root=render_root,
+                    base_ref=base_ref,
+                    branch_name=branch_name,
+                    message=message,
+                )
+            else:
+                commit_sha = commit_worktree(repo_path, message)
+        push_branch(repo_path, branch_name, base_branch=args.base_branch)
+        pr_url = create_or_get_pr(
+            target_repo=target_repo,
+            base_branch=args.base_branch,
+            login=login,
+            branch_name=branch_name,
+            project_name=manifest_name,
+            team_name=f"{len(submitted)} teams",
+            title=f"[Submission] {len(submitted)} teams ({manifest_name})",
+            body=build_batch_pr_body(submitted),
+            api=api,
+        )
+
+        print(f"[OK] Aggregated submission PR created for {len(submitted)} team(s); {failed} row(s) failed.")
+        print(f"[OK] Commit SHA: {commit_sha}")
+        print(f"[OK] Branch: {branch_name}")
+        print(f"[OK] PR URL: {pr_url}")
+        print_asset_report()
+        return 1 if failed else 0
+    except Exception as error:
+        print(f"[ERROR] {error}", file=sys.stderr)
+        if cache is not None:
+            cache.invalidate_on(error)
+        if login and branch_name:
+            compare_url = (
+                f"https://github.com/{target_repo}/compare/"
+                f"{args.base_branch}...{login}:{branch_name}?expand=1"
+            )
+            print("[FALLBACK] PR 자동 생성 실패 시 아래 정보를 사용하세요.", file=sys.stderr)
+            if commit_sha:
+                print(f"[FALLBACK] Commit SHA: {commit_sha}", file=sys.stderr)
+            print(f"[FALLBACK] Branch: {branch_name}", file=sys.stderr)
+            print(f"[FALLBACK] Manual PR URL: {compare_url}", file=sys.stderr)
+        return 1
+    finally:
+        if args.keep_temp:
+            print(f"[INFO] Temporary directory kept: {temp_dir}")
+        else:
+            if repo_path is not None:
+                release_git_checkout(repo_path, branch_name)
+            shutil.rmtree(temp_dir, ignore_errors=True)
 
 
 def parser() -> argparse.ArgumentParser:
+    import argparse
+
     p = argparse.ArgumentParser(
         description=(
             "Generate hackathon submission docs and open a fork-based PR "
             f"to fixed upstream {DEFAULT_TARGET_REPO_URL}."
         )
     )
-    p.add_argument("--team-name", required=True)
-    p.add_argument("--project-name", required=True)
-    p.add_argument("--repo-url", required=True)
-    p.add_argument("--demo-url-or-run-method", required=True)
-    p.add_argument("--problem-definition", required=True)
-    p.add_argument("--one-liner", required=True)
-    p.add_argument("--team-roles", required=True)
+    p.add_argument("--team-name")
+    p.add_argument("--project-name")
+    p.add_argument("--repo-url")
+    p.add_argument("--demo-url-or-run-method")
+    p.add_argument("--problem-definition")
+    p.add_argument("--one-liner")
+    p.add_argument("--team-roles")
 
     p.add_argument("--solution", default="")
     p.add_argument("--tech-stack", default="")
@@ -612,72 +3915,258 @@ def parser() -> argparse.ArgumentParser:
     p.add_argument("--team-image-url", default="")
     p.add_argument("--submitted-at", default="")
     p.add_argument("--team-order", type=int, default=None)
+    p.add_argument(
+        "--asset",
+        dest="assets",
+        action="append",
+        default=None,
+        metavar="KIND=PATH",
+        help=(
+            f"Copy a local file into assets/<project-slug>/KIND/ (KIND is one of {', '.join(ASSET_READMES)}). "
+            "Repeatable; manifests use an 'assets' column/field with entries separated by ';'."
+        ),
+    )
+    p.add_argument(
+        "--fetch-media",
+        action="store_true",
+        help=(
+            "Download the files behind --team-image-url (into assets/<project-slug>/team) and "
+            "--demo-url-or-run-method/--project-url (into assets/<project-slug>/demo) when they point at "
+            "images, video, audio or PDFs. Downloads resume, are checksum-verified and are cached under --cache-dir."
+        ),
+    )
+    p.add_argument(
+        "--media-concurrency",
+        type=int,
+        default=DEFAULT_MEDIA_CONCURRENCY,
+        help=f"Maximum simultaneous --fetch-media downloads for the whole run (default: {DEFAULT_MEDIA_CONCURRENCY}).",
+    )
+    p.add_argument(
+        "--max-asset-mb",
+        type=int,
+        default=DEFAULT_MAX_ASSET_MB,
+        help="Reject any single asset larger than this many MiB before anything is staged.",
+    )
+    p.add_argument(
+        "--max-assets-total-mb",
+        type=int,
+        default=DEFAULT_MAX_ASSETS_TOTAL_MB,
+        help="Reject a submission whose assets add up to more than this many MiB.",
+    )
 
     p.add_argument("--base-branch", default=DEFAULT_BASE_BRANCH)
     p.add_argument("--update", action="store_true")
     p.add_argument("--keep-temp", action="store_true")
     p.add_argument(
-        "--github-dry-run",
+        "--github-dry-run",
+        action="store_true",
+        help="Validate GitHub path (auth/fork/clone/render) without push, commit, or PR creation.",
+    )
+    p.add_argument(
+        "--no-clone",
+        action="store_true",
+        help=(
+            "With --github-dry-run, skip the clone: read the upstream head with git ls-remote, fetch only "
+            "meta.json and the target paths (blob-less fetch, or the API with --http-api) and report the "
+            "planned file changes and conflicts."
+        ),
+    )
+    p.add_argument(
+        "--sparse-checkout",
+        action="store_true",
+        help=(
+            "Use a shallow, blob-less clone with sparse-checkout limited to "
+            f"{' and '.join(SPARSE_CHECKOUT_PATHS)}."
+        ),
+    )
+    p.add_argument(
+        "--plumbing-commit",
+        action="store_true",
+        help=(
+            "Build the submission commit directly in the object database on top of "
+            "upstream/<base> (no working tree checkout) and push that branch."
+        ),
+    )
+    p.add_argument(
+        "--api-submit",
+        action="store_true",
+        help=(
+            "Submit without cloning: read upstream files and create the tree, commit, "
+            "branch and PR through the GitHub REST API (honors GITHUB_API_URL)."
+        ),
+    )
+    p.add_argument(
+        "--http-api",
+        action="store_true",
+        help=(
+            "Look up the login and fork and open the PR through a built-in keep-alive HTTP "
+            "client (one GraphQL query for the lookups) instead of per-call gh subprocesses. "
+            "Uses GH_TOKEN/GITHUB_TOKEN or the gh token; honors GITHUB_API_URL."
+        ),
+    )
+    p.add_argument(
+        "--git-cache",
+        action="store_true",
+        help=(
+            "Reuse a persistent bare mirror of upstream and the fork under --cache-dir; "
+            "each run fetches incrementally and checks out a git worktree."
+        ),
+    )
+    p.add_argument(
+        "--cache-dir",
+        default=str(DEFAULT_CACHE_DIR),
+        help=(
+            "Cache directory for --git-cache, --slug-index, --metadata-cache and --fetch-media "
+            f"(default: {DEFAULT_CACHE_DIR})."
+        ),
+    )
+    p.add_argument(
+        "--metadata-cache",
+        action="store_true",
+        help=(
+            "Reuse the login, fork, default branch and upstream head looked up by earlier runs "
+            "(stored per token under --cache-dir, with TTLs; cleared on any failed command)."
+        ),
+    )
+    p.add_argument(
+        "--slug-index",
+        metavar="CHECKOUT",
+        help=(
+            "Check the project slug against an existing checkout or bare git mirror of the target "
+            "repository before any network work. With --git-cache the cached mirror is used automatically."
+        ),
+    )
+    p.add_argument(
+        "--render-only-dir",
+        help="Render docs into this local directory and skip all GitHub actions.",
+    )
+    p.add_argument(
+        "--serve",
+        metavar="ADDRESS",
+        help=(
+            "Run a local preview service that renders and validates submissions in memory "
+            "(HOST:PORT, :PORT or unix:/path/to.sock)."
+        ),
+    )
+    p.add_argument(
+        "--validate-tree",
+        metavar="CHECKOUT",
+        help=(
+            "Validate existing contents/docs/vibe-coding/*.mdx and contents/team/*.mdx in this "
+            "checkout and print one JSON result line per file (no submission fields needed)."
+        ),
+    )
+    p.add_argument(
+        "--changed-since",
+        metavar="REF",
+        help="With --validate-tree, only check files changed relative to this git ref (plus untracked files).",
+    )
+    p.add_argument(
+        "--timings",
+        action="store_true",
+        help="Print per-phase timings and subprocess counts to stderr when the run ends.",
+    )
+    p.add_argument("--timings-file", help="Write the timing summary as JSON to this path.")
+    p.add_argument(
+        "--profile",
+        help="Write cProfile stats for the render path to this path (use --jobs 1 with --manifest).",
+    )
+    p.add_argument(
+        "--manifest",
+        help=(
+            "Render every submission row from a CSV/JSONL manifest ('-' for JSONL on stdin) "
+            "in one run (requires --render-only-dir; submission fields are read from each row)."
+        ),
+    )
+    p.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Worker processes for --manifest rendering and --validate-tree (default: CPU count).",
+    )
+    p.add_argument(
+        "--manifest-format",
+        choices=["csv", "jsonl"],
+        help="Manifest format (default: from file suffix; '-' reads JSONL from stdin).",
+    )
+    p.add_argument(
+        "--batch-submit",
+        action="store_true",
+        help="With --manifest, open one fork PR per row (honours --git-cache, --sparse-checkout, --plumbing-commit).",
+    )
+    p.add_argument(
+        "--single-pr",
+        action="store_true",
+        help="With --manifest, render every row into one checkout and open a single PR with a summary table.",
+    )
+    p.add_argument(
+        "--commit-per-team",
         action="store_true",
-        help="Validate GitHub path (auth/fork/clone/render) without push, commit, or PR creation.",
+        help="With --single-pr, create one commit per team instead of one commit for the whole batch.",
     )
     p.add_argument(
-        "--render-only-dir",
-        help="Render docs into this local directory and skip all GitHub actions.",
+        "--concurrency",
+        type=int,
+        default=4,
+        help="Submissions in flight at once for --batch-submit (default: 4).",
+    )
+    p.add_argument(
+        "--ledger",
+        help="Progress ledger for --batch-submit (default: <manifest>.ledger.jsonl); re-runs skip finished rows.",
+    )
+    p.add_argument(
+        "--results-jsonl",
+        help="Stream one JSON result line per manifest row to this file ('-' for stdout).",
     )
     return p
 
 
-def run_github_dry_run(
-    args: argparse.Namespace,
-    *,
-    target_repo: str,
-    team_slug: str,
-    project_slug: str,
-) -> int:
+def run_github_dry_run(args: argparse.Namespace, spec: SubmissionSpec, *, target_repo: str) -> int:
+    import shutil
+    import tempfile
+
+    team_slug = spec.team_slug
+    project_slug = spec.project_slug
     temp_dir = Path(tempfile.mkdtemp(prefix="hackathon-submission-gh-dry-run-"))
+    repo_path: Optional[Path] = None
     login: Optional[str] = None
     branch_name: Optional[str] = None
+    cache: Optional[MetadataCache] = None
     try:
-        ensure_gh_cli_and_auth()
-        login = run(["gh", "api", "user", "--jq", ".login"])
-        run(["gh", "repo", "view", target_repo])
-        fork_repo = ensure_fork(target_repo, login, create_if_missing=False)
+        api = open_github_client(args)
+        cache = open_metadata_cache(args, api=api)
+        login, fork_repo = resolve_github_identity(
+            target_repo,
+            args.base_branch,
+            create_fork=False,
+            check_target=True,
+            api=api,
+            cache=cache,
+        )
 
         branch_name = create_branch_name(team_slug, project_slug)
-        repo_path = prepare_git_checkout(
-            temp_root=temp_dir,
-            target_repo=target_repo,
-            base_branch=args.base_branch,
-            fork_repo=fork_repo,
-            branch_name=branch_name,
+        stage_root = temp_dir / "rendered"
+        repo_path = stage_during_checkout(
+            lambda: prepare_git_checkout(
+                temp_root=temp_dir,
+                target_repo=target_repo,
+                base_branch=args.base_branch,
+                fork_repo=fork_repo,
+                branch_name=branch_name,
+                sparse=args.sparse_checkout,
+                cache_root=Path(args.cache_dir).expanduser() if args.git_cache else None,
+            ),
+            stage_root,
+            spec,
         )
 
-        created_doc, created_team_card = create_submission_artifacts(
+        changes = ArtifactChanges()
+        created_doc, created_team_card = merge_staged_submission(
+            stage_root,
             repo_path,
-            team_name=args.team_name,
-            project_name=args.project_name,
-            repo_url=args.repo_url,
-            demo_url_or_run_method=args.demo_url_or_run_method,
-            problem_definition=args.problem_definition,
-            one_liner=args.one_liner,
-            team_roles=args.team_roles,
-            solution=args.solution,
-            tech_stack=args.tech_stack,
-            run_verify=args.run_verify,
-            demo_summary=args.demo_summary,
-            license_sources=args.license_sources,
-            ai_used=args.ai_used,
-            ai_validation_notes=args.ai_validation_notes,
-            presentation_url=args.presentation_url,
-            extra_links=args.extra_links,
-            project_url=args.project_url,
-            team_role_label=args.team_role_label,
-            team_bio=args.team_bio,
-            team_image_url=args.team_image_url,
-            submitted_at=args.submitted_at,
-            team_order=args.team_order,
+            spec,
             update_existing=args.update,
+            changes=changes,
         )
 
         staged_preview = run(["git", "status", "--short"], cwd=repo_path, check=False)
@@ -695,10 +4184,13 @@ def run_github_dry_run(
         print(f"[OK] Rendered document path (temp clone): {created_doc}")
         print(f"[OK] Rendered team card path (temp clone): {created_team_card}")
         print(f"[OK] Changed files in dry-run: {changed_count}")
+        print_change_report(changes)
         print(f"[OK] Manual compare URL preview: {compare_url}")
         return 0
     except Exception as error:
         print(f"[ERROR] {error}", file=sys.stderr)
+        if cache is not None:
+            cache.invalidate_on(error)
         if login and branch_name:
             compare_url = (
                 f"https://github.com/{target_repo}/compare/"
@@ -706,6 +4198,216 @@ def run_github_dry_run(
             )
             print(f"[FALLBACK] Compare URL preview: {compare_url}", file=sys.stderr)
         return 1
+    finally:
+        if args.keep_temp:
+            print(f"[INFO] Temporary directory kept: {temp_dir}")
+        else:
+            if repo_path is not None:
+                release_git_checkout(repo_path, branch_name)
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def run_clone_free_dry_run(args: argparse.Namespace, spec: SubmissionSpec, *, target_repo: str) -> int:
+    import shutil
+    import tempfile
+
+    team_slug = spec.team_slug
+    project_slug = spec.project_slug
+    temp_dir = Path(tempfile.mkdtemp(prefix="hackathon-submission-gh-dry-run-"))
+    login: Optional[str] = None
+    branch_name: Optional[str] = None
+    cache: Optional[MetadataCache] = None
+    try:
+        api = open_github_client(args)
+        cache = open_metadata_cache(args, api=api)
+        login, fork_repo = resolve_github_identity(
+            target_repo,
+            args.base_branch,
+            create_fork=False,
+            check_target=True,
+            api=api,
+            cache=cache,
+        )
+        branch_name = create_branch_name(team_slug, project_slug)
+
+        paths = submission_target_paths(team_slug, project_slug)
+        staging_root = temp_dir / "staging"
+        if api is not None:
+            base_sha = upstream_head(api, target_repo, args.base_branch, cache=cache)
+            seeded = seed_staging_root_via_api(
+                api, staging_root, target_repo=target_repo, base_sha=base_sha, paths=paths
+            )
+        else:
+            base_sha = ls_remote_head(target_repo, args.base_branch)
+            seeded = fetch_upstream_paths(
+                temp_dir,
+                staging_root,
+                target_repo=target_repo,
+                base_sha=base_sha,
+                paths=paths,
+                mirror_path=git_mirror_path(Path(args.cache_dir).expanduser(), fork_repo) if args.git_cache else None,
+            )
+
+        print(f"[OK] Authenticated as: {login}")
+        print(f"[OK] Fork repository: https://github.com/{fork_repo}")
+        print(f"[OK] Upstream {args.base_branch}: {base_sha}")
+        print(f"[OK] Planned branch: {branch_name}")
+        conflicts = [
+            path
+            for path in (result_document_relpath(project_slug), team_card_relpath(team_slug, project_slug))
+            if path in seeded and not args.update
+        ]
+        if conflicts:
+            for path in conflicts:
+                print(
+                    f"[CONFLICT] {path} already exists on {args.base_branch}. Re-run with --update to overwrite.",
+                    file=sys.stderr,
+                )
+            return 1
+
+        changes = ArtifactChanges()
+        create_submission_artifacts(staging_root, spec, update_existing=args.update, changes=changes)
+        planned = sorted({path.relative_to(staging_root).as_posix() for path in changes.paths})
+        compare_url = (
+            f"https://github.com/{target_repo}/compare/"
+            f"{args.base_branch}...{login}:{branch_name}?expand=1"
+        )
+        print(f"[OK] Planned file changes: {len(planned)}")
+        for path in planned:
+            print(f"  {'M' if path in seeded else 'A'} {path}")
+        print_change_report(changes)
+        print("[OK] GitHub dry-run completed without a clone.")
+        print("[OK] No commit/push/PR was created.")
+        print(f"[OK] Manual compare URL preview: {compare_url}")
+        return 0
+    except Exception as error:
+        print(f"[ERROR] {error}", file=sys.stderr)
+        if cache is not None:
+            cache.invalidate_on(error)
+        return 1
+    finally:
+        if args.keep_temp:
+            print(f"[INFO] Temporary directory kept: {temp_dir}")
+        else:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def run_api_submission(args: argparse.Namespace, spec: SubmissionSpec, *, target_repo: str) -> int:
+    import shutil
+    import tempfile
+
+    team_slug = spec.team_slug
+    project_slug = spec.project_slug
+    temp_dir = Path(tempfile.mkdtemp(prefix="hackathon-submission-api-"))
+    login: Optional[str] = None
+    branch_name: Optional[str] = None
+    commit_sha: Optional[str] = None
+    cache: Optional[MetadataCache] = None
+    try:
+        api = GitHubApi(resolve_github_token())
+        cache = open_metadata_cache(args, api=api)
+        login, fork_repo = resolve_github_identity(target_repo, args.base_branch, api=api, cache=cache)
+        # A re-run while the previous PR is still open builds on that PR's branch instead of opening another one.
+        existing = find_open_submission_pr(
+            target_repo=target_repo,
+            base_branch=args.base_branch,
+            login=login,
+            team_slug=team_slug,
+            project_slug=project_slug,
+            api=api,
+        )
+        if existing is None:
+            branch_name = create_branch_name(team_slug, project_slug)
+            base_repo = target_repo
+            base_sha = upstream_head(api, target_repo, args.base_branch, cache=cache)
+        else:
+            branch_name, existing_url = existing
+            if not args.update:
+                raise FileExistsError(
+                    f"An open submission PR already exists: {existing_url}. Re-run with --update to add a commit to it."
+                )
+            base_repo = fork_repo
+            head_ref = api.request("GET", f"/repos/{fork_repo}/git/ref/heads/{branch_name}")
+            base_sha = str(head_ref["object"]["sha"])
+        base_commit = api.request("GET", f"/repos/{base_repo}/git/commits/{base_sha}")
+        base_tree = str(base_commit["tree"]["sha"])
+
+        staging_root = temp_dir / "staging"
+        seeded = seed_staging_root_via_api(
+            api,
+            staging_root,
+            target_repo=base_repo,
+            base_sha=base_sha,
+            paths=submission_target_paths(team_slug, project_slug),
+        )
+        changes = ArtifactChanges()
+        created_doc, created_team_card = create_submission_artifacts(
+            staging_root,
+            spec,
+            update_existing=args.update,
+            changes=changes,
+        )
+        print_change_report(changes)
+        if not changes.paths:
+            if existing is not None:
+                print("[OK] The open PR for this submission is already up to date; nothing was pushed.")
+                print(f"[OK] Branch: {branch_name}")
+                print(f"[OK] PR URL: {existing_url}")
+                return 0
+            print("[OK] Submission is already up to date; no commit or PR was created.")
+            return 0
+
+        commit_sha = commit_staged_tree_via_api(
+            api,
+            fork_repo=fork_repo,
+            staging_root=staging_root,
+            seeded=seeded,
+            base_sha=base_sha,
+            base_tree=base_tree,
+            branch_name=branch_name,
+            message=build_commit_message(
+                team_slug=team_slug,
+                project_slug=project_slug,
+                project_name=spec.project_name,
+                team_name=spec.team_name,
+            ),
+            update_branch=existing is not None,
+        )
+        if existing is not None:
+            pr_url = existing_url
+            print("[OK] Submission document generated and the open PR was updated (GitHub API, no clone).")
+        else:
+            pr_url = create_or_get_pr_via_api(
+                api,
+                target_repo=target_repo,
+                base_branch=args.base_branch,
+                login=login,
+                branch_name=branch_name,
+                project_name=spec.project_name,
+                team_name=spec.team_name,
+            )
+            print("[OK] Submission document generated and PR created (GitHub API, no clone).")
+        print(f"[OK] Document path: {created_doc.relative_to(staging_root).as_posix()}")
+        print(f"[OK] Team card path: {created_team_card.relative_to(staging_root).as_posix()}")
+        print(f"[OK] Commit SHA: {commit_sha}")
+        print(f"[OK] Branch: {branch_name}")
+        print(f"[OK] PR URL: {pr_url}")
+        return 0
+    except Exception as error:
+        print(f"[ERROR] {error}", file=sys.stderr)
+        if cache is not None:
+            cache.invalidate_on(error)
+        if login and branch_name:
+            compare_url = (
+                f"https://github.com/{target_repo}/compare/"
+                f"{args.base_branch}...{login}:{branch_name}?expand=1"
+            )
+            print("[FALLBACK] PR 자동 생성 실패 시 아래 정보를 사용하세요.", file=sys.stderr)
+            if commit_sha:
+                print(f"[FALLBACK] Commit SHA: {commit_sha}", file=sys.stderr)
+            print(f"[FALLBACK] Branch: {branch_name}", file=sys.stderr)
+            print(f"[FALLBACK] Manual PR URL: {compare_url}", file=sys.stderr)
+        return 1
     finally:
         if args.keep_temp:
             print(f"[INFO] Temporary directory kept: {temp_dir}")
@@ -713,12 +4415,329 @@ def run_github_dry_run(
             shutil.rmtree(temp_dir, ignore_errors=True)
 
 
+def report_timings(args: argparse.Namespace) -> None:
+    if args.profile and TIMINGS.profiler is not None:
+        TIMINGS.profiler.dump_stats(args.profile)
+        print(f"[INFO] Render profile written: {args.profile}", file=sys.stderr)
+
+    if not args.timings and not args.timings_file:
+        return
+    summary = TIMINGS.summary()
+    if args.timings_file:
+        write_json(Path(args.timings_file), summary)
+        print(f"[INFO] Timing trace written: {args.timings_file}", file=sys.stderr)
+    if args.timings:
+        for name, entry in summary["phases"].items():
+            print(
+                f"[TIMING] {name}: {entry['seconds']:.3f}s (calls: {int(entry['count'])})",
+                file=sys.stderr,
+            )
+        for name, entry in summary["subprocesses"].items():
+            print(
+                f"[TIMING] subprocess {name}: {entry['seconds']:.3f}s (spawned: {int(entry['count'])})",
+                file=sys.stderr,
+            )
+        print(
+            f"[TIMING] total: {summary['wall_seconds']:.3f}s, "
+            f"{summary['subprocess_count']} subprocess(es) in {summary['subprocess_seconds']:.3f}s",
+            file=sys.stderr,
+        )
+
+
+def render(
+    spec: SubmissionSpec, output_root: Optional[Path] = None, *, update: bool = False
+) -> RenderedSubmission:
+    """Render one submission in-process.
+
+    Without ``output_root`` nothing touches the disk. With it, the files are
+    written exactly as ``--render-only-dir`` would write them.
+    """
+    team_slug = spec.team_slug
+    project_slug = spec.project_slug
+    if output_root is None:
+        document = render_result_document(spec)
+        team_card = render_team_card(spec)
+    else:
+        doc_file, team_file = create_submission_artifacts(Path(output_root), spec, update_existing=update)
+        document = doc_file.read_text(encoding="utf-8")
+        team_card = team_file.read_text(encoding="utf-8")
+    return RenderedSubmission(
+        team_slug=team_slug,
+        project_slug=project_slug,
+        document_path=result_document_relpath(project_slug),
+        document=document,
+        team_card_path=team_card_relpath(team_slug, project_slug),
+        team_card=team_card,
+    )
+
+
+def validate(spec: SubmissionSpec) -> List[str]:
+    """Return every validation error for ``spec``; an empty list means it can be submitted."""
+    missing = [name for name in REQUIRED_SUBMISSION_FIELDS if not str(getattr(spec, name) or "").strip()]
+    if missing:
+        joined = ", ".join(missing)
+        return [f"Missing required submission field(s): {joined}"]
+    try:
+        render(spec)
+        ASSET_STORE.plan(spec)
+    except ValidationError as error:
+        return list(error.errors)
+    except ValueError as error:
+        return [str(error)]
+    return []
+
+
+def submit(spec: SubmissionSpec, **options: Any) -> int:
+    """Run the CLI submission workflow in-process and return its exit code.
+
+    ``options`` are CLI option names in snake_case, e.g. ``github_dry_run=True``,
+    ``api_submit=True`` or ``render_only_dir="/tmp/out"``.
+    """
+    cli = parser()
+    args = cli.parse_args([])
+    for name, value in {**spec.as_dict(), **options}.items():
+        if not hasattr(args, name):
+            raise TypeError(f"Unknown submit option: {name}")
+        setattr(args, name, value)
+    return run_cli(cli, args)
+
+
+PREVIEW_MAX_REQUEST_BYTES = 1024 * 1024
+
+
+def preview_submission(payload: Dict[str, object]) -> Dict[str, object]:
+    """Render and validate one submission in memory for live previews."""
+    try:
+        spec = SubmissionSpec.from_mapping(payload)
+    except ValueError as error:
+        return {"ok": False, "errors": [str(error)]}
+
+    errors: List[str] = []
+    document: Optional[str] = None
+    team_card: Optional[str] = None
+    try:
+        document = render_result_document(spec, validate=False)
+        errors.extend(document_errors(document))
+    except ValueError as error:
+        errors.append(str(error))
+    try:
+        team_card = render_team_card(spec)
+        errors.extend(team_card_errors(parse_frontmatter(team_card)))
+    except ValueError as error:
+        errors.append(str(error))
+
+    return {
+        "ok": not errors,
+        "team_slug": spec.team_slug,
+        "project_slug": spec.project_slug,
+        "document_path": result_document_relpath(spec.project_slug),
+        "document": document,
+        "team_card_path": team_card_relpath(spec.team_slug, spec.project_slug),
+        "team_card": team_card,
+        "errors": errors,
+    }
+
+
+def make_preview_server(address: str) -> Any:
+    import socketserver
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class PreviewRequestHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Keep-alive previews send small responses; Nagle would delay each one by an ACK round trip.
+        disable_nagle_algorithm = True
+
+        def send_json(self, status: int, payload: Dict[str, object]) -> None:
+            body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self) -> None:
+            if self.path == "/healthz":
+                self.send_json(200, {"ok": True})
+            else:
+                self.send_json(404, {"ok": False, "errors": [f"Unknown path: {self.path}"]})
+
+        def do_POST(self) -> None:
+            if self.path not in {"/render", "/validate"}:
+                self.send_json(404, {"ok": False, "errors": [f"Unknown path: {self.path}"]})
+                return
+            try:
+                length = int(self.headers.get("Content-Length") or 0)
+            except ValueError:
+                length = -1
+            if length < 0:
+                # The body cannot be framed, so the connection cannot be reused either.
+                self.close_connection = True
+                self.send_json(400, {"ok": False, "errors": ["Content-Length must be a non-negative integer."]})
+                return
+            if length > PREVIEW_MAX_REQUEST_BYTES:
+                self.close_connection = True
+                self.send_json(413, {"ok": False, "errors": ["Request body is too large."]})
+                return
+            try:
+                payload = json.loads(self.rfile.read(length).decode("utf-8"))
+            except (UnicodeDecodeError, json.JSONDecodeError) as error:
+                self.send_json(400, {"ok": False, "errors": [f"Request body is not valid JSON: {error}"]})
+                return
+            if not isinstance(payload, dict):
+                self.send_json(400, {"ok": False, "errors": ["Request body must be a JSON object."]})
+                return
+            result = preview_submission(payload)
+            # Without slugs the body is not a submission at all (unknown, missing or mistyped fields).
+            status = 200 if "project_slug" in result else 400
+            if self.path == "/validate":
+                result = {"ok": result["ok"], "errors": result["errors"]}
+            self.send_json(status, result)
+
+        def address_string(self) -> str:
+            return str(self.client_address or "unix")
+
+        def log_message(self, format: str, *args: Any) -> None:
+            return
+
+    if address.startswith("unix:"):
+        import stat
+
+        socket_path = Path(address[len("unix:") :])
+        try:
+            mode = socket_path.lstat().st_mode
+        except FileNotFoundError:
+            pass
+        else:
+            if not stat.S_ISSOCK(mode):
+                raise FileExistsError(f"--serve {address}: {socket_path} already exists and is not a socket.")
+            # A socket left behind by a previous service that did not shut down cleanly.
+            socket_path.unlink()
+
+        class UnixPreviewRequestHandler(PreviewRequestHandler):
+            # TCP_NODELAY cannot be set on a Unix socket.
+            disable_nagle_algorithm = False
+
+        class UnixPreviewServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+            daemon_threads = True
+
+        return UnixPreviewServer(str(socket_path), UnixPreviewRequestHandler)
+
+    host, _, port = address.rpartition(":")
+    return ThreadingHTTPServer((host or "127.0.0.1", int(port)), PreviewRequestHandler)
+
+
+def run_preview_server(address: str) -> int:
+    server = make_preview_server(address)
+    default_template()
+    if address.startswith("unix:"):
+        location = address
+    else:
+        host, port = server.server_address[:2]
+        location = f"http://{host}:{port}"
+    print(f"[OK] Preview service listening on {location} (POST /render, POST /validate)", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if address.startswith("unix:"):
+            Path(address[len("unix:") :]).unlink(missing_ok=True)
+    return 0
+
+
 def main() -> int:
-    args = parser().parse_args()
+    cli = parser()
+    args = cli.parse_args()
+    if args.profile:
+        TIMINGS.enable_profiler(PROFILED_RENDER_PHASES)
+    try:
+        return run_cli(cli, args)
+    finally:
+        report_timings(args)
+
+
+def run_cli(cli: argparse.ArgumentParser, args: argparse.Namespace) -> int:
+    global ASSET_STORE
+
+    # submit() may run several times in one process, so each run gets its own limits and dedupe state.
+    previous_store = ASSET_STORE
+    ASSET_STORE = AssetStore(
+        max_file_bytes=args.max_asset_mb * 1024 * 1024,
+        max_total_bytes=args.max_assets_total_mb * 1024 * 1024,
+        # Hard links between duplicate assets are only safe inside throwaway checkouts.
+        link_duplicates=not args.render_only_dir,
+    )
+    try:
+        return dispatch_cli(cli, args)
+    finally:
+        ASSET_STORE = previous_store
+
+
+def dispatch_cli(cli: argparse.ArgumentParser, args: argparse.Namespace) -> int:
     target_repo = DEFAULT_TARGET_REPO
+
+    if args.serve:
+        try:
+            return run_preview_server(args.serve)
+        except Exception as error:
+            print(f"[ERROR] {error}", file=sys.stderr)
+            return 1
+
+    if args.validate_tree:
+        try:
+            return run_validate_tree(args)
+        except Exception as error:
+            print(f"[ERROR] {error}", file=sys.stderr)
+            return 1
+
+    if args.manifest and args.single_pr:
+        if args.render_only_dir or args.github_dry_run or args.api_submit or args.batch_submit:
+            print(
+                "[ERROR] --single-pr cannot be combined with --render-only-dir, --github-dry-run, "
+                "--api-submit or --batch-submit.",
+                file=sys.stderr,
+            )
+            return 1
+        try:
+            return run_manifest_single_pr(args, target_repo=target_repo)
+        except Exception as error:
+            print(f"[ERROR] {error}", file=sys.stderr)
+            return 1
+
+    if args.manifest and args.batch_submit:
+        if args.render_only_dir or args.github_dry_run or args.api_submit:
+            print(
+                "[ERROR] --batch-submit cannot be combined with --render-only-dir, --github-dry-run or --api-submit.",
+                file=sys.stderr,
+            )
+            return 1
+        try:
+            return run_manifest_submission(args, target_repo=target_repo)
+        except Exception as error:
+            print(f"[ERROR] {error}", file=sys.stderr)
+            return 1
+
+    if args.manifest:
+        if not args.render_only_dir or args.github_dry_run:
+            print("[ERROR] --manifest requires --render-only-dir, --batch-submit or --single-pr.", file=sys.stderr)
+            return 1
+        try:
+            return run_manifest_render(args, output_root=Path(args.render_only_dir).resolve())
+        except Exception as error:
+            print(f"[ERROR] {error}", file=sys.stderr)
+            return 1
+
+    missing = [
+        f"--{name.replace('_', '-')}" for name in REQUIRED_SUBMISSION_FIELDS if getattr(args, name) is None
+    ]
+    if missing:
+        cli.error(f"the following arguments are required: {', '.join(missing)}")
+
     try:
-        team_slug = slugify(args.team_name)
-        project_slug = slugify(args.project_name)
+        spec = SubmissionSpec.from_args(args)
+        team_slug = spec.team_slug
+        project_slug = spec.project_slug
     except Exception as error:
         print(f"[ERROR] {error}", file=sys.stderr)
         return 1
@@ -726,130 +4745,115 @@ def main() -> int:
     if args.render_only_dir and args.github_dry_run:
         print("[ERROR] --render-only-dir and --github-dry-run cannot be used together.", file=sys.stderr)
         return 1
+    if args.no_clone and not args.github_dry_run:
+        print("[ERROR] --no-clone requires --github-dry-run.", file=sys.stderr)
+        return 1
+
+    try:
+        check_slug_index(args, target_repo, team_slug, project_slug)
+    except Exception as error:
+        print(f"[ERROR] {error}", file=sys.stderr)
+        return 1
+
+    media = open_media_fetcher(args)
+    if media is not None:
+        try:
+            spec = media.attach(spec)
+        except Exception as error:
+            print(f"[ERROR] {error}", file=sys.stderr)
+            return 1
+        finally:
+            media.close()
+
+    if args.api_submit:
+        if args.render_only_dir or args.github_dry_run:
+            print(
+                "[ERROR] --api-submit cannot be combined with --render-only-dir or --github-dry-run.",
+                file=sys.stderr,
+            )
+            return 1
+        return run_api_submission(args, spec, target_repo=target_repo)
 
     if args.github_dry_run:
-        return run_github_dry_run(
-            args,
-            target_repo=target_repo,
-            team_slug=team_slug,
-            project_slug=project_slug,
-        )
+        if args.no_clone:
+            return run_clone_free_dry_run(args, spec, target_repo=target_repo)
+        return run_github_dry_run(args, spec, target_repo=target_repo)
 
     if args.render_only_dir:
         try:
             output_root = Path(args.render_only_dir).resolve()
+            changes = ArtifactChanges()
             created_doc, created_team_card = create_submission_artifacts(
                 output_root,
-                team_name=args.team_name,
-                project_name=args.project_name,
-                repo_url=args.repo_url,
-                demo_url_or_run_method=args.demo_url_or_run_method,
-                problem_definition=args.problem_definition,
-                one_liner=args.one_liner,
-                team_roles=args.team_roles,
-                solution=args.solution,
-                tech_stack=args.tech_stack,
-                run_verify=args.run_verify,
-                demo_summary=args.demo_summary,
-                license_sources=args.license_sources,
-                ai_used=args.ai_used,
-                ai_validation_notes=args.ai_validation_notes,
-                presentation_url=args.presentation_url,
-                extra_links=args.extra_links,
-                project_url=args.project_url,
-                team_role_label=args.team_role_label,
-                team_bio=args.team_bio,
-                team_image_url=args.team_image_url,
-                submitted_at=args.submitted_at,
-                team_order=args.team_order,
+                spec,
                 update_existing=args.update,
+                changes=changes,
             )
             print("[OK] Render-only mode completed.")
             print(f"[OK] Document path: {created_doc}")
             print(f"[OK] Team card path: {created_team_card}")
+            print(f"[OK] Files written: {len(changes.paths)}")
+            print_change_report(changes)
             return 0
         except Exception as error:
             print(f"[ERROR] {error}", file=sys.stderr)
             return 1
 
+    import shutil
+    import tempfile
+
     temp_dir = Path(tempfile.mkdtemp(prefix="hackathon-submission-"))
-    repo_path: Optional[Path] = None
-    branch_name: Optional[str] = None
+    progress: Optional[SubmissionProgress] = None
     login: Optional[str] = None
-    commit_sha: Optional[str] = None
+    cache: Optional[MetadataCache] = None
     try:
-        ensure_gh_cli_and_auth()
-        login = run(["gh", "api", "user", "--jq", ".login"])
-        fork_repo = ensure_fork(target_repo, login, create_if_missing=True)
-        branch_name = create_branch_name(team_slug, project_slug)
-        repo_path = prepare_git_checkout(
-            temp_root=temp_dir,
-            target_repo=target_repo,
-            base_branch=args.base_branch,
-            fork_repo=fork_repo,
-            branch_name=branch_name,
-        )
-        ensure_git_identity(repo_path)
-
-        created_doc, created_team_card = create_submission_artifacts(
-            repo_path,
-            team_name=args.team_name,
-            project_name=args.project_name,
-            repo_url=args.repo_url,
-            demo_url_or_run_method=args.demo_url_or_run_method,
-            problem_definition=args.problem_definition,
-            one_liner=args.one_liner,
-            team_roles=args.team_roles,
-            solution=args.solution,
-            tech_stack=args.tech_stack,
-            run_verify=args.run_verify,
-            demo_summary=args.demo_summary,
-            license_sources=args.license_sources,
-            ai_used=args.ai_used,
-            ai_validation_notes=args.ai_validation_notes,
-            presentation_url=args.presentation_url,
-            extra_links=args.extra_links,
-            project_url=args.project_url,
-            team_role_label=args.team_role_label,
-            team_bio=args.team_bio,
-            team_image_url=args.team_image_url,
-            submitted_at=args.submitted_at,
-            team_order=args.team_order,
-            update_existing=args.update,
-        )
-
-        commit_sha = commit_changes(
-            repo_path,
-            team_slug=team_slug,
-            project_slug=project_slug,
-            project_name=args.project_name,
-            team_name=args.team_name,
-        )
-        pr_url = create_or_get_pr(
-            repo_path=repo_path,
+        api = open_github_client(args)
+        cache = open_metadata_cache(args, api=api)
+        login, fork_repo = resolve_github_identity(target_repo, args.base_branch, api=api, cache=cache)
+        progress = SubmissionProgress(create_branch_name(team_slug, project_slug))
+        submit_via_git(
+            args,
+            spec,
+            progress,
             target_repo=target_repo,
-            base_branch=args.base_branch,
             login=login,
-            branch_name=branch_name,
-            project_name=args.project_name,
-            team_name=args.team_name,
+            fork_repo=fork_repo,
+            temp_dir=temp_dir,
+            api=api,
         )
+        print_change_report(progress.changes)
+        if progress.pr_url is None:
+            print("[OK] Submission is already up to date; no commit, push or PR was created.")
+            return 0
+        if progress.existing_pr == "up_to_date":
+            print("[OK] The open PR for this submission is already up to date; nothing was pushed.")
+            print(f"[OK] Branch: {progress.branch_name}")
+            print(f"[OK] PR URL: {progress.pr_url}")
+            return 0
 
-        print("[OK] Submission document generated and PR created.")
-        print(f"[OK] Document path: {created_doc}")
-        print(f"[OK] Team card path: {created_team_card}")
-        print(f"[OK] Commit SHA: {commit_sha}")
-        print(f"[OK] Branch: {branch_name}")
-        print(f"[OK] PR URL: {pr_url}")
+        if progress.existing_pr == "updated":
+            print("[OK] Submission document generated and the open PR was updated.")
+        else:
+            print("[OK] Submission document generated and PR created.")
+        print(f"[OK] Document path: {progress.doc_path}")
+        print(f"[OK] Team card path: {progress.team_card_path}")
+        print(f"[OK] Commit SHA: {progress.commit_sha}")
+        print(f"[OK] Branch: {progress.branch_name}")
+        print(f"[OK] PR URL: {progress.pr_url}")
         return 0
     except Exception as error:
         print(f"[ERROR] {error}", file=sys.stderr)
-        if login and branch_name:
+        if cache is not None:
+            cache.invalidate_on(error)
+        if login and progress is not None:
+            branch_name = progress.branch_name
+            commit_sha = progress.commit_sha
             compare_url = (
                 f"https://github.com/{target_repo}/compare/"
                 f"{args.base_branch}...{login}:{branch_name}?expand=1"
             )
-            if repo_path and repo_path.exists():
+            repo_path = progress.repo_path
+            if repo_path and repo_path.exists() and not args.plumbing_commit:
                 if not commit_sha:
                     commit_sha = run(
                         ["git", "rev-parse", "HEAD"],
@@ -866,6 +4870,8 @@ def main() -> int:
         if args.keep_temp:
             print(f"[INFO] Temporary directory kept: {temp_dir}")
         else:
+            if progress is not None and progress.repo_path is not None:
+                release_git_checkout(progress.repo_path, progress.local_branch)
             shutil.rmtree(temp_dir, ignore_errors=True)
 
 
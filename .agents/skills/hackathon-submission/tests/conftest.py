@@ -0,0 +1,96 @@
+"""Fixtures for the create_submission_pr.py tests.
+
+GitHub is replaced by the benchmark's stand-ins: a fake ``gh`` on PATH and
+local bare ``upstream.git``/``fork.git`` repositories, plus an optional
+in-process REST/GraphQL stub for ``--http-api`` and ``--api-submit``.
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[1] / "scripts"
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+import benchmark_submission as bench  # noqa: E402
+import create_submission_pr as submission  # noqa: E402
+
+
+def submission_args(project_name: str, *, team_name: str = "Test Team", one_liner: str = "v1") -> List[str]:
+    return [
+        "--team-name",
+        team_name,
+        "--project-name",
+        project_name,
+        "--repo-url",
+        "https://github.com/test/project",
+        "--demo-url-or-run-method",
+        "README",
+        "--problem-definition",
+        "problem",
+        "--one-liner",
+        one_liner,
+        "--team-roles",
+        "- 홍길동: FE",
+        "--submitted-at",
+        "2026-01-01T00:00:00+09:00",
+    ]
+
+
+class FakeGitHub:
+    """A work directory wired to the fake ``gh`` and the local upstream/fork repositories."""
+
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.env: Dict[str, str] = bench.prepare_fake_github(root)
+        self.upstream = root / "upstream.git"
+        self.fork = root / "fork.git"
+        self.open_prs_path = root / "open-prs.tsv"
+        self.env["FAKE_GH_OPEN_PRS"] = str(self.open_prs_path)
+
+    def run(self, *args: str, env: Optional[Dict[str, str]] = None) -> subprocess.CompletedProcess:
+        return subprocess.run(
+            [sys.executable, str(bench.SUBMISSION_SCRIPT), *args],
+            cwd=self.root,
+            env=env or self.env,
+            capture_output=True,
+            text=True,
+        )
+
+    def set_open_prs(self, rows: Sequence[Tuple[str, str]]) -> None:
+        self.open_prs_path.write_text("".join(f"{branch}\t{url}\n" for branch, url in rows), encoding="utf-8")
+
+    def git(self, *args: str, cwd: Optional[Path] = None) -> str:
+        return subprocess.run(
+            ["git", *args], cwd=cwd or self.fork, env=self.env, capture_output=True, text=True, check=True
+        ).stdout.strip()
+
+    def fork_branches(self, prefix: str = "submission/") -> List[str]:
+        listing = self.git("for-each-ref", "--format=%(refname:short)", f"refs/heads/{prefix}")
+        return listing.splitlines()
+
+
+@pytest.fixture
+def fake_github(tmp_path: Path) -> FakeGitHub:
+    return FakeGitHub(tmp_path / "github")
+
+
+@pytest.fixture
+def fake_github_api(fake_github: FakeGitHub) -> Iterator[Tuple[FakeGitHub, object, Dict[str, str]]]:
+    server = bench.start_fake_github_api(fake_github.upstream, fake_github.fork)
+    env = {
+        **fake_github.env,
+        "GH_TOKEN": "test-token",
+        "GITHUB_API_URL": f"http://127.0.0.1:{server.server_address[1]}",
+    }
+    try:
+        yield fake_github, server, env
+    finally:
+        server.shutdown()
+        server.server_close()
+
@@ -0,0 +1,80 @@
+"""A bad manifest row fails on its own; the rows around it still run."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+from conftest import FakeGitHub, submission
+
+
+def manifest_row(index: int, *, assets: object = None) -> Dict[str, object]:
+    row: Dict[str, object] = {
+        "team_name": f"Team {index}",
+        "project_name": f"Manifest Project {index}",
+        "repo_url": f"https://github.com/test/project-{index}",
+        "demo_url_or_run_method": "README",
+        "problem_definition": "problem",
+        "one_liner": f"one liner {index}",
+        "team_roles": "- 홍길동: FE",
+    }
+    if assets is not None:
+        row["assets"] = assets
+    return row
+
+
+def write_manifest(path: Path, rows: List[Dict[str, object]]) -> Path:
+    path.write_text("".join(json.dumps(row, ensure_ascii=False) + "\n" for row in rows), encoding="utf-8")
+    return path
+
+
+@pytest.mark.parametrize("bad_assets", [5, {"demo": 5}, ["demo=a.png", 5]], ids=["int", "mapping-int", "list-int"])
+@pytest.mark.parametrize("mode", [["--batch-submit"], ["--single-pr"], ["--render-only-dir", "out"]])
+def test_malformed_assets_row_fails_alone(fake_github: FakeGitHub, mode: List[str], bad_assets: object) -> None:
+    manifest = write_manifest(
+        fake_github.root / "manifest.jsonl",
+        [manifest_row(1), manifest_row(2, assets=bad_assets), manifest_row(3)],
+    )
+    result = fake_github.run("--manifest", str(manifest), *mode)
+
+    assert result.returncode == 1
+    assert "[ERROR] Row 2: assets must be a string, list, or mapping of strings" in result.stderr
+    assert "Traceback" not in result.stderr
+    assert "[OK] Row 1:" in result.stdout
+    assert "[OK] Row 3:" in result.stdout
+
+
+def push_upstream_document(fake_github: FakeGitHub, relative_path: str, content: str) -> None:
+    clone = fake_github.root / "upstream-work"
+    fake_github.git("clone", "-q", str(fake_github.upstream), str(clone), cwd=fake_github.root)
+    target = clone / relative_path
+    target.write_text(content, encoding="utf-8")
+    fake_github.git("add", "-A", cwd=clone)
+    fake_github.git("commit", "-q", "-m", "existing document", cwd=clone)
+    fake_github.git("push", "-q", "origin", "HEAD", cwd=clone)
+
+
+@pytest.mark.parametrize("mode", [[], ["--plumbing-commit"]], ids=["clone", "plumbing"])
+def test_single_pr_commits_only_the_rows_that_succeed(fake_github: FakeGitHub, mode: List[str]) -> None:
+    taken = submission.result_document_relpath("manifest-project-2")
+    push_upstream_document(fake_github, taken, "existing document\n")
+    duplicate = {**manifest_row(4), "project_name": "Manifest Project 1"}
+    manifest = write_manifest(
+        fake_github.root / "manifest.jsonl",
+        [manifest_row(1), manifest_row(2), manifest_row(3), duplicate],
+    )
+    result = fake_github.run("--manifest", str(manifest), "--single-pr", *mode)
+
+    assert result.returncode == 1
+    assert "[ERROR] Row 2: " in result.stderr
+    assert "[ERROR] Row 4: Project slug 'manifest-project-1' is already used by row 1." in result.stderr
+    assert "Aggregated submission PR created for 2 team(s); 2 row(s) failed." in result.stdout
+
+    (branch,) = fake_github.fork_branches()
+    changed = fake_github.git("diff", "--name-only", f"{branch}^", branch).splitlines()
+    assert submission.result_document_relpath("manifest-project-1") in changed
+    assert submission.result_document_relpath("manifest-project-3") in changed
+    assert not [path for path in changed if "manifest-project-2" in path or "team-4" in path]
+    assert fake_github.git("show", f"{branch}:{taken}") == "existing document"
@@ -0,0 +1,39 @@
+"""meta.json page updates are merged under one lock that temporary trees do not multiply."""
+
+from __future__ import annotations
+
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from conftest import submission
+
+
+@pytest.fixture
+def lock_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    directory = tmp_path / "tmp"
+    directory.mkdir()
+    monkeypatch.setattr(tempfile, "tempdir", str(directory))
+    return directory
+
+
+def test_concurrent_writers_keep_every_page(tmp_path: Path, lock_dir: Path) -> None:
+    meta_path = tmp_path / "tree" / "meta.json"
+    submission.write_json(meta_path, {"title": "바이브 코딩 결과", "pages": []})
+
+    def add(page: str) -> None:
+        writer = submission.MetaIndexWriter()
+        writer.add(meta_path, "바이브 코딩 결과", page)
+        writer.flush()
+
+    pages = [f"project-{index}" for index in range(32)]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(add, pages))
+    assert sorted(submission.load_json(meta_path)["pages"]) == sorted(pages)
+
+
+def test_temporary_trees_share_one_lock_file(tmp_path: Path, lock_dir: Path) -> None:
+    for index in range(5):
+        assert submission.ensure_meta_page(tmp_path / f"tree-{index}" / "meta.json", "문서", "page")
+    assert [path.name for path in lock_dir.iterdir()] == [submission.meta_lock_path().name]
@@ -0,0 +1,104 @@
+"""Re-runs while the submission PR is still open reuse it instead of opening another one."""
+
+from __future__ import annotations
+
+import re
+
+import pytest
+from conftest import FakeGitHub, submission, submission_args
+
+PR_URL = f"https://github.com/{submission.DEFAULT_TARGET_REPO}/pull/7"
+
+
+def output_value(output: str, label: str) -> str:
+    match = re.search(rf"^\[OK\] {label}: (.+)$", output, re.MULTILINE)
+    assert match, output
+    return match.group(1).strip()
+
+
+def push_hand_fixup(fake_github: FakeGitHub, branch: str, relative_path: str) -> str:
+    clone = fake_github.root / "maintainer"
+    fake_github.git("clone", "-q", "--branch", branch, str(fake_github.fork), str(clone), cwd=fake_github.root)
+    target = clone / relative_path
+    target.parent.mkdir(parents=True, exist_ok=True)
+    target.write_text("added by hand\n", encoding="utf-8")
+    fake_github.git("add", "-A", cwd=clone)
+    fake_github.git("commit", "-q", "-m", "fixup", cwd=clone)
+    fake_github.git("push", "-q", "origin", branch, cwd=clone)
+    return fake_github.git("rev-parse", f"refs/heads/{branch}")
+
+
+def first_submission(fake_github: FakeGitHub, project_name: str, *mode: str) -> str:
+    result = fake_github.run(*submission_args(project_name), *mode)
+    assert result.returncode == 0, result.stderr
+    branch = output_value(result.stdout, "Branch")
+    fake_github.set_open_prs([(branch, PR_URL)])
+    return branch
+
+
+@pytest.mark.parametrize(
+    "mode",
+    [[], ["--plumbing-commit"], ["--sparse-checkout"], ["--git-cache", "--plumbing-commit"]],
+    ids=["clone", "plumbing", "sparse", "git-cache-plumbing"],
+)
+def test_git_rerun_builds_on_the_open_pr(fake_github: FakeGitHub, mode: list) -> None:
+    project_name = "Reuse Project"
+    project_slug = "reuse-project"
+    branch = first_submission(fake_github, project_name, *mode)
+
+    refused = fake_github.run(*submission_args(project_name), *mode)
+    assert refused.returncode == 1
+    assert f"An open submission PR already exists: {PR_URL}" in refused.stderr
+
+    unchanged = fake_github.run(*submission_args(project_name), *mode, "--update")
+    assert unchanged.returncode == 0, unchanged.stderr
+    assert "open PR for this submission is already up to date" in unchanged.stdout
+    assert output_value(unchanged.stdout, "PR URL") == PR_URL
+
+    hand_path = f"contents/docs/vibe-coding/assets/{project_slug}/demo/hand.txt"
+    fixup_sha = push_hand_fixup(fake_github, branch, hand_path)
+    updated = fake_github.run(*submission_args(project_name, one_liner="v2"), *mode, "--update")
+    assert updated.returncode == 0, updated.stderr
+    assert "the open PR was updated" in updated.stdout
+    assert output_value(updated.stdout, "Branch") == branch
+    assert output_value(updated.stdout, "PR URL") == PR_URL
+
+    head = fake_github.git("rev-parse", f"refs/heads/{branch}")
+    assert fake_github.git("rev-parse", f"{head}^") == fixup_sha
+    assert fake_github.git("show", f"{head}:{hand_path}") == "added by hand"
+    assert "v2" in fake_github.git("show", f"{head}:{submission.result_document_relpath(project_slug)}")
+    assert fake_github.fork_branches() == [branch]
+
+
+def test_api_submit_builds_on_the_open_pr(fake_github_api: tuple) -> None:
+    fake_github, server, env = fake_github_api
+    project_name = "Reuse Api Project"
+    branch = first_submission(fake_github, project_name)
+    head = fake_github.git("rev-parse", f"refs/heads/{branch}")
+    server.open_pulls.append((branch, PR_URL))
+
+    refused = fake_github.run(*submission_args(project_name), "--api-submit", env=env)
+    assert refused.returncode == 1
+    assert "An open submission PR already exists" in refused.stderr
+
+    unchanged = fake_github.run(*submission_args(project_name), "--api-submit", "--update", env=env)
+    assert unchanged.returncode == 0, unchanged.stderr
+    assert "open PR for this submission is already up to date" in unchanged.stdout
+    assert server.git_objects == {"trees": [], "commits": [], "refs": []}
+
+    updated = fake_github.run(*submission_args(project_name, one_liner="v2"), "--api-submit", "--update", env=env)
+    assert updated.returncode == 0, updated.stderr
+    assert "the open PR was updated" in updated.stdout
+    assert output_value(updated.stdout, "PR URL") == PR_URL
+    (tree,) = server.git_objects["trees"]
+    (commit,) = server.git_objects["commits"]
+    (ref,) = server.git_objects["refs"]
+    assert tree["base_tree"] == fake_github.git("rev-parse", f"{head}^{{tree}}")
+    assert sorted(entry["path"] for entry in tree["tree"]) == [
+        submission.result_document_relpath("reuse-api-project"),
+        submission.team_card_relpath("test-team", "reuse-api-project"),
+    ]
+    assert commit["parents"] == [head]
+    assert ref == {"ref": f"refs/heads/{branch}", "sha": ref["sha"], "force": False}
+    assert server.created_pulls == []
+
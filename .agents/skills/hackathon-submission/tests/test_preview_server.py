@@ -0,0 +1,125 @@
+"""The ``--serve`` preview service over TCP and Unix sockets."""
+
+from __future__ import annotations
+
+import http.client
+import json
+import socket
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterator, Tuple
+
+import pytest
+from conftest import submission
+
+
+def serve_in_thread(address: str) -> Any:
+    server = submission.make_preview_server(address)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+@pytest.fixture
+def socket_dir() -> Iterator[Path]:
+    # AF_UNIX paths are limited to about 100 bytes, which pytest's tmp_path can exceed.
+    import tempfile
+
+    with tempfile.TemporaryDirectory(prefix="preview-") as directory:
+        yield Path(directory)
+
+
+@pytest.fixture
+def tcp_server() -> Iterator[Any]:
+    server = serve_in_thread("127.0.0.1:0")
+    try:
+        yield server
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def post_json(server: Any, path: str, payload: object) -> Tuple[int, Dict[str, Any]]:
+    connection = http.client.HTTPConnection(*server.server_address[:2], timeout=5)
+    try:
+        connection.request("POST", path, body=json.dumps(payload), headers={"Content-Type": "application/json"})
+        response = connection.getresponse()
+        return response.status, json.loads(response.read())
+    finally:
+        connection.close()
+
+
+SUBMISSION = {
+    "team_name": "Preview Team",
+    "project_name": "Preview Project",
+    "repo_url": "https://github.com/test/preview",
+    "demo_url_or_run_method": "README",
+    "problem_definition": "problem",
+    "one_liner": "one liner",
+    "team_roles": "- 홍길동: FE",
+}
+
+
+def test_render_returns_document_and_card(tcp_server: Any) -> None:
+    status, body = post_json(tcp_server, "/render", SUBMISSION)
+    assert status == 200
+    assert body["ok"], body["errors"]
+    assert body["document_path"] == "contents/docs/vibe-coding/preview-project.mdx"
+    assert body["team_card_path"] == "contents/team/submission-preview-team-preview-project.mdx"
+    assert "Preview Project" in body["document"]
+
+
+@pytest.mark.parametrize("path", ["/render", "/validate"])
+@pytest.mark.parametrize(
+    "override",
+    [{"assets": {"demo": 5}}, {"assets": 5}, {"team_order": "first"}, {"unknown_field": "x"}, {"team_name": ""}],
+    ids=["assets-mapping-int", "assets-int", "team-order", "unknown-field", "missing-field"],
+)
+def test_invalid_submission_body_is_a_bad_request(tcp_server: Any, path: str, override: Dict[str, object]) -> None:
+    status, body = post_json(tcp_server, path, {**SUBMISSION, **override})
+    assert status == 400
+    assert body["ok"] is False
+    assert body["errors"]
+
+
+@pytest.mark.parametrize("content_length", ["abc", "-5"])
+def test_malformed_content_length_is_a_bad_request(tcp_server: Any, content_length: str) -> None:
+    with socket.create_connection(tcp_server.server_address[:2], timeout=5) as client:
+        client.sendall(
+            f"POST /validate HTTP/1.1\r\nHost: preview\r\nContent-Length: {content_length}\r\n\r\n{{}}".encode()
+        )
+        response = b"".join(iter(lambda: client.recv(4096), b""))
+    assert response.startswith(b"HTTP/1.1 400")
+    assert b"Content-Length must be a non-negative integer" in response
+
+
+def unix_get(socket_path: Path, path: str) -> bytes:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(5)
+        client.connect(str(socket_path))
+        client.sendall(f"GET {path} HTTP/1.1\r\nHost: preview\r\nConnection: close\r\n\r\n".encode())
+        return b"".join(iter(lambda: client.recv(4096), b""))
+
+
+def test_unix_socket_refuses_to_replace_a_regular_file(socket_dir: Path) -> None:
+    important = socket_dir / "important.txt"
+    important.write_text("keep me", encoding="utf-8")
+
+    with pytest.raises(FileExistsError, match="is not a socket"):
+        submission.make_preview_server(f"unix:{important}")
+    assert important.read_text(encoding="utf-8") == "keep me"
+
+
+def test_unix_socket_replaces_a_stale_socket(socket_dir: Path) -> None:
+    socket_path = socket_dir / "preview.sock"
+    stale = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    stale.bind(str(socket_path))
+    stale.close()
+
+    server = serve_in_thread(f"unix:{socket_path}")
+    try:
+        response = unix_get(socket_path, "/healthz")
+    finally:
+        server.shutdown()
+        server.server_close()
+    assert response.startswith(b"HTTP/1.1 200")
+    assert b'{"ok": true}' in response
@@ -0,0 +1,87 @@
+"""``--slug-index`` rejects a project slug another team already owns before any network work."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from pathlib import Path
+from typing import List
+
+import pytest
+from conftest import bench, submission, submission_args
+
+INDEX = submission.SlugIndex(
+    ["ai-helper", "ai-helper-2", "orphan-project", "해커톤-도우미"],
+    ["alpha-ai-helper", "beta-ai-helper-2"],
+)
+
+
+def test_romanized_hangul_matches_the_latin_spelling() -> None:
+    assert submission.romanize_hangul("해커톤 도우미!") == "haekeoton doumi!"
+    assert submission.slug_skeleton("해커톤-도우미") == submission.slug_skeleton("Haekeoton_Doumi-2")
+    assert INDEX.similar("haekeoton-doumi") == ["해커톤-도우미"]
+    assert INDEX.similar("ai_helper") == ["ai-helper", "ai-helper-2"]
+
+
+def test_collision_names_the_owning_team() -> None:
+    (error,) = INDEX.collision_errors("gamma", "ai-helper", update_existing=True)
+    assert "already used by team 'alpha'" in error
+    assert "ai-helper-gamma, ai-helper-3, ai-helper-4" in error
+
+
+def test_card_of_the_submitting_team_wins_over_suffix_matches() -> None:
+    # "beta-ai-helper-2" could be team "beta-ai-helper" with project "2"; only exact pairs count.
+    assert INDEX.collision_errors("beta", "ai-helper-2", update_existing=True) == []
+    assert INDEX.collision_errors("alpha", "ai-helper", update_existing=True) == []
+    (error,) = INDEX.collision_errors("alpha", "ai-helper", update_existing=False)
+    assert "Re-run with --update" in error
+
+
+def test_update_may_overwrite_a_document_no_card_claims() -> None:
+    assert INDEX.collision_errors("anyone", "orphan-project", update_existing=True) == []
+    assert INDEX.collision_errors("anyone", "orphan-project", update_existing=False)
+    assert INDEX.collision_errors("anyone", "new-project", update_existing=False) == []
+
+
+@pytest.fixture
+def checkout(tmp_path: Path) -> Path:
+    root = tmp_path / "checkout"
+    (root / "contents/docs/vibe-coding").mkdir(parents=True)
+    (root / "contents/team").mkdir(parents=True)
+    (root / "contents/docs/vibe-coding/index.mdx").write_text("index\n", encoding="utf-8")
+    (root / "contents/docs/vibe-coding/taken-project.mdx").write_text("doc\n", encoding="utf-8")
+    (root / "contents/team/submission-owner-team-taken-project.mdx").write_text("card\n", encoding="utf-8")
+    return root
+
+
+def render(tmp_path: Path, checkout: Path, project_name: str, *extra: str) -> subprocess.CompletedProcess:
+    args: List[str] = [
+        *submission_args(project_name),
+        "--slug-index",
+        str(checkout),
+        "--cache-dir",
+        str(tmp_path / "cache"),
+        "--render-only-dir",
+        str(tmp_path / "out"),
+        *extra,
+    ]
+    return subprocess.run(
+        [sys.executable, str(bench.SUBMISSION_SCRIPT), *args], cwd=tmp_path, capture_output=True, text=True
+    )
+
+
+def test_cli_rejects_a_taken_slug_and_sees_new_documents(tmp_path: Path, checkout: Path) -> None:
+    taken = render(tmp_path, checkout, "Taken Project", "--update")
+    assert taken.returncode == 1
+    assert "[ERROR] Project slug 'taken-project' is already used by team 'owner-team'" in taken.stderr
+    assert not (tmp_path / "out").exists()
+
+    similar = render(tmp_path, checkout, "Taken_Project 2")
+    assert similar.returncode == 0, similar.stderr
+    assert "[WARN] Similar existing project slug(s): taken-project" in similar.stderr
+
+    # The cached listing is keyed on directory mtimes, so a document added since is still seen.
+    (checkout / "contents/docs/vibe-coding/fresh-project.mdx").write_text("doc\n", encoding="utf-8")
+    fresh = render(tmp_path, checkout, "Fresh Project")
+    assert fresh.returncode == 1
+    assert "[ERROR] Result document for 'fresh-project' already exists" in fresh.stderr
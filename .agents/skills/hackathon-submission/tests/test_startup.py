@@ -0,0 +1,10 @@
+"""The render/validate path stays free of modules only the GitHub and batch paths need."""
+
+from __future__ import annotations
+
+from conftest import bench
+
+
+def test_render_path_imports_no_lazy_modules() -> None:
+    _, eager_modules = bench.bench_startup(text_kb=1, repeat=1)
+    assert eager_modules == []
@@ -0,0 +1,38 @@
+"""In-process ``submit()`` runs do not leak CLI settings into each other."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from conftest import submission
+
+
+def asset_spec(tmp_path: Path) -> submission.SubmissionSpec:
+    demo = tmp_path / "demo.png"
+    demo.write_bytes(b"x" * 1024)
+    return submission.SubmissionSpec(
+        team_name="Submit Team",
+        project_name="Submit Project",
+        repo_url="https://github.com/test/submit",
+        demo_url_or_run_method="README",
+        problem_definition="problem",
+        one_liner="one liner",
+        team_roles="- 홍길동: FE",
+        assets=(f"demo={demo}",),
+    )
+
+
+def test_asset_limits_apply_to_one_run_only(tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
+    spec = asset_spec(tmp_path)
+    store = submission.ASSET_STORE
+    limits = (store.max_file_bytes, store.max_total_bytes, store.link_duplicates)
+
+    assert submission.submit(spec, render_only_dir=str(tmp_path / "strict"), max_asset_mb=0) == 1
+    assert "per-file limit" in capsys.readouterr().err
+    assert submission.ASSET_STORE is store
+    assert (store.max_file_bytes, store.max_total_bytes, store.link_duplicates) == limits
+
+    assert submission.submit(spec, render_only_dir=str(tmp_path / "default")) == 0
+    assert (tmp_path / "default/contents/docs/vibe-coding/assets/submit-project/demo/demo.png").is_file()
+    assert store.stats == {"copied": 0, "linked": 0, "unchanged": 0, "bytes_copied": 0}
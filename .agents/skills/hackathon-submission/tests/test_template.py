@@ -0,0 +1,20 @@
+"""Compiled templates are cached by text, with a bounded cache."""
+
+from __future__ import annotations
+
+from conftest import submission
+
+
+def test_same_text_reuses_one_compiled_template() -> None:
+    text = "".join(["Hello __NAME__", "!"])  # a fresh str object with the same text
+    first = submission.compile_template("Hello __NAME__!")
+    assert submission.compile_template(text) is first
+    assert submission.compile_template(first) is first
+    assert first.render({"NAME": "world"}) == "Hello world!"
+
+
+def test_template_cache_is_bounded() -> None:
+    for index in range(500):
+        submission.compile_template(f"template {index} __NAME__")
+    info = submission._compile_template_text.cache_info()
+    assert info.currsize <= info.maxsize
@@ -0,0 +1,92 @@
+"""``--validate-tree`` checks every result document and team card already in a checkout."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+import pytest
+from conftest import bench, submission
+from test_manifest import manifest_row, write_manifest
+
+ROWS = 70  # more than one 64-file batch, so --jobs 2 uses the process pool
+
+
+def run_script(*args: str, cwd: Path) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, str(bench.SUBMISSION_SCRIPT), *args], cwd=cwd, capture_output=True, text=True
+    )
+
+
+def report_lines(stdout: str) -> Dict[str, Dict[str, object]]:
+    results = [json.loads(line) for line in stdout.splitlines()]
+    return {str(result["path"]): result for result in results}
+
+
+@pytest.fixture
+def rendered_tree(tmp_path: Path) -> Path:
+    root = tmp_path / "tree"
+    manifest = write_manifest(tmp_path / "manifest.jsonl", [manifest_row(index) for index in range(ROWS)])
+    result = run_script("--manifest", str(manifest), "--render-only-dir", str(root), cwd=tmp_path)
+    assert result.returncode == 0, result.stderr
+    # Neither is a submission file, so both are skipped.
+    (root / "contents/docs/vibe-coding/index.mdx").write_text("no frontmatter\n", encoding="utf-8")
+    (root / "contents/team/notes.txt").write_text("not a card\n", encoding="utf-8")
+    return root
+
+
+def break_files(root: Path) -> List[str]:
+    document = submission.result_document_relpath("manifest-project-3")
+    path = root / document
+    missing_header = submission.REQUIRED_SECTION_HEADERS[0]
+    path.write_text(path.read_text(encoding="utf-8").replace(missing_header, "## Renamed"), encoding="utf-8")
+
+    card = submission.team_card_relpath("team-5", "manifest-project-5")
+    path = root / card
+    content = path.read_text(encoding="utf-8")
+    path.write_text(content.replace('repositoryUrl: "https://', 'repositoryUrl: "ftp://', 1), encoding="utf-8")
+    return [document, card]
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_reports_every_file_and_fails_on_broken_ones(rendered_tree: Path, jobs: str) -> None:
+    document, card = break_files(rendered_tree)
+    result = run_script("--validate-tree", str(rendered_tree), "--jobs", jobs, cwd=rendered_tree)
+
+    assert result.returncode == 1
+    reports = report_lines(result.stdout)
+    assert len(reports) == 2 * ROWS
+    assert sorted(path for path, report in reports.items() if not report["ok"]) == sorted([document, card])
+    assert reports[document]["kind"] == "result"
+    assert reports[document]["errors"] == [f"Missing required section: {submission.REQUIRED_SECTION_HEADERS[0]}"]
+    assert reports[card]["kind"] == "team"
+    assert reports[card]["errors"] == ["Team card repositoryUrl must be a valid http(s) URL."]
+    assert f"{2 * ROWS - 2} passed, 2 failed" in result.stderr
+
+
+def test_changed_since_checks_only_changed_and_untracked_files(rendered_tree: Path) -> None:
+    for args in (["init", "-q"], ["add", "-A"], ["-c", "user.name=t", "-c", "user.email=t@x", "commit", "-qm", "base"]):
+        subprocess.run(["git", *args], cwd=rendered_tree, check=True)
+    document, card = break_files(rendered_tree)
+    untracked = rendered_tree / "contents/team/submission-new-team-new-project.mdx"
+    untracked.write_text((rendered_tree / card).read_text(encoding="utf-8"), encoding="utf-8")
+
+    result = run_script("--validate-tree", ".", "--changed-since", "HEAD", cwd=rendered_tree)
+
+    assert result.returncode == 1
+    assert sorted(report_lines(result.stdout)) == sorted([document, card, untracked.relative_to(rendered_tree).as_posix()])
+
+
+def test_clean_tree_passes(rendered_tree: Path) -> None:
+    result = run_script("--validate-tree", str(rendered_tree), cwd=rendered_tree)
+    assert result.returncode == 0, result.stderr
+    assert all(report["ok"] for report in report_lines(result.stdout).values())
+
+
+def test_missing_contents_directory_is_an_error(tmp_path: Path) -> None:
+    result = run_script("--validate-tree", str(tmp_path), cwd=tmp_path)
+    assert result.returncode == 1
+    assert "No contents/ directory" in result.stderr